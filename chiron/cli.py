@@ -437,7 +437,7 @@ def deps_scan(
         str,
         typer.Option(
             "--max-severity",
-            help="Maximum severity to allow (critical, high, medium, low)",
+            help="Lowest severity that fails the gate (critical, high, medium, low)",
         ),
     ] = "high",
 ) -> None:
@@ -811,6 +811,13 @@ def deps_reproducibility(
         Path | None,
         typer.Option("--rebuilt", help="Rebuilt wheel (for compare)"),
     ] = None,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Reuse digests for wheels unchanged since the last compute",
+        ),
+    ] = False,
 ) -> None:
     """Check binary reproducibility of wheels.
 
@@ -832,7 +839,7 @@ def deps_reproducibility(
             raise typer.Exit(1)
 
         typer.echo("🔍 Computing wheel digests...")
-        checker.save_digests(wheelhouse, digests)
+        checker.save_digests(wheelhouse, digests, incremental=incremental)
         typer.echo(f"✅ Saved digests to {digests}")
 
     elif action == "verify":
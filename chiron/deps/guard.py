@@ -143,10 +143,11 @@ def _load_optional_json(
 ) -> tuple[SourceSummary, Any | None]:
     if path is None:
         return SourceSummary(source, "missing", "path not provided", None), None
-    if not path.exists():
-        return SourceSummary(source, "missing", "file not found", str(path)), None
+    # Open directly rather than stat first; a missing file surfaces here
     try:
         data = _read_json(path)
+    except FileNotFoundError:
+        return SourceSummary(source, "missing", "file not found", str(path)), None
     except ValueError as exc:
         return SourceSummary(source, "error", str(exc), str(path)), None
     return SourceSummary(source, "ok", None, str(path)), data
@@ -159,16 +160,16 @@ def _load_contract(path: Path | None) -> tuple[SourceSummary, Mapping[str, Any]
             None,
         )
     contract_path = Path(path)
-    if not contract_path.exists():
+    try:
+        with contract_path.open("rb") as handle:
+            data = tomllib.load(handle)
+    except FileNotFoundError:
         return (
             SourceSummary(
                 SOURCE_CONTRACT, "missing", "file not found", str(contract_path)
             ),
             None,
         )
-    try:
-        with contract_path.open("rb") as handle:
-            data = tomllib.load(handle)
     except (OSError, tomllib.TOMLDecodeError) as exc:
         return (
             SourceSummary(SOURCE_CONTRACT, "error", str(exc), str(contract_path)),
@@ -1544,8 +1545,9 @@ def _determine_exit_code(highest: str, fail_threshold: str | None) -> int:
     return 0
 
 
-def main(argv: list[str] | None = None) -> int:
-    args = _parse_args(argv)
+def _run(
+    args: argparse.Namespace, *, render_markdown: bool
+) -> tuple[int, dict[str, Any], str | None]:
     configure_tracing(
         "prometheus-upgrade-guard",
         resource_attributes={"component": "scripts.upgrade_guard"},
@@ -1605,6 +1607,8 @@ def main(argv: list[str] | None = None) -> int:
             span.set_attribute("upgrade_guard.contract.risk", contract_risk)
 
             markdown = _persist_outputs(assessment, args)
+            if markdown is None and render_markdown:
+                markdown = _render_markdown(assessment)
             _persist_snapshot_run(assessment, markdown, args, data, moment)
             if args.verbose:
                 print(markdown or _render_markdown(assessment))
@@ -1612,7 +1616,8 @@ def main(argv: list[str] | None = None) -> int:
             outcome = highest
             GUARD_RUN_COUNTER.labels(outcome=outcome).inc()
             span.set_attribute("upgrade_guard.outcome", outcome)
-            return _determine_exit_code(outcome, args.fail_threshold)
+            exit_code = _determine_exit_code(outcome, args.fail_threshold)
+            return exit_code, assessment, markdown
         except Exception as exc:  # pragma: no cover - defensive guard
             span.record_exception(exc)
             span.set_attribute("upgrade_guard.outcome", "error")
@@ -1620,5 +1625,28 @@ def main(argv: list[str] | None = None) -> int:
             raise
 
 
+def assess(
+    argv: list[str] | None = None, *, render_markdown: bool = True
+) -> tuple[int, dict[str, Any], str | None]:
+    """Run the guard in-process and return its results directly.
+
+    Accepts the same arguments as :func:`main`, but callers need not pass
+    ``--output``/``--markdown`` and read the files back.
+
+    Args:
+        argv: Command-line style arguments
+        render_markdown: Render the Markdown summary even without ``--markdown``
+
+    Returns:
+        Tuple of (exit code, assessment, Markdown summary or None)
+    """
+    return _run(_parse_args(argv), render_markdown=render_markdown)
+
+
+def main(argv: list[str] | None = None) -> int:
+    exit_code, _, _ = _run(_parse_args(argv), render_markdown=False)
+    return exit_code
+
+
 if __name__ == "__main__":  # pragma: no cover - CLI
     sys.exit(main())
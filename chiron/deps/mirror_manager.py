@@ -13,7 +13,7 @@ from typing import Any
 
 DEFAULT_MIRROR_ROOT = Path("vendor") / "wheelhouse"
 ARTIFACT_SUFFIXES = (".whl", ".tar.gz", ".tgz", ".zip", ".tar", ".bin", ".pt", ".onnx")
-SIGNATURE_SUFFIXES = (".sha256", ".sig", ".asc")
+SIGNATURE_SUFFIXES = (".sha256", ".sig", ".asc", ".sigstore.json")
 
 
 def _compute_sha256(path: Path) -> str:
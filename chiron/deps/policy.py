@@ -9,6 +9,7 @@ and other governance rules for dependency management.
 from __future__ import annotations
 
 import logging
+import sys
 import tomllib
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -16,12 +17,71 @@ from pathlib import Path
 from typing import Any, Literal
 
 from packaging.specifiers import SpecifierSet
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
+
+# msgspec decodes the policy schema in C when available; tomllib is the fallback
+try:
+    import msgspec
+    import msgspec.toml
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Violation fields are drawn from a small fixed vocabulary; interning lets
+# every PolicyViolation share the same string objects.
+_SEV_ERROR = sys.intern("error")
+_SEV_WARNING = sys.intern("warning")
+_SEV_INFO = sys.intern("info")
 
-@dataclass(slots=True)
+_VT_PACKAGE_DENIED = sys.intern("package_denied")
+_VT_VERSION_DENIED = sys.intern("version_denied")
+_VT_MAJOR_VERSION_JUMP = sys.intern("major_version_jump")
+_VT_UPGRADE_CADENCE = sys.intern("upgrade_cadence")
+_VT_REVIEW_REQUIRED = sys.intern("review_required")
+
+_MSG_PACKAGE_DENIED = sys.intern("Package denied by policy")
+_MSG_VERSION_DENIED = sys.intern("Version denied by policy")
+_MSG_REVIEW_REQUIRED = sys.intern("Package requires manual review before upgrade")
+
+
+if msgspec is not None:
+
+    class _PkgSchema(msgspec.Struct):
+        """Typed allowlist entry decoded directly from TOML."""
+
+        version_ceiling: str | None = None
+        version_floor: str | None = None
+        allowed_versions: list[str] = []
+        blocked_versions: list[str] = []
+        upgrade_cadence_days: int | None = None
+        requires_review: bool = False
+        reason: str | None = None
+
+    class _DenySchema(msgspec.Struct):
+        """Typed denylist entry decoded directly from TOML."""
+
+        reason: str = _MSG_PACKAGE_DENIED
+
+    class _RootSchema(msgspec.Struct):
+        """Typed ``[dependency_policy]`` table."""
+
+        default_allowed: bool = True
+        default_upgrade_cadence_days: int | None = None
+        max_major_version_jump: int = 1
+        require_security_review: bool = True
+        allow_pre_releases: bool = False
+        python_version_requirement: str | None = None
+        allowlist: dict[str, _PkgSchema] = {}
+        denylist: dict[str, _DenySchema] = {}
+
+    class _PolicySchema(msgspec.Struct):
+        """Top-level policy document."""
+
+        dependency_policy: _RootSchema = msgspec.field(default_factory=_RootSchema)
+
+
+@dataclass(slots=True, frozen=True)
 class PackagePolicy:
     """Policy for a specific package."""
 
@@ -36,7 +96,7 @@ class PackagePolicy:
     reason: str | None = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PolicyViolation:
     """A policy violation."""
 
@@ -72,9 +132,19 @@ class DependencyPolicy:
             logger.warning(f"Policy config not found: {config_path}, using defaults")
             return cls()
 
-        with config_path.open("rb") as f:
-            data = tomllib.load(f)
+        raw = config_path.read_bytes()
 
+        if msgspec is not None:
+            try:
+                schema = msgspec.toml.decode(raw, type=_PolicySchema)
+            except msgspec.DecodeError as e:
+                # Includes ValidationError; tomllib re-parses so malformed
+                # files still raise tomllib.TOMLDecodeError
+                logger.debug(f"Typed policy decode failed ({e}), using tomllib")
+            else:
+                return cls._from_schema(schema.dependency_policy)
+
+        data = tomllib.loads(raw.decode("utf-8"))
         policy_data = data.get("dependency_policy", {})
 
         # Load default settings
@@ -108,7 +178,41 @@ class DependencyPolicy:
             policy.denylist[pkg_name] = PackagePolicy(
                 name=pkg_name,
                 allowed=False,
-                reason=pkg_data.get("reason", "Package denied by policy"),
+                reason=pkg_data.get("reason", _MSG_PACKAGE_DENIED),
+            )
+
+        return policy
+
+    @classmethod
+    def _from_schema(cls, root: _RootSchema) -> DependencyPolicy:
+        """Build a policy from a msgspec-decoded configuration."""
+        policy = cls(
+            default_allowed=root.default_allowed,
+            default_upgrade_cadence_days=root.default_upgrade_cadence_days,
+            max_major_version_jump=root.max_major_version_jump,
+            require_security_review=root.require_security_review,
+            allow_pre_releases=root.allow_pre_releases,
+            python_version_requirement=root.python_version_requirement,
+        )
+
+        for pkg_name, pkg in root.allowlist.items():
+            policy.allowlist[pkg_name] = PackagePolicy(
+                name=pkg_name,
+                allowed=True,
+                version_ceiling=pkg.version_ceiling,
+                version_floor=pkg.version_floor,
+                allowed_versions=pkg.allowed_versions,
+                blocked_versions=pkg.blocked_versions,
+                upgrade_cadence_days=pkg.upgrade_cadence_days,
+                requires_review=pkg.requires_review,
+                reason=pkg.reason,
+            )
+
+        for pkg_name, denied in root.denylist.items():
+            policy.denylist[pkg_name] = PackagePolicy(
+                name=pkg_name,
+                allowed=False,
+                reason=denied.reason,
             )
 
         return policy
@@ -161,9 +265,18 @@ class PolicyEngine:
 
         try:
             ver = Version(version)
-        except Exception as e:
+        except InvalidVersion as e:
             return False, f"Invalid version: {e}"
 
+        return self._check_version_allowed_parsed(pkg_policy, ver, version)
+
+    def _check_version_allowed_parsed(
+        self,
+        pkg_policy: PackagePolicy,
+        ver: Version,
+        version: str,
+    ) -> tuple[bool, str | None]:
+        """Apply package version rules to an already-parsed version."""
         # Check blocked versions
         if version in pkg_policy.blocked_versions:
             return False, f"Version {version} is blocked"
@@ -182,7 +295,7 @@ class PolicyEngine:
                         False,
                         f"Version exceeds ceiling: {pkg_policy.version_ceiling}",
                     )
-            except Exception:
+            except InvalidVersion:
                 pass
 
         # Check version floor
@@ -191,7 +304,7 @@ class PolicyEngine:
                 floor = Version(pkg_policy.version_floor)
                 if ver < floor:
                     return False, f"Version below floor: {pkg_policy.version_floor}"
-            except Exception:
+            except InvalidVersion:
                 pass
 
         # Check pre-release policy
@@ -209,9 +322,25 @@ class PolicyEngine:
         """
         Check if an upgrade is allowed by policy.
 
+        Args:
+            package_name: Package being upgraded
+            current_version: Currently installed version
+            target_version: Proposed version
+
         Returns:
             List of policy violations (empty if allowed)
         """
+        # Fast lane: with no package rules, a permissive default and no default
+        # cadence, only the major-jump check can fire. Any new per-package or
+        # default rule must also be excluded here.
+        if (
+            package_name not in self.policy.denylist
+            and package_name not in self.policy.allowlist
+            and self.policy.default_allowed
+            and self.policy.default_upgrade_cadence_days is None
+        ):
+            return self._major_jump_only(package_name, current_version, target_version)
+
         violations: list[PolicyViolation] = []
 
         # Check package allowed
@@ -222,50 +351,56 @@ class PolicyEngine:
                     package=package_name,
                     current_version=current_version,
                     target_version=target_version,
-                    violation_type="package_denied",
-                    message=reason or "Package denied by policy",
-                    severity="error",
+                    violation_type=_VT_PACKAGE_DENIED,
+                    message=reason or _MSG_PACKAGE_DENIED,
+                    severity=_SEV_ERROR,
                 )
             )
             return violations
 
-        # Check target version allowed
-        allowed, reason = self.check_version_allowed(package_name, target_version)
-        if not allowed:
-            violations.append(
-                PolicyViolation(
-                    package=package_name,
-                    current_version=current_version,
-                    target_version=target_version,
-                    violation_type="version_denied",
-                    message=reason or "Version denied by policy",
-                    severity="error",
-                )
-            )
-
-        # Check major version jump
+        # Parse both versions once and reuse them for every check below
+        current: Version | None
+        target: Version | None
+        target_error: InvalidVersion | None = None
         try:
-            current = Version(current_version)
             target = Version(target_version)
+        except InvalidVersion as e:
+            target, target_error = None, e
+        try:
+            current = Version(current_version)
+        except InvalidVersion:
+            current = None
 
-            if target.major > current.major:
-                major_jump = target.major - current.major
-                if major_jump > self.policy.max_major_version_jump:
-                    violations.append(
-                        PolicyViolation(
-                            package=package_name,
-                            current_version=current_version,
-                            target_version=target_version,
-                            violation_type="major_version_jump",
-                            message=f"Major version jump ({major_jump}) exceeds policy limit ({self.policy.max_major_version_jump})",
-                            severity="warning",
-                        )
+        # Check target version allowed
+        pkg_policy = self.policy.allowlist.get(package_name)
+        if pkg_policy:
+            if target is None:
+                allowed, reason = False, f"Invalid version: {target_error}"
+            else:
+                allowed, reason = self._check_version_allowed_parsed(
+                    pkg_policy, target, target_version
+                )
+            if not allowed:
+                violations.append(
+                    PolicyViolation(
+                        package=package_name,
+                        current_version=current_version,
+                        target_version=target_version,
+                        violation_type=_VT_VERSION_DENIED,
+                        message=reason or _MSG_VERSION_DENIED,
+                        severity=_SEV_ERROR,
                     )
-        except Exception:
-            pass
+                )
+
+        # Check major version jump
+        if current is not None and target is not None:
+            jump = self._major_jump_violation(
+                package_name, current_version, target_version, current, target
+            )
+            if jump is not None:
+                violations.append(jump)
 
         # Check upgrade cadence
-        pkg_policy = self.policy.allowlist.get(package_name)
         cadence = (
             pkg_policy.upgrade_cadence_days
             if pkg_policy
@@ -282,9 +417,9 @@ class PolicyEngine:
                             package=package_name,
                             current_version=current_version,
                             target_version=target_version,
-                            violation_type="upgrade_cadence",
+                            violation_type=_VT_UPGRADE_CADENCE,
                             message=f"Upgrade cadence not met: {elapsed.days}/{cadence} days",
-                            severity="warning",
+                            severity=_SEV_WARNING,
                         )
                     )
 
@@ -295,16 +430,69 @@ class PolicyEngine:
                     package=package_name,
                     current_version=current_version,
                     target_version=target_version,
-                    violation_type="review_required",
-                    message="Package requires manual review before upgrade",
-                    severity="info",
+                    violation_type=_VT_REVIEW_REQUIRED,
+                    message=_MSG_REVIEW_REQUIRED,
+                    severity=_SEV_INFO,
                 )
             )
 
         return violations
 
+    def _major_jump_only(
+        self,
+        package_name: str,
+        current_version: str,
+        target_version: str,
+    ) -> list[PolicyViolation]:
+        """Run only the major-version-jump check for an unregulated package."""
+        try:
+            current = Version(current_version)
+            target = Version(target_version)
+        except InvalidVersion:
+            return []
+
+        jump = self._major_jump_violation(
+            package_name, current_version, target_version, current, target
+        )
+        return [jump] if jump is not None else []
+
+    def _major_jump_violation(
+        self,
+        package_name: str,
+        current_version: str,
+        target_version: str,
+        current: Version,
+        target: Version,
+    ) -> PolicyViolation | None:
+        """Return a warning if the upgrade jumps too many major versions."""
+        major_jump = target.major - current.major
+        if major_jump <= 0 or major_jump <= self.policy.max_major_version_jump:
+            return None
+
+        return PolicyViolation(
+            package=package_name,
+            current_version=current_version,
+            target_version=target_version,
+            violation_type=_VT_MAJOR_VERSION_JUMP,
+            message=f"Major version jump ({major_jump}) exceeds policy limit ({self.policy.max_major_version_jump})",
+            severity=_SEV_WARNING,
+        )
+
     def record_upgrade(self, package_name: str) -> None:
-        """Record that an upgrade was performed."""
+        """Record that an upgrade was performed.
+
+        The timestamp is only read by the cadence check, so nothing is recorded
+        when no cadence applies to the package.
+        """
+        pkg_policy = self.policy.allowlist.get(package_name)
+        cadence = (
+            pkg_policy.upgrade_cadence_days
+            if pkg_policy
+            else self.policy.default_upgrade_cadence_days
+        )
+        if cadence is None:
+            return
+
         self._last_upgrade_timestamps[package_name] = datetime.now(UTC)
 
 
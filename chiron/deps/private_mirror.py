@@ -3,12 +3,16 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
+import os
+import socket
 import subprocess
 import sys
 import time
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -56,8 +60,8 @@ class DevpiMirrorManager:
             subprocess.run(
                 ["devpi-server", "--version"],
                 check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             print("devpi-server already installed")
             return True
@@ -136,13 +140,36 @@ class DevpiMirrorManager:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
             )
-            # Wait for server to start
-            time.sleep(2)
+            # Poll until the server accepts connections
+            if not self._wait_for_port():
+                print("devpi server did not become ready in time")
+                return False
             return self._check_server_health()
         except Exception as e:
             print(f"Failed to start devpi server: {e}")
             return False
 
+    def _wait_for_port(self, timeout: float = 5.0, interval: float = 0.05) -> bool:
+        """Wait until the devpi server port accepts TCP connections.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+            interval: Delay between connection attempts
+
+        Returns:
+            True if the port became reachable before the deadline
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(
+                    (self.config.host, self.config.port), timeout=0.1
+                ):
+                    return True
+            except OSError:
+                time.sleep(interval)
+        return False
+
     def _check_server_health(self) -> bool:
         """Check if devpi server is healthy.
 
@@ -150,11 +177,11 @@ class DevpiMirrorManager:
             True if server is responding
         """
         try:
-            result = subprocess.run(
+            subprocess.run(
                 ["devpi", "use", f"http://{self.config.host}:{self.config.port}"],
                 check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             return True
         except subprocess.CalledProcessError:
@@ -170,7 +197,11 @@ class DevpiMirrorManager:
 
         try:
             # Set devpi server URL
-            subprocess.run(["devpi", "use", base_url], check=True)
+            subprocess.run(
+                ["devpi", "use", base_url],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
 
             # Login
             subprocess.run(
@@ -237,23 +268,90 @@ class DevpiMirrorManager:
             return False
 
         print(f"Uploading {len(wheels)} wheels to devpi...")
+        if self._upload_batch(wheelhouse_dir, wheels):
+            return True
+
+        print("Batch upload failed, falling back to per-wheel uploads...")
+        errors: dict[str, str | None] = {}
+        max_workers = min(8, os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            future_map = {
+                pool.submit(self._upload_single, wheel): wheel for wheel in wheels
+            }
+            for fut in concurrent.futures.as_completed(future_map):
+                errors[future_map[fut].name] = fut.result()
+
+        for name in sorted(errors):
+            error = errors[name]
+            if error is None:
+                print(f"  ✓ {name}")
+            else:
+                print(f"  ✗ {name}: {error}")
+                # Continue with other wheels
+
+        return True
+
+    def _upload_single(self, wheel: Path) -> str | None:
+        """Upload a single wheel to the current devpi index.
+
+        Args:
+            wheel: Wheel file to upload
+
+        Returns:
+            None on success, otherwise the failure message
+        """
+        try:
+            subprocess.run(
+                [
+                    "devpi",
+                    "upload",
+                    "--from-dir",
+                    str(wheel.parent),
+                    str(wheel.name),
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except subprocess.CalledProcessError as e:
+            return str(e)
+        return None
+
+    def _upload_batch(self, wheelhouse_dir: Path, wheels: list[Path]) -> bool:
+        """Upload all wheels with a single ``devpi upload --from-dir`` call.
+
+        Args:
+            wheelhouse_dir: Directory containing wheels
+            wheels: Wheels to upload
+
+        Returns:
+            True if the batch command succeeded
+        """
+        try:
+            result = subprocess.run(
+                ["devpi", "upload", "--from-dir", str(wheelhouse_dir)]
+                + [wheel.name for wheel in wheels],
+                check=False,
+                capture_output=True,
+                text=True,
+            )
+        except FileNotFoundError:
+            return False
+
+        if result.returncode != 0:
+            return False
+
+        # devpi reports each uploaded file as "file_upload of <name> to <url>"
+        reported = {
+            line.split(" of ", 1)[1].split()[0]
+            for line in (result.stdout or "").splitlines()
+            if line.startswith("file_upload of ")
+        }
         for wheel in wheels:
-            try:
-                subprocess.run(
-                    [
-                        "devpi",
-                        "upload",
-                        "--from-dir",
-                        str(wheel.parent),
-                        str(wheel.name),
-                    ],
-                    check=True,
-                    capture_output=True,
-                )
+            if not reported or wheel.name in reported:
                 print(f"  ✓ {wheel.name}")
-            except subprocess.CalledProcessError as e:
-                print(f"  ✗ {wheel.name}: {e}")
-                # Continue with other wheels
+            else:
+                print(f"  ✗ {wheel.name}: not reported by devpi upload")
 
         return True
 
@@ -288,11 +386,10 @@ class DevpiMirrorManager:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         config = self.get_client_config()
-        content = "[global]\n"
-        for key, value in config.items():
-            content += f"{key} = {value}\n"
+        lines = ["[global]"]
+        lines.extend(f"{key} = {value}" for key, value in config.items())
 
-        output_path.write_text(content)
+        output_path.write_text("\n".join(lines) + "\n")
         print(f"Generated pip configuration: {output_path}")
         return output_path
 
@@ -328,11 +425,11 @@ class SimpleHTTPMirror:
 
         try:
             import http.server
-            import os
 
-            os.chdir(wheelhouse_dir)
-            handler = http.server.SimpleHTTPRequestHandler
-            httpd = http.server.HTTPServer(
+            handler = partial(
+                http.server.SimpleHTTPRequestHandler, directory=str(wheelhouse_dir)
+            )
+            httpd = http.server.ThreadingHTTPServer(
                 (self.config.host, self.config.port), handler
             )
             httpd.serve_forever()
@@ -7,14 +7,137 @@ by comparing digests and analyzing differences.
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
 import hashlib
+import io
 import json
+import mmap
+import os
+import re
 import subprocess
-import tempfile
+import sys
 import zipfile
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Literal
+
+# BLAKE3 is used for internal equality checks when available; it is not a
+# replacement for the SHA-256 values recorded in WheelDigest
+try:
+    import blake3
+
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+# ZIP members are decompressed and digested in bounded pieces
+_ENTRY_CHUNK_SIZE = 64 * 1024
+# METADATA headers surfaced on WheelDigest.metadata
+_METADATA_KEYS = ("Name", "Version", "Build")
+
+
+def _content_hasher() -> Any:
+    """Return a fresh hasher for internal content-equality checks.
+
+    These digests are never persisted, so the fastest available hash is used:
+    BLAKE3 when installed, otherwise SHA-256.
+    """
+    if HAS_BLAKE3:
+        return blake3.blake3()
+    return hashlib.sha256()
+
+
+def _hash_zip_entry(zf: zipfile.ZipFile, name: str) -> bytes:
+    """Digest a ZIP member by streaming its decompressed content.
+
+    Args:
+        zf: Open ZIP archive
+        name: Member name
+
+    Returns:
+        Raw digest bytes of the member content
+    """
+    hasher = _content_hasher()
+    with zf.open(name) as member:
+        while chunk := member.read(_ENTRY_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+def _merge_entries(
+    infos1: list[zipfile.ZipInfo],
+    infos2: list[zipfile.ZipInfo],
+    only_in_1: list[str],
+    only_in_2: list[str],
+) -> Iterator[tuple[zipfile.ZipInfo, zipfile.ZipInfo]]:
+    """Walk two archive listings in sorted order in a single pass.
+
+    Names present on one side only are appended to ``only_in_1`` or
+    ``only_in_2``; entries present in both are yielded as pairs, so the
+    common set is never materialized.
+
+    Args:
+        infos1: Entries of the first archive
+        infos2: Entries of the second archive
+        only_in_1: Collects names found only in the first archive
+        only_in_2: Collects names found only in the second archive
+
+    Yields:
+        ``(info1, info2)`` pairs for names present in both archives
+    """
+    sorted1 = sorted(infos1, key=lambda info: info.filename)
+    sorted2 = sorted(infos2, key=lambda info: info.filename)
+    i = j = 0
+    while i < len(sorted1) and j < len(sorted2):
+        name1 = sorted1[i].filename
+        name2 = sorted2[j].filename
+        if name1 < name2:
+            only_in_1.append(name1)
+            i += 1
+        elif name1 > name2:
+            only_in_2.append(name2)
+            j += 1
+        else:
+            yield sorted1[i], sorted2[j]
+            i += 1
+            j += 1
+    only_in_1.extend(info.filename for info in sorted1[i:])
+    only_in_2.extend(info.filename for info in sorted2[j:])
+
+
+def _files_identical(path1: Path, path2: Path) -> bool:
+    """Check whether two files are byte-for-byte identical.
+
+    Sizes are compared first; equal-sized files are mapped and compared with
+    a single ``memcmp`` over the two buffers.
+
+    Args:
+        path1: First file
+        path2: Second file
+
+    Returns:
+        True if both files have identical content
+    """
+    try:
+        if path1.samefile(path2):
+            return True
+        with open(path1, "rb") as f1, open(path2, "rb") as f2:
+            size = os.fstat(f1.fileno()).st_size
+            if size != os.fstat(f2.fileno()).st_size:
+                return False
+            if size == 0:
+                return True
+            with (
+                mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as m1,
+                mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as m2,
+                memoryview(m1) as view1,
+                memoryview(m2) as view2,
+            ):
+                return view1 == view2
+    except OSError:
+        return False
 
 
 @dataclass
@@ -25,6 +148,7 @@ class WheelDigest:
     sha256: str
     size: int
     metadata: dict[str, Any] = field(default_factory=dict)
+    algorithm: str = "sha256"
 
 
 @dataclass
@@ -51,69 +175,194 @@ class ReproducibilityChecker:
         "*.dist-info/WHEEL",  # May contain timestamps
         "*.dist-info/METADATA",  # May contain timestamps
     ]
+    # Normalized comparison drops only RECORD files, which list the hashes of
+    # the other entries; METADATA, WHEEL and bytecode must still match exactly
+    _RECORD_RE = re.compile(r"(?:.*/)?(?:[^/]*-)?RECORD\Z")
 
-    def __init__(self, normalize: bool = True):
+    def __init__(
+        self,
+        normalize: bool = True,
+        hash_algo: Literal["sha256", "blake3"] = "sha256",
+    ):
         """Initialize reproducibility checker.
 
         Args:
             normalize: Whether to normalize timestamps and other non-deterministic content
+            hash_algo: Digest algorithm for wheel files; ``blake3`` hashes large
+                wheels on all cores via a multithreaded mmap tree hash
         """
+        if hash_algo not in ("sha256", "blake3"):
+            raise ValueError(f"Unsupported hash algorithm: {hash_algo}")
+        if hash_algo == "blake3" and not HAS_BLAKE3:
+            raise RuntimeError(
+                "blake3 is required for hash_algo='blake3' but is not installed"
+            )
         self.normalize = normalize
+        self.hash_algo = hash_algo
 
-    def compute_wheel_digest(self, wheel_path: Path) -> WheelDigest:
+    def compute_wheel_digest(
+        self,
+        wheel_path: Path,
+        zf: zipfile.ZipFile | None = None,
+    ) -> WheelDigest:
         """Compute digest for a wheel file.
 
         Args:
             wheel_path: Path to wheel file
+            zf: Already-open archive for the wheel, reused for metadata
 
         Returns:
             Wheel digest information
         """
-        sha256_hash = hashlib.sha256()
+        return self._scan_wheel(wheel_path, zf)
 
-        with open(wheel_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256_hash.update(chunk)
+    def _scan_wheel(
+        self,
+        wheel_path: Path,
+        zf: zipfile.ZipFile | None = None,
+    ) -> WheelDigest:
+        """Hash a wheel and read its metadata through one open file.
 
-        # Extract metadata
-        metadata = self._extract_wheel_metadata(wheel_path)
+        Args:
+            wheel_path: Path to wheel file
+            zf: Already-open archive for the wheel, reused for metadata
+
+        Returns:
+            Wheel digest information
+        """
+        with open(wheel_path, "rb") as f:
+            # fstat on the open descriptor avoids a second path lookup
+            size = os.fstat(f.fileno()).st_size
+            if self.hash_algo == "blake3":
+                file_hash = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                if size:
+                    file_hash.update_mmap(wheel_path)
+            else:
+                # file_digest runs the read/update loop in C without the GIL
+                file_hash = hashlib.file_digest(f, hashlib.sha256)
+
+            # Reuse the same descriptor (and its warm page cache) for metadata
+            metadata = self._extract_wheel_metadata(wheel_path, zf, f)
 
         return WheelDigest(
             filename=wheel_path.name,
-            sha256=sha256_hash.hexdigest(),
-            size=wheel_path.stat().st_size,
+            sha256=file_hash.hexdigest(),
+            size=size,
             metadata=metadata,
+            algorithm=self.hash_algo,
         )
 
-    def _extract_wheel_metadata(self, wheel_path: Path) -> dict[str, Any]:
+    def compute_wheel_digests_batch(self, wheels: list[Path]) -> list[WheelDigest]:
+        """Compute digests for many wheels concurrently.
+
+        OpenSSL releases the GIL while hashing, so independent wheels are
+        hashed in parallel on a small thread pool.
+
+        Args:
+            wheels: Wheel files to hash
+
+        Returns:
+            Wheel digests in the same order as ``wheels``
+        """
+        if len(wheels) <= 1:
+            return [self.compute_wheel_digest(wheel) for wheel in wheels]
+
+        # Hashing is I/O plus GIL-free C work, so oversubscribe the cores
+        max_workers = min(32, (os.cpu_count() or 1) * 2, len(wheels))
+        results: list[WheelDigest | None] = [None] * len(wheels)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            future_map = {
+                pool.submit(self.compute_wheel_digest, wheel): index
+                for index, wheel in enumerate(wheels)
+            }
+            for fut in concurrent.futures.as_completed(future_map):
+                results[future_map[fut]] = fut.result()
+
+        return [digest for digest in results if digest is not None]
+
+    def _extract_wheel_metadata(
+        self,
+        wheel_path: Path,
+        zf: zipfile.ZipFile | None = None,
+        fileobj: BinaryIO | None = None,
+    ) -> dict[str, Any]:
         """Extract metadata from wheel.
 
         Args:
             wheel_path: Path to wheel file
+            zf: Already-open archive for the wheel, if available
+            fileobj: Already-open binary handle to read the archive from
 
         Returns:
             Dictionary with metadata
         """
-        metadata = {}
-
         try:
-            with zipfile.ZipFile(wheel_path, "r") as zf:
-                # Find METADATA file
-                for name in zf.namelist():
-                    if name.endswith("/METADATA"):
-                        content = zf.read(name).decode("utf-8", errors="ignore")
-                        # Parse basic metadata
-                        for line in content.split("\n"):
-                            if ": " in line:
-                                key, value = line.split(": ", 1)
-                                if key in ["Name", "Version", "Build"]:
-                                    metadata[key.lower()] = value
-                        break
+            if zf is None:
+                with zipfile.ZipFile(fileobj or wheel_path, "r") as owned:
+                    return self._read_metadata(owned)
+            return self._read_metadata(zf)
         except Exception as e:
             print(f"Warning: Could not extract metadata from {wheel_path}: {e}")
+            return {}
+
+    def _read_metadata(self, zf: zipfile.ZipFile) -> dict[str, Any]:
+        """Read basic METADATA fields from an open wheel archive.
+
+        Args:
+            zf: Open wheel archive
+
+        Returns:
+            Dictionary with metadata
+        """
+        metadata: dict[str, Any] = {}
+
+        name = self._metadata_member(zf)
+        if name is None:
+            return metadata
+
+        # Name/Version/Build live in the header block, which ends at the first
+        # blank line; the long description after it is never read.
+        with zf.open(name) as raw:
+            lines = io.TextIOWrapper(raw, encoding="utf-8", errors="ignore")
+            for line in lines:
+                line = line.rstrip("\r\n")
+                if not line:
+                    break
+                if ": " in line:
+                    key, value = line.split(": ", 1)
+                    if key in _METADATA_KEYS:
+                        metadata[key.lower()] = value
+                        if len(metadata) == len(_METADATA_KEYS):
+                            break
 
         return metadata
 
+    def _metadata_member(self, zf: zipfile.ZipFile) -> str | None:
+        """Locate the METADATA member of a wheel archive.
+
+        PEP 427 places it at ``{distribution}-{version}.dist-info/METADATA``,
+        derived from the wheel filename; other archives fall back to a scan.
+
+        Args:
+            zf: Open wheel archive
+
+        Returns:
+            Member name, or None if the archive has no METADATA
+        """
+        if zf.filename:
+            parts = Path(zf.filename).name.split("-")
+            if len(parts) >= 5:
+                expected = f"{parts[0]}-{parts[1]}.dist-info/METADATA"
+                try:
+                    return zf.getinfo(expected).filename
+                except KeyError:
+                    pass
+
+        for name in zf.namelist():
+            if name.endswith("/METADATA"):
+                return name
+        return None
+
     def compare_wheels(
         self,
         original_wheel: Path,
@@ -128,25 +377,50 @@ class ReproducibilityChecker:
         Returns:
             Reproducibility report
         """
-        orig_digest = self.compute_wheel_digest(original_wheel)
-        rebuilt_digest = self.compute_wheel_digest(rebuilt_wheel)
-
-        # Basic comparison
-        is_reproducible = orig_digest.sha256 == rebuilt_digest.sha256
-        size_match = orig_digest.size == rebuilt_digest.size
-
-        differences = []
-
-        # If not reproducible, analyze differences
-        if not is_reproducible:
-            differences = self._analyze_differences(original_wheel, rebuilt_wheel)
+        # Byte-identical files need neither ZIP parsing nor a second hash
+        if _files_identical(original_wheel, rebuilt_wheel):
+            digest = self.compute_wheel_digest(original_wheel)
+            return ReproducibilityReport(
+                wheel_name=original_wheel.name,
+                is_reproducible=True,
+                original_digest=digest.sha256,
+                rebuilt_digest=digest.sha256,
+                size_match=True,
+                normalized_match=True,
+            )
 
-            # Try normalized comparison if enabled
-            normalized_match = False
-            if self.normalize:
-                normalized_match = self._compare_normalized(
-                    original_wheel, rebuilt_wheel
-                )
+        # Open each archive once; its parsed central directory is shared by
+        # the metadata, difference and normalized passes below.
+        with contextlib.ExitStack() as stack:
+            zf1: zipfile.ZipFile | None = None
+            zf2: zipfile.ZipFile | None = None
+            open_error: Exception | None = None
+            try:
+                zf1 = stack.enter_context(zipfile.ZipFile(original_wheel, "r"))
+                zf2 = stack.enter_context(zipfile.ZipFile(rebuilt_wheel, "r"))
+            except (OSError, zipfile.BadZipFile) as e:
+                open_error = e
+
+            orig_digest = self.compute_wheel_digest(original_wheel, zf1)
+            rebuilt_digest = self.compute_wheel_digest(rebuilt_wheel, zf2)
+
+            # Basic comparison
+            is_reproducible = orig_digest.sha256 == rebuilt_digest.sha256
+            size_match = orig_digest.size == rebuilt_digest.size
+
+            differences = []
+
+            # If not reproducible, analyze differences
+            if not is_reproducible:
+                normalized_match = False
+                if zf1 is None or zf2 is None:
+                    differences = [f"Error analyzing: {open_error}"]
+                else:
+                    differences = self._analyze_differences(zf1, zf2)
+
+                    # Try normalized comparison if enabled
+                    if self.normalize:
+                        normalized_match = self._compare_normalized(zf1, zf2)
 
         return ReproducibilityReport(
             wheel_name=original_wheel.name,
@@ -160,14 +434,14 @@ class ReproducibilityChecker:
 
     def _analyze_differences(
         self,
-        wheel1: Path,
-        wheel2: Path,
+        zf1: zipfile.ZipFile,
+        zf2: zipfile.ZipFile,
     ) -> list[str]:
         """Analyze differences between two wheels.
 
         Args:
-            wheel1: First wheel
-            wheel2: Second wheel
+            zf1: Open archive of the first wheel
+            zf2: Open archive of the second wheel
 
         Returns:
             List of difference descriptions
@@ -175,41 +449,32 @@ class ReproducibilityChecker:
         differences = []
 
         try:
-            with zipfile.ZipFile(wheel1, "r") as zf1, zipfile.ZipFile(
-                wheel2, "r"
-            ) as zf2:
-                files1 = set(zf1.namelist())
-                files2 = set(zf2.namelist())
-
-                # Check for missing files
-                only_in_1 = files1 - files2
-                only_in_2 = files2 - files1
-
-                if only_in_1:
-                    differences.append(
-                        f"Files only in original: {', '.join(sorted(only_in_1)[:5])}"
-                    )
-
-                if only_in_2:
-                    differences.append(
-                        f"Files only in rebuilt: {', '.join(sorted(only_in_2)[:5])}"
-                    )
-
-                # Check common files
-                common_files = files1 & files2
-                different_files = []
-
-                for filename in common_files:
-                    content1 = zf1.read(filename)
-                    content2 = zf2.read(filename)
-
-                    if content1 != content2:
-                        different_files.append(filename)
-
-                if different_files:
-                    differences.append(
-                        f"Different content: {', '.join(sorted(different_files)[:5])}"
-                    )
+            only_in_1: list[str] = []
+            only_in_2: list[str] = []
+            different_files: list[str] = []
+
+            # Check common files via the central directory's CRC-32 and size,
+            # which describe the uncompressed content without decompressing it
+            for info1, info2 in _merge_entries(
+                zf1.infolist(), zf2.infolist(), only_in_1, only_in_2
+            ):
+                if (info1.CRC, info1.file_size) != (info2.CRC, info2.file_size):
+                    different_files.append(info1.filename)
+
+            # The merge yields names in sorted order, so the first five are
+            # already the smallest
+            if only_in_1:
+                differences.append(
+                    f"Files only in original: {', '.join(only_in_1[:5])}"
+                )
+
+            if only_in_2:
+                differences.append(f"Files only in rebuilt: {', '.join(only_in_2[:5])}")
+
+            if different_files:
+                differences.append(
+                    f"Different content: {', '.join(different_files[:5])}"
+                )
 
         except Exception as e:
             differences.append(f"Error analyzing: {e}")
@@ -218,97 +483,49 @@ class ReproducibilityChecker:
 
     def _compare_normalized(
         self,
-        wheel1: Path,
-        wheel2: Path,
+        zf1: zipfile.ZipFile,
+        zf2: zipfile.ZipFile,
     ) -> bool:
         """Compare wheels after normalizing non-deterministic content.
 
         Args:
-            wheel1: First wheel
-            wheel2: Second wheel
+            zf1: Open archive of the first wheel
+            zf2: Open archive of the second wheel
 
         Returns:
             True if wheels match after normalization
         """
         try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir_path = Path(tmpdir)
-
-                # Extract both wheels
-                extract1 = tmpdir_path / "wheel1"
-                extract2 = tmpdir_path / "wheel2"
-
-                with zipfile.ZipFile(wheel1, "r") as zf:
-                    zf.extractall(extract1)
-
-                with zipfile.ZipFile(wheel2, "r") as zf:
-                    zf.extractall(extract2)
-
-                # Normalize timestamps
-                self._normalize_directory(extract1)
-                self._normalize_directory(extract2)
+            entries1 = {name for name in zf1.namelist() if not self._is_record(name)}
+            entries2 = {name for name in zf2.namelist() if not self._is_record(name)}
+            if entries1 != entries2:
+                return False
 
-                # Remove RECORD files (they contain hashes)
-                for record_file in extract1.rglob("RECORD"):
-                    record_file.unlink(missing_ok=True)
-                for record_file in extract2.rglob("RECORD"):
-                    record_file.unlink(missing_ok=True)
+            # Compare decompressed content only; headers carry the timestamps
+            for name in entries1:
+                if name.endswith("/"):
+                    continue
+                if zf1.getinfo(name).file_size != zf2.getinfo(name).file_size:
+                    return False
+                if _hash_zip_entry(zf1, name) != _hash_zip_entry(zf2, name):
+                    return False
 
-                # Compare directory trees
-                return self._compare_directories(extract1, extract2)
+            return True
 
         except Exception as e:
             print(f"Warning: Normalized comparison failed: {e}")
             return False
 
-    def _normalize_directory(self, directory: Path) -> None:
-        """Normalize timestamps and other non-deterministic content.
-
-        Args:
-            directory: Directory to normalize
-        """
-        # Set all mtimes to epoch
-        import os
-        import time
-
-        epoch = 0
-
-        for root, dirs, files in os.walk(directory):
-            root_path = Path(root)
-            for name in files:
-                file_path = root_path / name
-                os.utime(file_path, (epoch, epoch))
-
-    def _compare_directories(self, dir1: Path, dir2: Path) -> bool:
-        """Compare two directories recursively.
+    def _is_record(self, name: str) -> bool:
+        """Check whether an archive entry is excluded from normalized comparison.
 
         Args:
-            dir1: First directory
-            dir2: Second directory
+            name: Archive member name
 
         Returns:
-            True if directories are identical
+            True if the entry is a ``RECORD`` or ``*-RECORD`` file
         """
-        # Get all files
-        files1 = {f.relative_to(dir1) for f in dir1.rglob("*") if f.is_file()}
-        files2 = {f.relative_to(dir2) for f in dir2.rglob("*") if f.is_file()}
-
-        if files1 != files2:
-            return False
-
-        # Compare file contents
-        for rel_path in files1:
-            file1 = dir1 / rel_path
-            file2 = dir2 / rel_path
-
-            # Skip RECORD files
-            if rel_path.name == "RECORD":
-                continue
-
-            if file1.read_bytes() != file2.read_bytes():
-                return False
-
-        return True
+        return self._RECORD_RE.match(name) is not None
 
     def verify_wheelhouse(
         self,
@@ -334,8 +551,9 @@ class ReproducibilityChecker:
             # TODO: Implement rebuild logic
             print("Note: Rebuild not yet implemented, computing digests only")
 
-        for wheel in wheels:
-            digest = self.compute_wheel_digest(wheel)
+        for wheel, digest in zip(
+            wheels, self.compute_wheel_digests_batch(wheels), strict=True
+        ):
             print(f"  {wheel.name}: {digest.sha256[:12]}...")
 
             # Store digest for future comparison
@@ -353,25 +571,63 @@ class ReproducibilityChecker:
         self,
         wheelhouse_dir: Path,
         output_file: Path,
+        incremental: bool = False,
     ) -> None:
         """Save wheel digests to file for future verification.
 
         Args:
             wheelhouse_dir: Directory containing wheels
             output_file: Path to output JSON file
+            incremental: Reuse digests from an existing ``output_file`` for
+                wheels whose ``(mtime_ns, size)`` is unchanged
         """
+        previous: dict[str, Any] = {}
+        if incremental and output_file.is_file():
+            try:
+                previous = json.loads(output_file.read_text())
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Warning: Ignoring unreadable digests file {output_file}: {e}")
+
         digests = {}
+        to_hash: list[Path] = []
+        stats: dict[str, list[int]] = {}
 
         for wheel in wheelhouse_dir.glob("*.whl"):
-            digest = self.compute_wheel_digest(wheel)
+            st = os.stat(wheel)
+            stats[wheel.name] = [st.st_mtime_ns, st.st_size]
+
+            cached = previous.get(wheel.name)
+            if (
+                cached is not None
+                and cached.get("stat") == stats[wheel.name]
+                and cached.get("algorithm", "sha256") == self.hash_algo
+            ):
+                digests[wheel.name] = cached
+            else:
+                to_hash.append(wheel)
+
+        for wheel, digest in zip(
+            to_hash, self.compute_wheel_digests_batch(to_hash), strict=True
+        ):
             digests[wheel.name] = {
                 "sha256": digest.sha256,
+                "algorithm": digest.algorithm,
                 "size": digest.size,
                 "metadata": digest.metadata,
+                "stat": stats[wheel.name],
             }
 
-        output_file.write_text(json.dumps(digests, indent=2))
-        print(f"Saved {len(digests)} wheel digests to {output_file}")
+        # Serialize straight into the buffered handle; no intermediate string
+        with output_file.open("w", encoding="utf-8") as f:
+            json.dump(digests, f, indent=2)
+        reused = len(digests) - len(to_hash)
+        if incremental:
+            print(
+                f"Saved {len(digests)} wheel digests to {output_file} "
+                f"({reused} unchanged, {len(to_hash)} hashed)"
+            )
+        else:
+            print(f"Saved {len(digests)} wheel digests to {output_file}")
 
     def verify_against_digests(
         self,
@@ -390,13 +646,24 @@ class ReproducibilityChecker:
         saved_digests = json.loads(digests_file.read_text())
         reports = {}
 
+        wheels: list[Path] = []
         for wheel in wheelhouse_dir.glob("*.whl"):
-            current_digest = self.compute_wheel_digest(wheel)
-
             if wheel.name not in saved_digests:
                 print(f"  ⚠ {wheel.name}: Not in saved digests")
                 continue
+            # Digests recorded before the field existed are SHA-256
+            algorithm = saved_digests[wheel.name].get("algorithm", "sha256")
+            if algorithm != self.hash_algo:
+                print(
+                    f"  ⚠ {wheel.name}: Saved digest uses {algorithm}, "
+                    f"checker uses {self.hash_algo}"
+                )
+                continue
+            wheels.append(wheel)
 
+        # Only wheels with a saved digest are hashed
+        current_digests = self.compute_wheel_digests_batch(wheels)
+        for wheel, current_digest in zip(wheels, current_digests, strict=True):
             saved = saved_digests[wheel.name]
             is_match = current_digest.sha256 == saved["sha256"]
 
@@ -433,6 +700,17 @@ if __name__ == "__main__":
         default=Path("wheel-digests.json"),
         help="Output file for digests",
     )
+    compute_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse digests for wheels unchanged since the last run",
+    )
+    compute_parser.add_argument(
+        "--hash-algo",
+        choices=["sha256", "blake3"],
+        default="sha256",
+        help="Digest algorithm for wheel files",
+    )
 
     # Verify against digests
     verify_parser = subparsers.add_parser(
@@ -445,6 +723,12 @@ if __name__ == "__main__":
         default=Path("wheel-digests.json"),
         help="Digests file",
     )
+    verify_parser.add_argument(
+        "--hash-algo",
+        choices=["sha256", "blake3"],
+        default="sha256",
+        help="Digest algorithm the digests file was recorded with",
+    )
 
     # Compare two wheels
     compare_parser = subparsers.add_parser("compare", help="Compare two wheels")
@@ -459,10 +743,13 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    checker = ReproducibilityChecker(normalize=getattr(args, "normalize", True))
+    checker = ReproducibilityChecker(
+        normalize=getattr(args, "normalize", True),
+        hash_algo=getattr(args, "hash_algo", "sha256"),
+    )
 
     if args.command == "compute":
-        checker.save_digests(args.wheelhouse, args.output)
+        checker.save_digests(args.wheelhouse, args.output, incremental=args.incremental)
 
     elif args.command == "verify":
         reports = checker.verify_against_digests(args.wheelhouse, args.digests)
@@ -12,16 +12,221 @@ This module provides automatic upgrade execution with comprehensive safety check
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import mmap
+import os
+import re
+import selectors
+import shutil
 import subprocess
+import time
+import tomllib
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Only the end of Poetry's stderr is kept for error reporting.
+_STDERR_TAIL_BYTES = 64 * 1024
+
+# Linux FICLONE ioctl: share extents copy-on-write (btrfs, XFS, overlayfs).
+_FICLONE = 0x40049409
+
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+
+def _canonical_name(name: str) -> str:
+    """Normalize a distribution name the way poetry.lock records it (PEP 503)."""
+    return _NAME_SEPARATORS.sub("-", name).lower()
+
+
+def _packages_in_output(output: str, packages: list[str]) -> set[str]:
+    """Return the packages named in Poetry error output (all if none are)."""
+    text = _NAME_SEPARATORS.sub("-", output.lower())
+    named: set[str] = set()
+    for package in packages:
+        name = re.escape(_canonical_name(package))
+        if re.search(rf"(?<![\w-]){name}(?![\w-])", text):
+            named.add(package)
+    return named or set(packages)
+
+
+def _snapshot_file(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst``, sharing extents copy-on-write when supported.
+
+    Hardlinks are deliberately not used: Poetry rewrites poetry.lock in place,
+    which would silently change a linked backup as well.
+    """
+    if fcntl is not None:
+        try:
+            with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+def _restore_file(src: Path, dst: Path) -> None:
+    """Atomically and durably replace ``dst`` with a copy of ``src``.
+
+    The copy is written next to ``dst``, flushed to disk and renamed over it,
+    so a crash leaves either the old or the restored file, never a truncated
+    one. The parent directory is fsynced so the rename itself survives.
+    """
+    tmp = dst.with_name(f"{dst.name}.tmp")
+    try:
+        _snapshot_file(src, tmp)
+        fd = os.open(tmp, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    if hasattr(os, "O_DIRECTORY"):  # directories cannot be opened on Windows
+        dir_fd = os.open(dst.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _run_captured_tail(
+    cmd: list[str],
+    *,
+    cwd: Path,
+    timeout: float,
+    env: dict[str, str] | None = None,
+    tail: int = _STDERR_TAIL_BYTES,
+) -> tuple[int, bytes]:
+    """Run ``cmd`` discarding stdout and keeping only the tail of stderr.
+
+    Args:
+        cmd: Command to execute
+        cwd: Working directory
+        timeout: Seconds before the process is killed
+        env: Environment for the process (default: inherit)
+        tail: Maximum number of stderr bytes retained
+
+    Returns:
+        Tuple of (return code, stderr tail)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish in time
+    """
+    if os.name == "nt":  # pragma: no cover - selectors cannot poll pipes on Windows
+        result = subprocess.run(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=False,
+            timeout=timeout,
+        )
+        return result.returncode, result.stderr[-tail:]
+
+    deadline = time.monotonic() + timeout
+    buffer = bytearray()
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    ) as proc:
+        if proc.stderr is None:
+            raise RuntimeError("stderr pipe was not opened")
+        fd = proc.stderr.fileno()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    proc.kill()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                chunk = os.read(fd, _STDERR_TAIL_BYTES)
+                if not chunk:
+                    break
+                buffer += chunk
+                if len(buffer) > tail:
+                    del buffer[:-tail]
+        try:
+            returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+
+    return returncode, bytes(buffer)
+
+
+def _hash_lock_file(path: Path) -> bytes:
+    """Return a short BLAKE2b digest of a lock file's contents.
+
+    The file is hashed straight from the page cache through ``mmap`` rather
+    than copied into a bytes object first.
+    """
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:  # empty files cannot be mapped
+            return hashlib.blake2b(b"", digest_size=16).digest()
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.blake2b(mapped, digest_size=16).digest()
+
+
+@dataclass(slots=True)
+class LazyBackup:
+    """Lock file snapshot that is only copied to disk when it is needed.
+
+    Checkpoints record the lock file's digest and mtime; the bytes are copied
+    to ``target`` just before the lock is mutated or when a rollback needs
+    them, so checkpoints that are never restored cost a stat and a hash.
+    """
+
+    source: Path
+    target: Path
+    lock_hash: bytes
+    mtime_ns: int
+    realized_path: Path | None = None
+
+    def is_current(self) -> bool:
+        """Whether ``source`` still holds the snapshotted content."""
+        try:
+            if self.source.stat().st_mtime_ns != self.mtime_ns:
+                return False
+            return _hash_lock_file(self.source) == self.lock_hash
+        except OSError:
+            return False
+
+    def materialize(self) -> Path | None:
+        """Copy the snapshot to ``target`` if not done yet.
+
+        Returns:
+            Path of the backup, or None if the source has already diverged
+        """
+        if self.realized_path is not None:
+            return self.realized_path
+        if not self.is_current():
+            return None
+        _snapshot_file(self.source, self.target)
+        self.realized_path = self.target
+        logger.debug(f"Created checkpoint backup: {self.target}")
+        return self.target
+
 
 @dataclass(slots=True)
 class UpgradeCheckpoint:
@@ -29,17 +234,19 @@ class UpgradeCheckpoint:
 
     timestamp: datetime
     packages_upgraded: list[str]
-    lock_file_backup: Path | None
+    lock_file_backup: LazyBackup | None
     success: bool
 
     def to_dict(self) -> dict[str, Any]:
+        backup = self.lock_file_backup
         return {
             "timestamp": self.timestamp.isoformat(),
             "packages_upgraded": list(self.packages_upgraded),
             "lock_file_backup": (
-                str(self.lock_file_backup) if self.lock_file_backup else None
+                str(backup.realized_path) if backup and backup.realized_path else None
             ),
             "success": self.success,
+            "lock_file_sha": backup.lock_hash.hex() if backup else None,
         }
 
 
@@ -103,6 +310,7 @@ class SafeUpgradeExecutor:
         backup_dir: Path | None = None,
         max_batch_size: int = 5,
         enable_health_checks: bool = True,
+        max_backups: int = 32,
     ):
         """
         Initialize safe upgrade executor.
@@ -112,11 +320,29 @@ class SafeUpgradeExecutor:
             backup_dir: Directory for backups (default: project_root/var/upgrade-backups)
             max_batch_size: Maximum packages to upgrade in one batch
             enable_health_checks: Run health checks after each upgrade
+            max_backups: Lock file backups kept in backup_dir; the oldest
+                ones beyond this are deleted (backups of this run are kept)
         """
         self.project_root = project_root
         self.backup_dir = backup_dir or (project_root / "var" / "upgrade-backups")
         self.max_batch_size = max_batch_size
         self.enable_health_checks = enable_health_checks
+        # Keep Poetry from prompting, rendering spinners or emitting colour.
+        self._env = {
+            **os.environ,
+            "POETRY_NO_INTERACTION": "1",
+            "PYTHONUNBUFFERED": "1",
+            "NO_COLOR": "1",
+        }
+        # Locked versions parsed from poetry.lock; reset whenever the lock changes.
+        self._version_cache: dict[str, str] | None = None
+        # Backup of the most recent checkpoint, shared while the lock is unchanged.
+        self._last_backup: LazyBackup | None = None
+        # Disambiguates backups created within the same second.
+        self._ckpt_seq = 0
+        self.max_backups = max_backups
+        # Backups written during this run; never pruned.
+        self._live_backups: set[Path] = set()
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
     def execute_upgrades(
@@ -144,6 +370,8 @@ class SafeUpgradeExecutor:
         # Create initial checkpoint
         initial_checkpoint = self._create_checkpoint([])
         checkpoints.append(initial_checkpoint)
+        # Most recent state known to be consistent; rollback restores this one.
+        last_good_checkpoint = initial_checkpoint
 
         # Process upgrades in batches
         batches = self._create_batches(packages_to_upgrade)
@@ -156,16 +384,17 @@ class SafeUpgradeExecutor:
 
             batch_success = True
 
-            for package, version in batch:
-                result = self._upgrade_single_package(package, version)
+            # Snapshot any checkpoint whose lock file is about to be rewritten.
+            self._materialize_backups(checkpoints)
+
+            for result in self._upgrade_batch(batch):
                 upgrades.append(result)
 
                 if not result.success:
                     logger.error(
-                        f"Upgrade failed for {package}: {result.error_message}"
+                        f"Upgrade failed for {result.package}: {result.error_message}"
                     )
                     batch_success = False
-                    break
 
             # Create checkpoint after batch
             checkpoint = self._create_checkpoint(
@@ -181,12 +410,17 @@ class SafeUpgradeExecutor:
                     logger.error("Health checks failed after upgrade batch")
                     batch_success = False
 
+            if batch_success:
+                last_good_checkpoint = checkpoint
+
             # Handle failure
             if not batch_success:
                 logger.warning("Batch upgrade failed")
                 if auto_rollback:
                     logger.info("Initiating automatic rollback...")
-                    rollback_success = self._rollback_to_checkpoint(initial_checkpoint)
+                    rollback_success = self._rollback_to_checkpoint(
+                        last_good_checkpoint
+                    )
                     rollback_performed = True
                     if rollback_success:
                         logger.info("Rollback successful")
@@ -196,22 +430,22 @@ class SafeUpgradeExecutor:
 
         completed_at = datetime.now(UTC)
 
+        successful = sum(u.success for u in upgrades)
+
         # Determine final status
         if rollback_performed:
             final_status = "rolled_back"
+        elif successful == len(packages_to_upgrade):
+            final_status = "success"
+        elif successful > 0:
+            final_status = "partial"
         else:
-            success_count = sum(1 for u in upgrades if u.success)
-            if success_count == len(packages_to_upgrade):
-                final_status = "success"
-            elif success_count > 0:
-                final_status = "partial"
-            else:
-                final_status = "failed"
+            final_status = "failed"
 
         summary = {
             "total": len(packages_to_upgrade),
-            "successful": sum(1 for u in upgrades if u.success),
-            "failed": sum(1 for u in upgrades if not u.success),
+            "successful": successful,
+            "failed": len(upgrades) - successful,
             "batches": len(batches),
             "checkpoints": len(checkpoints),
         }
@@ -244,152 +478,237 @@ class SafeUpgradeExecutor:
         packages: list[str],
         success: bool = True,
     ) -> UpgradeCheckpoint:
-        """Create upgrade checkpoint with lock file backup."""
+        """Create upgrade checkpoint with a lazy lock file backup."""
         timestamp = datetime.now(UTC)
 
-        # Backup lock file
+        # Record the lock file; bytes are copied only when needed
         lock_file = self.project_root / "poetry.lock"
-        backup_path: Path | None = None
+        backup: LazyBackup | None = None
 
         if lock_file.exists():
-            backup_name = f"poetry.lock.{timestamp.strftime('%Y%m%d_%H%M%S')}"
-            backup_path = self.backup_dir / backup_name
-
             try:
-                backup_path.write_bytes(lock_file.read_bytes())
-                logger.debug(f"Created checkpoint backup: {backup_path}")
+                mtime_ns = lock_file.stat().st_mtime_ns
+                lock_hash = _hash_lock_file(lock_file)
+                last = self._last_backup
+                if (
+                    last is not None
+                    and last.lock_hash == lock_hash
+                    and (last.realized_path is None or last.realized_path.exists())
+                ):
+                    backup = last
+                    logger.debug("Lock file unchanged, reusing previous backup")
+                else:
+                    t = timestamp
+                    backup_name = (
+                        f"poetry.lock.{t.year:04d}{t.month:02d}{t.day:02d}_"
+                        f"{t.hour:02d}{t.minute:02d}{t.second:02d}.{self._ckpt_seq}"
+                    )
+                    self._ckpt_seq += 1
+                    backup = LazyBackup(
+                        source=lock_file,
+                        target=self.backup_dir / backup_name,
+                        lock_hash=lock_hash,
+                        mtime_ns=mtime_ns,
+                    )
+                    self._last_backup = backup
             except Exception as e:
                 logger.warning(f"Failed to create checkpoint backup: {e}")
-                backup_path = None
+                backup = None
 
         return UpgradeCheckpoint(
             timestamp=timestamp,
             packages_upgraded=packages,
-            lock_file_backup=backup_path,
+            lock_file_backup=backup,
             success=success,
         )
 
-    def _upgrade_single_package(
-        self,
-        package: str,
-        version: str | None,
-    ) -> UpgradeResult:
-        """Upgrade a single package."""
-        import time
+    def _materialize_backups(self, checkpoints: list[UpgradeCheckpoint]) -> None:
+        """Copy pending backups that still match the lock file to disk.
 
-        start_time = time.perf_counter()
+        Only the newest checkpoints can match the current lock file, so the
+        walk stops at the first backup whose source has diverged.
+        """
+        for checkpoint in reversed(checkpoints):
+            backup = checkpoint.lock_file_backup
+            if backup is None or backup.realized_path is not None:
+                continue
+            try:
+                if self._realize_backup(backup) is None:
+                    break
+            except Exception as e:
+                logger.warning(f"Failed to create checkpoint backup: {e}")
+                break
 
-        # Get current version
-        previous_version = self._get_package_version(package)
+    def _realize_backup(self, backup: LazyBackup) -> Path | None:
+        """Materialize a backup, then prune the backup directory if it grew."""
+        if backup.realized_path is not None:
+            return backup.realized_path
+        path = backup.materialize()
+        if path is not None:
+            self._live_backups.add(path)
+            self._prune_backups()
+        return path
+
+    def _prune_backups(self) -> None:
+        """Delete the least recently written backups beyond ``max_backups``."""
+        entries: list[tuple[int, Path]] = []
+        for path in self.backup_dir.glob("poetry.lock.*"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+
+        excess = len(entries) - self.max_backups
+        if excess <= 0:
+            return
+
+        entries.sort()
+        for _, path in entries[:excess]:
+            if path not in self._live_backups:
+                path.unlink(missing_ok=True)
+                logger.debug(f"Pruned old checkpoint backup: {path}")
+
+    def _upgrade_batch(self, batch: list[tuple[str, str]]) -> list[UpgradeResult]:
+        """Upgrade a batch with one resolver run per command kind.
+
+        Pinned packages go through a single ``poetry add pkg@ver ...`` and
+        unpinned ones through a single ``poetry update pkg ...``. Poetry
+        applies each command atomically, so when one fails nothing in it was
+        changed; the failure is attributed to the packages named in the error
+        output (or to all of them) and the remaining command is skipped.
+        """
+        previous = {package: self._get_package_version(package) for package, _ in batch}
+
+        pinned = [package for package, version in batch if version]
+        floating = [package for package, version in batch if not version]
+        commands: list[tuple[list[str], list[str]]] = []
+        if pinned:
+            specs = [f"{package}@{version}" for package, version in batch if version]
+            commands.append((["poetry", "add", "--no-ansi", *specs], pinned))
+        if floating:
+            commands.append((["poetry", "update", "--no-ansi", *floating], floating))
+
+        results: list[UpgradeResult] = []
+        for cmd, packages in commands:
+            logger.info(f"Executing: {' '.join(cmd)}")
+            start_time = time.perf_counter()
+            error_message = self._run_upgrade_command(cmd)
+            duration = time.perf_counter() - start_time
 
-        # Build upgrade command
-        if version:
-            cmd = ["poetry", "add", f"{package}@{version}"]
-        else:
-            cmd = ["poetry", "update", package]
+            if error_message is None:
+                for package in packages:
+                    results.append(
+                        UpgradeResult(
+                            package=package,
+                            success=True,
+                            previous_version=previous[package],
+                            new_version=self._get_package_version(package),
+                            duration_s=duration,
+                        )
+                    )
+                continue
+
+            blamed = _packages_in_output(error_message, packages)
+            for package in packages:
+                results.append(
+                    UpgradeResult(
+                        package=package,
+                        success=False,
+                        previous_version=previous[package],
+                        new_version=None,
+                        duration_s=duration,
+                        error_message=(
+                            error_message
+                            if package in blamed
+                            else "Not applied: batch rejected because of "
+                            + ", ".join(sorted(blamed))
+                        ),
+                    )
+                )
+            break
 
-        logger.info(f"Executing: {' '.join(cmd)}")
+        return results
 
+    def _run_upgrade_command(self, cmd: list[str]) -> str | None:
+        """Run a mutating Poetry command, returning an error message on failure."""
         try:
-            result = subprocess.run(
+            returncode, stderr = _run_captured_tail(
                 cmd,
                 cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=False,
                 timeout=300,  # 5 minute timeout
+                env=self._env,
             )
-
-            success = result.returncode == 0
-            error_message = result.stderr if not success else None
-
-            # Get new version
-            new_version = self._get_package_version(package) if success else None
-
-            duration = time.perf_counter() - start_time
-
-            return UpgradeResult(
-                package=package,
-                success=success,
-                previous_version=previous_version,
-                new_version=new_version,
-                duration_s=duration,
-                error_message=error_message,
-            )
-
         except subprocess.TimeoutExpired:
-            duration = time.perf_counter() - start_time
-            return UpgradeResult(
-                package=package,
-                success=False,
-                previous_version=previous_version,
-                new_version=None,
-                duration_s=duration,
-                error_message="Upgrade timed out after 5 minutes",
-            )
+            return "Upgrade timed out after 5 minutes"
         except Exception as e:
-            duration = time.perf_counter() - start_time
-            return UpgradeResult(
-                package=package,
-                success=False,
-                previous_version=previous_version,
-                new_version=None,
-                duration_s=duration,
-                error_message=str(e),
-            )
+            return str(e)
 
-    def _get_package_version(self, package: str) -> str | None:
-        """Get currently installed version of a package."""
-        try:
-            result = subprocess.run(
-                ["poetry", "show", package],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=30,
-            )
-
-            if result.returncode != 0:
-                return None
+        if returncode != 0:
+            message = stderr.decode("utf-8", errors="replace")
+            return message or f"{cmd[1]} exited with {returncode}"
 
-            # Parse version from output
-            for line in result.stdout.split("\n"):
-                if line.strip().startswith("version"):
-                    parts = line.split(":")
-                    if len(parts) >= 2:
-                        return parts[1].strip()
+        self._version_cache = None
+        return None
 
-            return None
+    def _get_package_version(self, package: str) -> str | None:
+        """Get the locked version of a package from poetry.lock."""
+        versions = self._version_cache
+        if versions is None:
+            versions = self._load_versions()
+        return versions.get(_canonical_name(package))
+
+    def _load_versions(self) -> dict[str, str]:
+        """Parse poetry.lock once into a name -> version map and cache it."""
+        lock_file = self.project_root / "poetry.lock"
+        versions: dict[str, str] = {}
 
-        except Exception as e:
-            logger.debug(f"Failed to get version for {package}: {e}")
-            return None
+        try:
+            with lock_file.open("rb") as handle:
+                data = tomllib.load(handle)
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            logger.debug(f"Failed to read locked versions from {lock_file}: {e}")
+        else:
+            for pkg in data.get("package", []):
+                name = pkg.get("name")
+                version = pkg.get("version")
+                if name and version:
+                    versions[_canonical_name(name)] = version
+
+        self._version_cache = versions
+        return versions
+
+    def _health_check_commands(self) -> list[list[str]]:
+        """Commands that must all exit 0 for an upgrade batch to be healthy."""
+        return [
+            # Verify poetry lock is consistent
+            ["poetry", "check", "--no-ansi", "--quiet"],
+        ]
 
     def _run_health_checks(self) -> bool:
         """Run health checks after upgrade."""
         logger.info("Running health checks...")
 
-        # Check 1: Verify poetry lock is consistent
-        try:
-            result = subprocess.run(
-                ["poetry", "check"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=60,
-            )
+        for cmd in self._health_check_commands():
+            try:
+                result = subprocess.run(
+                    cmd,
+                    cwd=self.project_root,
+                    env=self._env,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
+                    timeout=60,
+                )
+            except Exception as e:
+                logger.error(f"Health check {' '.join(cmd)!r} failed: {e}")
+                return False
 
             if result.returncode != 0:
-                logger.error("Poetry check failed")
+                logger.error(
+                    f"Health check {' '.join(cmd)!r} exited with {result.returncode}"
+                )
                 return False
-        except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return False
-
-        # Check 2: Try importing key packages (optional, would need configuration)
-        # For now, just return True if poetry check passed
 
         return True
 
@@ -397,28 +716,38 @@ class SafeUpgradeExecutor:
         """Rollback to a previous checkpoint."""
         logger.info(f"Rolling back to checkpoint from {checkpoint.timestamp}")
 
-        if not checkpoint.lock_file_backup or not checkpoint.lock_file_backup.exists():
+        backup = checkpoint.lock_file_backup
+        if backup is None:
             logger.error("No backup available for rollback")
             return False
 
         lock_file = self.project_root / "poetry.lock"
 
         try:
-            # Restore lock file
-            lock_file.write_bytes(checkpoint.lock_file_backup.read_bytes())
-            logger.info("Lock file restored from backup")
+            if lock_file.exists() and _hash_lock_file(lock_file) == backup.lock_hash:
+                logger.info("Lock file already matches checkpoint, skipping restore")
+            else:
+                backup_path = self._realize_backup(backup)
+                if backup_path is None or not backup_path.exists():
+                    logger.error("No backup available for rollback")
+                    return False
 
-            # Reinstall dependencies
-            result = subprocess.run(
-                ["poetry", "install", "--sync"],
+                # Restore lock file
+                _restore_file(backup_path, lock_file)
+                self._version_cache = None
+                logger.info("Lock file restored from backup")
+
+            # Always resync: a failed command can leave the venv half-installed
+            # even when Poetry has reverted the lock file
+
+            returncode, _ = _run_captured_tail(
+                ["poetry", "install", "--sync", "--no-ansi", "--quiet"],
                 cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=False,
                 timeout=600,
+                env=self._env,
             )
 
-            if result.returncode != 0:
+            if returncode != 0:
                 logger.error("Failed to reinstall dependencies during rollback")
                 return False
 
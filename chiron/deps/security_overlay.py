@@ -7,15 +7,87 @@ constraint overlays that pin safe versions without jumping major versions.
 
 from __future__ import annotations
 
+import io
 import json
+import logging
+import mmap
+import os
 import re
 import subprocess
+import tempfile
+from bisect import bisect_right
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from packaging.version import InvalidVersion, Version
+
+logger = logging.getLogger(__name__)
+
+_DIGITS_RE = re.compile(r"\d+")
+# Upper bound written by _create_constraint_for_cve, e.g. "<3.0"
+_MAX_RE = re.compile(r"<(\d+\.\d+)")
+
+# ijson streams large OSV reports record by record; json is the fallback
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore[assignment]
+
+# orjson serializes large overlays in C; json is the fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as a second-resolution ISO 8601 string."""
+    return datetime.now(UTC).isoformat(timespec="seconds")
+
+
+@lru_cache(maxsize=4096)
+def _parsed(version: str) -> Version | None:
+    """Parse a version string once; None if it is not valid PEP 440."""
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _load_overlay_data(path: str, ino: int, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse an overlay file, memoized on its identity and modification stamp.
+
+    Callers must copy any mutable values they keep; the returned dict is
+    shared between every manager loading the same unchanged file.
+    """
+    with open(path, "rb") as handle:
+        if orjson is None or size == 0:
+            return json.load(handle)
+        with (
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            return orjson.loads(view)
+
+
+def _iter_osv_results(osv_file: Path) -> Iterator[dict[str, Any]]:
+    """Yield the entries of an OSV report's ``results`` array one at a time.
+
+    With ijson installed only the current entry is held in memory; otherwise
+    the whole report is parsed up front.
+    """
+    with osv_file.open("rb") as handle:
+        if ijson is None:
+            yield from json.load(handle).get("results", [])
+        else:
+            yield from ijson.items(handle, "results.item", use_float=True)
+
 
 class Severity(Enum):
     """CVE severity levels."""
@@ -35,7 +107,25 @@ class Severity(Enum):
             return cls.UNKNOWN
 
 
-@dataclass
+# CVSS v3 score cut-offs; bisect_right(score) indexes the matching severity
+_SEV_THRESHOLDS = (4.0, 7.0, 9.0)
+_SEV_LEVELS = (Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL)
+
+
+def _cvss_severity(vuln: dict[str, Any]) -> Severity:
+    """Classify a vulnerability by its first numeric CVSS v3 score."""
+    for entry in vuln.get("database_specific", {}).get("severity", ()):
+        if entry.get("type") != "CVSS_V3":
+            continue
+        try:
+            score = float(entry.get("score", 0.0))
+        except (TypeError, ValueError):  # e.g. a vector string, not a score
+            continue
+        return _SEV_LEVELS[bisect_right(_SEV_THRESHOLDS, score)]
+    return Severity.UNKNOWN
+
+
+@dataclass(slots=True)
 class CVERecord:
     """CVE vulnerability record."""
 
@@ -49,7 +139,7 @@ class CVERecord:
     references: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityConstraint:
     """Security constraint for a package."""
 
@@ -58,6 +148,26 @@ class SecurityConstraint:
     max_version: str | None = None
     reason: str = ""
     cve_ids: list[str] = field(default_factory=list)
+    # Parsed bounds, re-derived only when the matching string changes
+    _min_src: str | None = field(default=None, init=False, repr=False, compare=False)
+    _min_v: Version | None = field(default=None, init=False, repr=False, compare=False)
+    _max_src: str | None = field(default=None, init=False, repr=False, compare=False)
+    _max_v: Version | None = field(default=None, init=False, repr=False, compare=False)
+
+    def min_bound(self) -> Version | None:
+        """Return ``min_version`` parsed, or None if it is not PEP 440."""
+        if self._min_src != self.min_version:
+            self._min_src = self.min_version
+            self._min_v = _parsed(self.min_version)
+        return self._min_v
+
+    def max_bound(self) -> Version | None:
+        """Return the exclusive upper bound from ``max_version`` (e.g. "<3.0")."""
+        if self._max_src != self.max_version:
+            self._max_src = self.max_version
+            match = _MAX_RE.match(self.max_version) if self.max_version else None
+            self._max_v = _parsed(match.group(1)) if match else None
+        return self._max_v
 
 
 class SecurityOverlayManager:
@@ -72,13 +182,18 @@ class SecurityOverlayManager:
         self.overlay_file = overlay_file or Path("security-constraints.json")
         self.constraints: dict[str, SecurityConstraint] = {}
         self.cve_database: dict[str, CVERecord] = {}
+        # Inverted index of cve_database, kept in step by _add_cve
+        self._cves_by_package: dict[str, list[CVERecord]] = {}
 
         if self.overlay_file.exists():
             self._load_overlay()
 
     def _load_overlay(self) -> None:
         """Load security overlay from file."""
-        data = json.loads(self.overlay_file.read_text())
+        st = self.overlay_file.stat()
+        data = _load_overlay_data(
+            str(self.overlay_file.resolve()), st.st_ino, st.st_mtime_ns, st.st_size
+        )
 
         for pkg_name, constraint_data in data.get("constraints", {}).items():
             self.constraints[pkg_name] = SecurityConstraint(
@@ -86,26 +201,40 @@ class SecurityOverlayManager:
                 min_version=constraint_data["min_version"],
                 max_version=constraint_data.get("max_version"),
                 reason=constraint_data.get("reason", ""),
-                cve_ids=constraint_data.get("cve_ids", []),
+                cve_ids=list(constraint_data.get("cve_ids", [])),
             )
 
         for cve_id, cve_data in data.get("cve_database", {}).items():
-            self.cve_database[cve_id] = CVERecord(
-                cve_id=cve_id,
-                package=cve_data["package"],
-                affected_versions=cve_data["affected_versions"],
-                fixed_version=cve_data["fixed_version"],
-                severity=Severity.from_string(cve_data.get("severity", "unknown")),
-                description=cve_data.get("description", ""),
-                published_date=cve_data.get("published_date", ""),
-                references=cve_data.get("references", []),
+            self._add_cve(
+                CVERecord(
+                    cve_id=cve_id,
+                    package=cve_data["package"],
+                    affected_versions=list(cve_data["affected_versions"]),
+                    fixed_version=cve_data["fixed_version"],
+                    severity=Severity.from_string(cve_data.get("severity", "unknown")),
+                    description=cve_data.get("description", ""),
+                    published_date=cve_data.get("published_date", ""),
+                    references=list(cve_data.get("references", [])),
+                )
             )
 
+    def _add_cve(self, cve: CVERecord) -> None:
+        """Record a CVE, replacing any earlier record with the same id.
+
+        Args:
+            cve: CVE record
+        """
+        previous = self.cve_database.get(cve.cve_id)
+        if previous is not None:
+            self._cves_by_package[previous.package].remove(previous)
+        self.cve_database[cve.cve_id] = cve
+        self._cves_by_package.setdefault(cve.package, []).append(cve)
+
     def save_overlay(self) -> None:
         """Save security overlay to file."""
         data = {
             "version": "1.0",
-            "updated": datetime.now().isoformat(),
+            "updated": _utc_timestamp(),
             "constraints": {},
             "cve_database": {},
         }
@@ -129,8 +258,34 @@ class SecurityOverlayManager:
                 "references": cve.references,
             }
 
-        self.overlay_file.write_text(json.dumps(data, indent=2))
-        print(f"Saved security overlay to {self.overlay_file}")
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+
+        # Write beside the target and rename so readers never see a partial file
+        try:
+            mode = self.overlay_file.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        tmp_path: Path | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb",
+                delete=False,
+                dir=self.overlay_file.parent,
+                prefix=f".{self.overlay_file.name}.",
+                suffix=".tmp",
+            ) as tmp:
+                tmp_path = Path(tmp.name)
+                tmp.write(payload)
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, self.overlay_file)
+        except BaseException:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            raise
+        logger.info("Saved security overlay to %s", self.overlay_file)
 
     def import_osv_scan(self, osv_file: Path) -> int:
         """Import vulnerabilities from OSV scan results.
@@ -141,55 +296,30 @@ class SecurityOverlayManager:
         Returns:
             Number of CVEs imported
         """
-        osv_data = json.loads(osv_file.read_text())
         imported_count = 0
 
-        for result in osv_data.get("results", []):
+        for result in _iter_osv_results(osv_file):
             for package_result in result.get("packages", []):
                 package_name = package_result.get("package", {}).get("name", "unknown")
 
                 for vuln in package_result.get("vulnerabilities", []):
                     cve_id = vuln.get("id", f"UNKNOWN-{imported_count}")
 
-                    # Parse affected versions
+                    # Parse affected versions and the first fixed version
                     affected_versions = []
+                    fixed_version = ""
                     for affected in vuln.get("affected", []):
                         for version_range in affected.get("ranges", []):
-                            events = version_range.get("events", [])
-                            for event in events:
+                            for event in version_range.get("events", []):
                                 if "introduced" in event:
                                     affected_versions.append(f">={event['introduced']}")
                                 elif "fixed" in event:
-                                    affected_versions.append(f"<{event['fixed']}")
+                                    fixed = event["fixed"]
+                                    affected_versions.append(f"<{fixed}")
+                                    if not fixed_version:
+                                        fixed_version = fixed
 
-                    # Get fixed version (from first fixed event)
-                    fixed_version = ""
-                    for affected in vuln.get("affected", []):
-                        for version_range in affected.get("ranges", []):
-                            for event in version_range.get("events", []):
-                                if "fixed" in event:
-                                    fixed_version = event["fixed"]
-                                    break
-                            if fixed_version:
-                                break
-                        if fixed_version:
-                            break
-
-                    # Determine severity
-                    severity = Severity.UNKNOWN
-                    for severity_entry in vuln.get("database_specific", {}).get(
-                        "severity", []
-                    ):
-                        if severity_entry.get("type") == "CVSS_V3":
-                            score = float(severity_entry.get("score", "0.0"))
-                            if score >= 9.0:
-                                severity = Severity.CRITICAL
-                            elif score >= 7.0:
-                                severity = Severity.HIGH
-                            elif score >= 4.0:
-                                severity = Severity.MEDIUM
-                            else:
-                                severity = Severity.LOW
+                    severity = _cvss_severity(vuln)
 
                     cve_record = CVERecord(
                         cve_id=cve_id,
@@ -204,7 +334,7 @@ class SecurityOverlayManager:
                         ],
                     )
 
-                    self.cve_database[cve_id] = cve_record
+                    self._add_cve(cve_record)
                     imported_count += 1
 
                     # Create or update constraint if severity is high enough
@@ -212,7 +342,7 @@ class SecurityOverlayManager:
                         self._create_constraint_for_cve(cve_record)
 
         self.save_overlay()
-        print(f"Imported {imported_count} CVEs from OSV scan")
+        logger.info("Imported %d CVEs from OSV scan", imported_count)
         return imported_count
 
     def _create_constraint_for_cve(self, cve: CVERecord) -> None:
@@ -222,7 +352,7 @@ class SecurityOverlayManager:
             cve: CVE record
         """
         if not cve.fixed_version:
-            print(f"  Warning: No fixed version for {cve.cve_id}, skipping constraint")
+            logger.warning("No fixed version for %s, skipping constraint", cve.cve_id)
             return
 
         # Get or create constraint
@@ -249,7 +379,7 @@ class SecurityOverlayManager:
             )
             self.constraints[cve.package] = constraint
 
-        print(f"  ✓ Created constraint: {cve.package}>={cve.fixed_version}")
+        logger.info("Created constraint: %s>=%s", cve.package, cve.fixed_version)
 
     def _extract_major_version(self, version: str) -> int | None:
         """Extract major version number from version string.
@@ -260,10 +390,8 @@ class SecurityOverlayManager:
         Returns:
             Major version number or None
         """
-        match = re.match(r"^(\d+)\.", version)
-        if match:
-            return int(match.group(1))
-        return None
+        parsed = _parsed(version)
+        return parsed.release[0] if parsed is not None else None
 
     def _compare_versions(self, v1: str, v2: str) -> int:
         """Compare two version strings.
@@ -275,9 +403,13 @@ class SecurityOverlayManager:
         Returns:
             -1 if v1 < v2, 0 if equal, 1 if v1 > v2
         """
-        # Simple version comparison (can be improved with packaging.version)
-        parts1 = [int(x) for x in re.findall(r"\d+", v1)]
-        parts2 = [int(x) for x in re.findall(r"\d+", v2)]
+        a, b = _parsed(v1), _parsed(v2)
+        if a is not None and b is not None:
+            return (a > b) - (a < b)
+
+        # Non-PEP 440 strings: compare their numeric components
+        parts1 = [int(x) for x in _DIGITS_RE.findall(v1)]
+        parts2 = [int(x) for x in _DIGITS_RE.findall(v2)]
 
         for p1, p2 in zip(parts1, parts2):
             if p1 < p2:
@@ -299,33 +431,33 @@ class SecurityOverlayManager:
         Args:
             output_file: Path to output constraints file
         """
-        lines = [
-            "# Security constraints overlay",
-            f"# Generated: {datetime.now().isoformat()}",
-            "# DO NOT EDIT MANUALLY - Generated by security overlay manager",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w("# Security constraints overlay\n")
+        w(f"# Generated: {_utc_timestamp()}\n")
+        w("# DO NOT EDIT MANUALLY - Generated by security overlay manager\n")
 
         for pkg_name, constraint in sorted(self.constraints.items()):
-            # Build constraint spec
-            spec_parts = [f"{pkg_name}>={constraint.min_version}"]
-
-            if constraint.max_version:
-                spec_parts.append(constraint.max_version)
-
-            constraint_spec = ",".join(spec_parts)
+            w("\n")
 
             # Add comment with CVEs
             if constraint.cve_ids:
                 cve_list = ", ".join(constraint.cve_ids)
-                lines.append(f"# {pkg_name}: {constraint.reason} ({cve_list})")
+                w(f"# {pkg_name}: {constraint.reason} ({cve_list})\n")
 
-            lines.append(constraint_spec)
-            lines.append("")
+            # Constraint spec, e.g. "requests>=2.31.0,<3.0"
+            w(f"{pkg_name}>={constraint.min_version}")
+            if constraint.max_version:
+                w(",")
+                w(constraint.max_version)
+            w("\n")
 
-        output_file.write_text("\n".join(lines))
-        print(f"Generated constraints file: {output_file}")
-        print(f"  {len(self.constraints)} security constraints")
+        output_file.write_text(buf.getvalue())
+        logger.info(
+            "Generated constraints file: %s (%d security constraints)",
+            output_file,
+            len(self.constraints),
+        )
 
     def check_package_version(
         self,
@@ -346,28 +478,37 @@ class SecurityOverlayManager:
 
         constraint = self.constraints[package]
         violations = []
+        checked = _parsed(version)
 
         # Check minimum version
-        if self._compare_versions(version, constraint.min_version) < 0:
+        min_v = constraint.min_bound()
+        if checked is not None and min_v is not None:
+            below_min = checked < min_v
+        else:
+            below_min = self._compare_versions(version, constraint.min_version) < 0
+        if below_min:
             violations.append(
                 f"Version {version} is below minimum {constraint.min_version}"
             )
-            for cve_id in constraint.cve_ids:
-                if cve_id in self.cve_database:
-                    cve = self.cve_database[cve_id]
-                    violations.append(f"  Affected by {cve_id} ({cve.severity.value})")
-
-        # Check maximum version
-        if constraint.max_version:
-            # Parse max version constraint (e.g., "<2.0")
-            match = re.match(r"<(\d+\.\d+)", constraint.max_version)
-            if match:
-                max_ver = match.group(1)
-                if self._compare_versions(version, max_ver) >= 0:
+            cve_ids = set(constraint.cve_ids)
+            for cve in self._cves_by_package.get(package, ()):
+                if cve.cve_id in cve_ids:
                     violations.append(
-                        f"Version {version} exceeds maximum {constraint.max_version}"
+                        f"  Affected by {cve.cve_id} ({cve.severity.value})"
                     )
 
+        # Check maximum version
+        max_v = constraint.max_bound()
+        if max_v is not None:
+            if checked is not None:
+                above_max = checked >= max_v
+            else:
+                above_max = self._compare_versions(version, str(max_v)) >= 0
+            if above_max:
+                violations.append(
+                    f"Version {version} exceeds maximum {constraint.max_version}"
+                )
+
         return len(violations) == 0, violations
 
     def get_recommendations(self, package: str) -> list[str]:
@@ -400,6 +541,9 @@ class SecurityOverlayManager:
 
 if __name__ == "__main__":
     import argparse
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     parser = argparse.ArgumentParser(description="Security constraints overlay manager")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -3,19 +3,104 @@
 Artifact signing and verification using Sigstore cosign.
 
 Provides keyless signing and verification for wheelhouse bundles
-and other artifacts using OIDC-based Sigstore.
+and other artifacts using OIDC-based Sigstore. When the ``sigstore``
+package is installed, signing and verification run in-process and
+produce Sigstore bundles; otherwise the ``cosign`` binary is used.
 """
 
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
 import logging
+import os
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO, Any
+
+try:
+    from sigstore import hashes as sigstore_hashes
+    from sigstore import models as sigstore_models
+    from sigstore import oidc as sigstore_oidc
+    from sigstore import sign as sigstore_sign
+    from sigstore import verify as sigstore_verify
+
+    HAS_SIGSTORE = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_SIGSTORE = False
 
 logger = logging.getLogger(__name__)
 
+_BUNDLE_SUFFIX = ".sigstore.json"
+_STDERR_TAIL_BYTES = 64 * 1024
+
+
+def _is_sigstore_bundle(signature_path: Path) -> bool:
+    """Return True if ``signature_path`` holds a Sigstore bundle."""
+    return signature_path.name.endswith(_BUNDLE_SUFFIX)
+
+
+def _sigstore_digest(artifact_path: Path) -> Any:
+    """Hash ``artifact_path`` once so sigstore signs the digest, not the bytes.
+
+    Avoids loading the whole artifact into memory; ``hashlib.file_digest``
+    streams the file in large blocks.
+    """
+    with artifact_path.open("rb") as f:
+        digest = hashlib.file_digest(f, "sha256").digest()
+    return sigstore_hashes.Hashed(
+        algorithm=sigstore_hashes.HashAlgorithm.SHA2_256, digest=digest
+    )
+
+
+def _run_cosign(
+    cmd: list[str],
+    *,
+    stdout: IO[str] | int,
+    env: dict[str, str] | None,
+    tail: int = _STDERR_TAIL_BYTES,
+) -> tuple[int, str]:
+    """Run cosign, keeping only the last ``tail`` bytes of its stderr.
+
+    A crashing cosign can emit megabytes of Go stack traces; the tail is
+    enough to explain the failure without holding all of it in memory.
+
+    Args:
+        cmd: Command to run
+        stdout: Destination for cosign's stdout
+        env: Environment for the process
+        tail: Maximum number of stderr bytes to keep
+
+    Returns:
+        Tuple of (return code, decoded stderr tail)
+    """
+    buffer = bytearray()
+    with subprocess.Popen(
+        cmd, stdout=stdout, stderr=subprocess.PIPE, env=env
+    ) as process:
+        # stderr is the only pipe, so reading it to EOF here cannot deadlock
+        if process.stderr is None:
+            raise RuntimeError("cosign stderr pipe was not opened")
+        while chunk := process.stderr.read1(65536):
+            buffer += chunk
+            if len(buffer) > tail:
+                del buffer[:-tail]
+        returncode = process.wait()
+    return returncode, buffer.decode("utf-8", errors="replace")
+
+
+def _production_signing_context() -> Any:
+    """Build a signing context for the public-good Sigstore instance."""
+    context_cls = sigstore_sign.SigningContext
+    if hasattr(context_cls, "from_trust_config"):  # sigstore >= 4
+        return context_cls.from_trust_config(
+            sigstore_models.ClientTrustConfig.production()
+        )
+    return context_cls.production()
+
 
 @dataclass(slots=True)
 class SigningResult:
@@ -30,14 +115,135 @@ class SigningResult:
 class CosignSigner:
     """Sign artifacts using Sigstore cosign."""
 
-    def __init__(self, keyless: bool = True):
+    def __init__(
+        self,
+        keyless: bool = True,
+        identity_token: str | None = None,
+        use_sigstore: bool | None = None,
+    ):
         """
         Initialize cosign signer.
 
         Args:
             keyless: Use keyless signing with OIDC (default: True)
+            identity_token: Pre-fetched OIDC token passed to every cosign call
+                through ``SIGSTORE_ID_TOKEN``, so a batch performs the OIDC
+                flow once instead of per artifact
+            use_sigstore: Sign and verify in-process with the ``sigstore``
+                library (default: when installed and signing keyless)
         """
         self.keyless = keyless
+        self.identity_token = identity_token
+        if use_sigstore is None:
+            use_sigstore = HAS_SIGSTORE and keyless
+        self.use_sigstore = use_sigstore and HAS_SIGSTORE
+        # Resolved once; PATH lookups stat every entry on each call
+        self._cosign = shutil.which("cosign")
+        # Created on first use and reused so Fulcio/Rekor clients are shared
+        self._signing_context: Any = None
+        self._verifier: Any = None
+        self._sigstore_lock = threading.Lock()
+
+    @staticmethod
+    def default_signature_path(artifact_path: Path, *, bundle: bool = False) -> Path:
+        """
+        Return where the signature for ``artifact_path`` is written by default.
+
+        Args:
+            artifact_path: Path to artifact to sign
+            bundle: Whether the output is a Sigstore bundle written by the
+                in-process signer rather than a raw cosign signature
+
+        Returns:
+            ``<artifact>.sigstore.json`` for bundles, ``<artifact>.sig`` otherwise
+        """
+        suffix = _BUNDLE_SUFFIX if bundle else ".sig"
+        return artifact_path.with_name(artifact_path.name + suffix)
+
+    def _cosign_env(self) -> dict[str, str] | None:
+        """Return the environment for cosign, or None to inherit ours.
+
+        The identity token travels in the environment rather than argv,
+        where any local user could read it from ``ps`` or ``/proc``.
+        """
+        env = {"COSIGN_EXPERIMENTAL": "1"} if self.keyless else None
+        if self.identity_token:
+            env = {**(env or os.environ), "SIGSTORE_ID_TOKEN": self.identity_token}
+        return env
+
+    def _sigstore_identity(self) -> Any:
+        """Resolve the OIDC identity for in-process signing.
+
+        Returns:
+            An ``IdentityToken``, or None when no token is configured or
+            available from the ambient (CI) environment
+        """
+        try:
+            raw_token = self.identity_token or sigstore_oidc.detect_credential()
+            if not raw_token:
+                return None
+            return sigstore_oidc.IdentityToken(raw_token)
+        except sigstore_oidc.IdentityError as e:
+            logger.warning(f"Unusable OIDC credential: {e}")
+            return None
+
+    def _get_signing_context(self) -> Any:
+        with self._sigstore_lock:
+            if self._signing_context is None:
+                self._signing_context = _production_signing_context()
+            return self._signing_context
+
+    def _get_verifier(self) -> Any:
+        with self._sigstore_lock:
+            if self._verifier is None:
+                self._verifier = sigstore_verify.Verifier.production()
+            return self._verifier
+
+    def _sign_with_sigstore(
+        self,
+        artifact_paths: list[Path],
+        signature_outputs: list[Path],
+        identity: Any,
+    ) -> list[SigningResult]:
+        """Sign artifacts in-process, sharing one signing certificate.
+
+        Args:
+            artifact_paths: Paths to artifacts to sign
+            signature_outputs: Bundle output path for each artifact
+            identity: OIDC identity token used to obtain the certificate
+
+        Returns:
+            Signing results in the same order as ``artifact_paths``
+        """
+        results: list[SigningResult] = []
+        try:
+            signing_context = self._get_signing_context()
+            with signing_context.signer(identity) as signer:
+                for artifact_path, signature_output in zip(
+                    artifact_paths, signature_outputs, strict=True
+                ):
+                    if not artifact_path.exists():
+                        logger.error(f"Artifact not found: {artifact_path}")
+                        results.append(
+                            SigningResult(
+                                success=False,
+                                error_message=f"Artifact not found: {artifact_path}",
+                            )
+                        )
+                        continue
+
+                    logger.info(f"Signing artifact: {artifact_path}")
+                    bundle = signer.sign_artifact(_sigstore_digest(artifact_path))
+                    signature_output.write_text(bundle.to_json())
+                    logger.info(f"Signed artifact: {signature_output}")
+                    results.append(
+                        SigningResult(success=True, signature_path=signature_output)
+                    )
+        except Exception as e:
+            logger.error(f"Error signing artifact: {e}")
+            failed = SigningResult(success=False, error_message=str(e))
+            results.extend([failed] * (len(artifact_paths) - len(results)))
+        return results
 
     def sign_blob(
         self,
@@ -54,10 +260,25 @@ class CosignSigner:
         Returns:
             SigningResult with success status and paths
         """
-        cosign = shutil.which("cosign")
+        if self.use_sigstore:
+            identity = self._sigstore_identity()
+            if identity is not None:
+                if signature_output is None:
+                    signature_output = self.default_signature_path(
+                        artifact_path, bundle=True
+                    )
+                return self._sign_with_sigstore(
+                    [artifact_path], [signature_output], identity
+                )[0]
+            logger.debug("No OIDC token for in-process signing; using cosign")
+
+        if signature_output is None:
+            signature_output = self.default_signature_path(artifact_path)
+
+        cosign = self._cosign
         if not cosign:
             logger.error(
-                "cosign not found. " "Install from: https://github.com/sigstore/cosign"
+                "cosign not found. Install from: https://github.com/sigstore/cosign"
             )
             return SigningResult(
                 success=False, error_message="cosign not found in PATH"
@@ -69,9 +290,6 @@ class CosignSigner:
                 success=False, error_message=f"Artifact not found: {artifact_path}"
             )
 
-        if signature_output is None:
-            signature_output = artifact_path.with_suffix(artifact_path.suffix + ".sig")
-
         cmd = [
             cosign,
             "sign-blob",
@@ -84,18 +302,15 @@ class CosignSigner:
             logger.info(f"Signing artifact: {artifact_path}")
 
             with signature_output.open("w") as sig_file:
-                result = subprocess.run(
+                returncode, stderr = _run_cosign(
                     cmd,
                     stdout=sig_file,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    env={"COSIGN_EXPERIMENTAL": "1"} if self.keyless else None,
+                    env=self._cosign_env(),
                 )
 
-            if result.returncode != 0:
-                logger.error(f"Signing failed: {result.stderr}")
-                return SigningResult(success=False, error_message=result.stderr)
+            if returncode != 0:
+                logger.error(f"Signing failed: {stderr}")
+                return SigningResult(success=False, error_message=stderr)
 
             logger.info(f"Signed artifact: {signature_output}")
             return SigningResult(
@@ -107,6 +322,62 @@ class CosignSigner:
             logger.error(f"Error signing artifact: {e}")
             return SigningResult(success=False, error_message=str(e))
 
+    def sign_blobs(
+        self,
+        artifact_paths: list[Path],
+        output_dir: Path | None = None,
+    ) -> list[SigningResult]:
+        """
+        Sign many blobs.
+
+        In-process signing obtains one certificate and signs every artifact
+        with it. Otherwise each artifact is signed by its own cosign process.
+        With an ``identity_token`` those processes are independent and run on
+        a thread pool; without one each may open an interactive OIDC flow,
+        so they run one after another.
+
+        Args:
+            artifact_paths: Paths to artifacts to sign
+            output_dir: Directory for signature output (default: next to each
+                artifact)
+
+        Returns:
+            Signing results in the same order as ``artifact_paths``
+        """
+
+        def signature_for(artifact_path: Path, *, bundle: bool = False) -> Path:
+            signature_path = self.default_signature_path(artifact_path, bundle=bundle)
+            if output_dir is None:
+                return signature_path
+            return output_dir / signature_path.name
+
+        if self.use_sigstore and artifact_paths:
+            identity = self._sigstore_identity()
+            if identity is not None:
+                return self._sign_with_sigstore(
+                    artifact_paths,
+                    [signature_for(path, bundle=True) for path in artifact_paths],
+                    identity,
+                )
+
+        if len(artifact_paths) <= 1 or not self.identity_token:
+            return [
+                self.sign_blob(path, signature_for(path)) for path in artifact_paths
+            ]
+
+        # Workers mostly wait on cosign processes and the network
+        max_workers = min(os.cpu_count() or 1, len(artifact_paths))
+        results: list[SigningResult | None] = [None] * len(artifact_paths)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            future_map = {
+                pool.submit(self.sign_blob, path, signature_for(path)): index
+                for index, path in enumerate(artifact_paths)
+            }
+            for fut in concurrent.futures.as_completed(future_map):
+                results[future_map[fut]] = fut.result()
+
+        return [result for result in results if result is not None]
+
     def verify_blob(
         self,
         artifact_path: Path,
@@ -118,9 +389,12 @@ class CosignSigner:
         """
         Verify a signed blob using cosign.
 
+        Sigstore bundles (``*.sigstore.json``) are verified in-process when
+        the ``sigstore`` library is enabled.
+
         Args:
             artifact_path: Path to artifact to verify
-            signature_path: Path to signature file
+            signature_path: Path to signature file or Sigstore bundle
             certificate_path: Path to certificate (if available)
             certificate_identity: Expected certificate identity
             certificate_oidc_issuer: Expected OIDC issuer
@@ -128,11 +402,6 @@ class CosignSigner:
         Returns:
             True if verification succeeds, False otherwise
         """
-        cosign = shutil.which("cosign")
-        if not cosign:
-            logger.error("cosign not found")
-            return False
-
         if not artifact_path.exists():
             logger.error(f"Artifact not found: {artifact_path}")
             return False
@@ -141,10 +410,24 @@ class CosignSigner:
             logger.error(f"Signature not found: {signature_path}")
             return False
 
+        is_bundle = _is_sigstore_bundle(signature_path)
+        if is_bundle and self.use_sigstore:
+            return self._verify_with_sigstore(
+                artifact_path,
+                signature_path,
+                certificate_identity,
+                certificate_oidc_issuer,
+            )
+
+        cosign = self._cosign
+        if not cosign:
+            logger.error("cosign not found")
+            return False
+
         cmd = [
             cosign,
             "verify-blob",
-            "--signature",
+            "--bundle" if is_bundle else "--signature",
             str(signature_path),
         ]
 
@@ -161,16 +444,14 @@ class CosignSigner:
 
         try:
             logger.info(f"Verifying artifact: {artifact_path}")
-            result = subprocess.run(
+            returncode, stderr = _run_cosign(
                 cmd,
-                capture_output=True,
-                text=True,
-                check=False,
+                stdout=subprocess.DEVNULL,
                 env={"COSIGN_EXPERIMENTAL": "1"} if self.keyless else None,
             )
 
-            if result.returncode != 0:
-                logger.error(f"Verification failed: {result.stderr}")
+            if returncode != 0:
+                logger.error(f"Verification failed: {stderr}")
                 return False
 
             logger.info(f"Verification succeeded: {artifact_path}")
@@ -180,6 +461,106 @@ class CosignSigner:
             logger.error(f"Error verifying artifact: {e}")
             return False
 
+    def _verify_with_sigstore(
+        self,
+        artifact_path: Path,
+        bundle_path: Path,
+        certificate_identity: str | None,
+        certificate_oidc_issuer: str | None,
+    ) -> bool:
+        """Verify a Sigstore bundle in-process.
+
+        Args:
+            artifact_path: Path to artifact to verify
+            bundle_path: Path to the Sigstore bundle
+            certificate_identity: Expected certificate identity
+            certificate_oidc_issuer: Expected OIDC issuer
+
+        Returns:
+            True if verification succeeds, False otherwise
+        """
+        if not certificate_identity or not certificate_oidc_issuer:
+            logger.error(
+                "Keyless verification requires a certificate identity and OIDC issuer"
+            )
+            return False
+
+        try:
+            logger.info(f"Verifying artifact: {artifact_path}")
+            bundle = sigstore_models.Bundle.from_json(bundle_path.read_bytes())
+            identity_policy = sigstore_verify.policy.Identity(
+                identity=certificate_identity, issuer=certificate_oidc_issuer
+            )
+            self._get_verifier().verify_artifact(
+                _sigstore_digest(artifact_path), bundle, identity_policy
+            )
+        except Exception as e:
+            logger.error(f"Verification failed: {e}")
+            return False
+
+        logger.info(f"Verification succeeded: {artifact_path}")
+        return True
+
+
+class WheelhouseVerifier:
+    """Verify many signed artifacts against one expected signer identity."""
+
+    def __init__(
+        self,
+        certificate_identity: str | None = None,
+        certificate_oidc_issuer: str | None = None,
+        max_workers: int = 8,
+    ):
+        """
+        Initialize wheelhouse verifier.
+
+        Args:
+            certificate_identity: Expected certificate identity
+            certificate_oidc_issuer: Expected OIDC issuer
+            max_workers: Maximum number of concurrent verifications
+        """
+        self.certificate_identity = certificate_identity
+        self.certificate_oidc_issuer = certificate_oidc_issuer
+        self.max_workers = max_workers
+        # One signer shares its sigstore verifier (trust root and Rekor
+        # client) and cosign lookup across every verification
+        self._signer = CosignSigner(keyless=True)
+
+    def verify_one(self, artifact_path: Path, signature_path: Path) -> bool:
+        """
+        Verify a single artifact.
+
+        Args:
+            artifact_path: Path to artifact to verify
+            signature_path: Path to signature file or Sigstore bundle
+
+        Returns:
+            True if verification succeeds, False otherwise
+        """
+        return self._signer.verify_blob(
+            artifact_path,
+            signature_path,
+            certificate_identity=self.certificate_identity,
+            certificate_oidc_issuer=self.certificate_oidc_issuer,
+        )
+
+    def verify_many(self, pairs: list[tuple[Path, Path]]) -> list[bool]:
+        """
+        Verify many artifacts concurrently.
+
+        Args:
+            pairs: ``(artifact_path, signature_path)`` tuples
+
+        Returns:
+            Verification outcomes in the same order as ``pairs``
+        """
+        if len(pairs) <= 1:
+            return [self.verify_one(*pair) for pair in pairs]
+
+        max_workers = min(self.max_workers, len(pairs))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda pair: self.verify_one(*pair), pairs))
+
 
 def sign_wheelhouse_bundle(
     bundle_path: Path,
@@ -195,12 +576,13 @@ def sign_wheelhouse_bundle(
     Returns:
         SigningResult with success status and paths
     """
-    signer = CosignSigner(keyless=True)
+    # Always cosign: the CLI and mirror tooling expect a ``.sig`` next to
+    # the bundle
+    signer = CosignSigner(keyless=True, use_sigstore=False)
 
+    signature_path = signer.default_signature_path(bundle_path)
     if output_dir:
-        signature_path = output_dir / f"{bundle_path.name}.sig"
-    else:
-        signature_path = bundle_path.with_suffix(bundle_path.suffix + ".sig")
+        signature_path = output_dir / signature_path.name
 
     return signer.sign_blob(bundle_path, signature_path)
 
@@ -208,16 +590,20 @@ def sign_wheelhouse_bundle(
 def verify_wheelhouse_bundle(
     bundle_path: Path,
     signature_path: Path,
+    certificate_identity: str | None = None,
+    certificate_oidc_issuer: str | None = None,
 ) -> bool:
     """
     Verify a signed wheelhouse bundle.
 
     Args:
         bundle_path: Path to wheelhouse bundle
-        signature_path: Path to signature file
+        signature_path: Path to signature file or Sigstore bundle
+        certificate_identity: Expected certificate identity
+        certificate_oidc_issuer: Expected OIDC issuer
 
     Returns:
         True if verification succeeds, False otherwise
     """
-    signer = CosignSigner(keyless=True)
-    return signer.verify_blob(bundle_path, signature_path)
+    verifier = WheelhouseVerifier(certificate_identity, certificate_oidc_issuer)
+    return verifier.verify_one(bundle_path, signature_path)
@@ -3,10 +3,12 @@
 
 from __future__ import annotations
 
-import json
-import tempfile
+import concurrent.futures
+import contextlib
+import contextvars
+import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -110,6 +112,7 @@ class PlannerSettings:
     skip_resolver: bool = True
     poetry: str | None = None
     project_root: Path | None = None
+    parallel: bool = True
 
 
 STATUS_TRACER = trace.get_tracer("prometheus.deps_status")
@@ -124,19 +127,51 @@ STATUS_STAGE_DURATION = Histogram(
     labelnames=("stage",),
 )
 
+# Label children bound once; .labels() hashes and looks up on every call
+_GUARD_STAGE = STATUS_STAGE_DURATION.labels(stage="guard")
+_PLANNER_STAGE = STATUS_STAGE_DURATION.labels(stage="planner")
+_TOTAL_STAGE = STATUS_STAGE_DURATION.labels(stage="total")
+_RUN_OUTCOMES = {
+    outcome: STATUS_RUN_COUNTER.labels(outcome=outcome)
+    for outcome in (*upgrade_guard.FAIL_THRESHOLD_CHOICES, "unknown", "error")
+}
+
+
+def _count_run(outcome: str) -> None:
+    counter = _RUN_OUTCOMES.get(outcome)
+    if counter is None:
+        counter = STATUS_RUN_COUNTER.labels(outcome=outcome)
+    counter.inc()
+
+
+@contextlib.contextmanager
+def _timed(stage: Any) -> Iterator[None]:
+    """Observe the duration of the ``with`` block into a histogram child."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage.observe(time.perf_counter() - start)
+
+
 _OBSERVABILITY_BOOTSTRAPPED = False
+_OBSERVABILITY_LOCK = threading.Lock()
 
 
 def _ensure_observability() -> None:
     global _OBSERVABILITY_BOOTSTRAPPED
     if _OBSERVABILITY_BOOTSTRAPPED:
         return
-    configure_tracing(
-        "prometheus-deps-status",
-        resource_attributes={"component": "scripts.deps_status"},
-    )
-    configure_metrics(namespace="prometheus_deps_status")
-    _OBSERVABILITY_BOOTSTRAPPED = True
+    # Double-checked so concurrent callers configure exporters only once
+    with _OBSERVABILITY_LOCK:
+        if _OBSERVABILITY_BOOTSTRAPPED:
+            return
+        configure_tracing(
+            "prometheus-deps-status",
+            resource_attributes={"component": "scripts.deps_status"},
+        )
+        configure_metrics(namespace="prometheus_deps_status")
+        _OBSERVABILITY_BOOTSTRAPPED = True
 
 
 def _build_guard_args(
@@ -149,8 +184,6 @@ def _build_guard_args(
     metadata: Path | None,
     sbom_max_age_days: int | None,
     fail_threshold: str,
-    output_path: Path,
-    markdown_path: Path,
 ) -> list[str]:
     argv: list[str] = ["--contract", str(contract)]
     if preflight is not None:
@@ -165,27 +198,10 @@ def _build_guard_args(
         argv.extend(["--metadata", str(metadata)])
     if sbom_max_age_days is not None:
         argv.extend(["--sbom-max-age-days", str(sbom_max_age_days)])
-    argv.extend(["--output", str(output_path)])
-    argv.extend(["--markdown", str(markdown_path)])
     argv.extend(["--fail-threshold", fail_threshold.lower()])
     return argv
 
 
-def _load_guard_output(output_path: Path) -> dict[str, Any] | None:
-    if not output_path.exists():
-        return None
-    try:
-        return json.loads(output_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return None
-
-
-def _load_markdown(markdown_path: Path) -> str | None:
-    if not markdown_path.exists():
-        return None
-    return markdown_path.read_text(encoding="utf-8")
-
-
 def _build_planner_config(
     *,
     sbom: Path,
@@ -258,6 +274,55 @@ def _merge_summary(
     return overall_exit, summary
 
 
+def _run_guard_stage(
+    *,
+    preflight: Path | None,
+    renovate: Path | None,
+    cve: Path | None,
+    contract: Path,
+    sbom: Path | None,
+    metadata: Path | None,
+    sbom_max_age_days: int | None,
+    fail_threshold: str,
+    include_markdown: bool = True,
+) -> GuardRun:
+    with _timed(_GUARD_STAGE):
+        # In-process: the assessment is returned, not round-tripped via files
+        guard_exit, assessment, markdown = upgrade_guard.assess(
+            _build_guard_args(
+                preflight=preflight,
+                renovate=renovate,
+                cve=cve,
+                contract=contract,
+                sbom=sbom,
+                metadata=metadata,
+                sbom_max_age_days=sbom_max_age_days,
+                fail_threshold=fail_threshold,
+            ),
+            render_markdown=include_markdown,
+        )
+    return GuardRun(exit_code=guard_exit, assessment=assessment, markdown=markdown)
+
+
+def _run_planner_stage(
+    *,
+    sbom: Path,
+    metadata: Path | None,
+    settings: PlannerSettings,
+) -> tuple[PlannerRun, str | None]:
+    try:
+        with _timed(_PLANNER_STAGE):
+            config = _build_planner_config(
+                sbom=sbom,
+                metadata=metadata,
+                settings=settings,
+            )
+            plan_result = upgrade_planner.generate_plan(config)
+    except upgrade_planner.PlannerError as exc:
+        return PlannerRun(exit_code=2, plan=None, error=str(exc)), str(exc)
+    return PlannerRun(exit_code=plan_result.exit_code, plan=plan_result.to_dict()), None
+
+
 def generate_status(
     *,
     preflight: Path | None,
@@ -269,15 +334,25 @@ def generate_status(
     sbom_max_age_days: int | None,
     fail_threshold: str,
     planner_settings: PlannerSettings | None = None,
+    include_markdown: bool = True,
 ) -> DependencyStatus:
-    """Generate a combined dependency status report."""
+    """Generate a combined dependency status report.
+
+    The guard and planner stages are independent (the planner only needs the
+    SBOM), so they run concurrently unless ``planner_settings.parallel`` is
+    disabled. Callers that only need the assessment can pass
+    ``include_markdown=False`` to skip rendering the guard's Markdown
+    summary; ``status.guard.markdown`` is then None.
+    """
 
     _ensure_observability()
-    total_start = time.perf_counter()
     moment = datetime.now(UTC)
     settings = planner_settings or PlannerSettings()
 
-    with STATUS_TRACER.start_as_current_span("deps_status.generate_status") as span:
+    with (
+        _timed(_TOTAL_STAGE),
+        STATUS_TRACER.start_as_current_span("deps_status.generate_status") as span,
+    ):
         span.set_attribute("deps_status.fail_threshold", str(fail_threshold))
         span.set_attribute("deps_status.planner_enabled", bool(settings.enabled))
         span.set_attribute(
@@ -288,48 +363,17 @@ def generate_status(
             settings.limit if settings.limit is not None else -1,
         )
 
-        guard_exit = 0
-        guard_assessment: dict[str, Any] | None = None
-        guard_markdown: str | None = None
-        guard_start = time.perf_counter()
-        try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir_path = Path(tmpdir)
-                guard_output = tmpdir_path / "guard-assessment.json"
-                guard_markdown_path = tmpdir_path / "guard-summary.md"
-                guard_args = _build_guard_args(
-                    preflight=preflight,
-                    renovate=renovate,
-                    cve=cve,
-                    contract=contract,
-                    sbom=sbom,
-                    metadata=metadata,
-                    sbom_max_age_days=sbom_max_age_days,
-                    fail_threshold=fail_threshold,
-                    output_path=guard_output,
-                    markdown_path=guard_markdown_path,
-                )
-
-                guard_exit = upgrade_guard.main(guard_args)
-                guard_assessment = _load_guard_output(guard_output)
-                guard_markdown = _load_markdown(guard_markdown_path)
-        except Exception as exc:  # pragma: no cover - defensive telemetry path
-            span.record_exception(exc)
-            span.set_status(Status(StatusCode.ERROR))
-            STATUS_RUN_COUNTER.labels(outcome="error").inc()
-            raise
-        finally:
-            STATUS_STAGE_DURATION.labels(stage="guard").observe(
-                time.perf_counter() - guard_start
-            )
-
-        span.set_attribute("deps_status.guard_exit_code", int(guard_exit))
-
-        guard_run = GuardRun(
-            exit_code=guard_exit,
-            assessment=guard_assessment,
-            markdown=guard_markdown,
-        )
+        guard_kwargs: dict[str, Any] = {
+            "preflight": preflight,
+            "renovate": renovate,
+            "cve": cve,
+            "contract": contract,
+            "sbom": sbom,
+            "metadata": metadata,
+            "sbom_max_age_days": sbom_max_age_days,
+            "fail_threshold": fail_threshold,
+            "include_markdown": include_markdown,
+        }
 
         planner_run: PlannerRun | None = None
         planner_reason: str | None = None
@@ -338,40 +382,45 @@ def generate_status(
             planner_reason = "planner skipped by configuration"
         elif sbom is None:
             planner_reason = "planner skipped (no SBOM provided)"
-        else:
-            planner_start = time.perf_counter()
-            try:
-                config = _build_planner_config(
-                    sbom=sbom,
-                    metadata=metadata,
-                    settings=settings,
-                )
-                plan_result = upgrade_planner.generate_plan(config)
-            except upgrade_planner.PlannerError as exc:
-                planner_run = PlannerRun(exit_code=2, plan=None, error=str(exc))
-                planner_reason = str(exc)
-            except Exception as exc:  # pragma: no cover - defensive telemetry path
-                span.record_exception(exc)
-                span.set_status(Status(StatusCode.ERROR))
-                STATUS_RUN_COUNTER.labels(outcome="error").inc()
-                raise
+
+        try:
+            if planner_reason is not None:
+                guard_run = _run_guard_stage(**guard_kwargs)
+            elif settings.parallel:
+                # Each stage gets a copy of the context so its spans nest here
+                with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+                    guard_future = pool.submit(
+                        contextvars.copy_context().run,
+                        lambda: _run_guard_stage(**guard_kwargs),
+                    )
+                    planner_future = pool.submit(
+                        contextvars.copy_context().run,
+                        lambda: _run_planner_stage(
+                            sbom=sbom, metadata=metadata, settings=settings
+                        ),
+                    )
+                    guard_run = guard_future.result()
+                    planner_run, planner_reason = planner_future.result()
             else:
-                planner_run = PlannerRun(
-                    exit_code=plan_result.exit_code,
-                    plan=plan_result.to_dict(),
-                )
-                span.set_attribute(
-                    "deps_status.planner_exit_code", int(plan_result.exit_code)
-                )
-                span.set_attribute(
-                    "deps_status.planner_commands",
-                    len(planner_run.recommended_commands),
-                )
-            finally:
-                STATUS_STAGE_DURATION.labels(stage="planner").observe(
-                    time.perf_counter() - planner_start
+                guard_run = _run_guard_stage(**guard_kwargs)
+                planner_run, planner_reason = _run_planner_stage(
+                    sbom=sbom, metadata=metadata, settings=settings
                 )
+        except Exception as exc:  # pragma: no cover - defensive telemetry path
+            span.record_exception(exc)
+            span.set_status(Status(StatusCode.ERROR))
+            _count_run("error")
+            raise
 
+        span.set_attribute("deps_status.guard_exit_code", int(guard_run.exit_code))
+        if planner_run is not None and planner_run.error is None:
+            span.set_attribute(
+                "deps_status.planner_exit_code", int(planner_run.exit_code)
+            )
+            span.set_attribute(
+                "deps_status.planner_commands",
+                len(planner_run.recommended_commands),
+            )
         span.set_attribute("deps_status.planner_reason", planner_reason or "")
 
         exit_code, summary = _merge_summary(
@@ -382,10 +431,7 @@ def generate_status(
         span.set_attribute("deps_status.exit_code", int(exit_code))
         if exit_code != 0:
             span.set_status(Status(StatusCode.ERROR))
-        STATUS_RUN_COUNTER.labels(outcome=outcome).inc()
-        STATUS_STAGE_DURATION.labels(stage="total").observe(
-            time.perf_counter() - total_start
-        )
+        _count_run(outcome)
 
         return DependencyStatus(
             generated_at=moment,
@@ -8,18 +8,165 @@ with CI gate integration.
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import hashlib
 import json
 import logging
+import os
 import shutil
 import subprocess
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+# ijson streams large OSV reports result by result; json is the fallback
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore[assignment]
+
+# orjson parses large OSV reports in C; json is the fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data: str | bytes) -> Any:
+    """Parse JSON text or UTF-8 bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_indented(data: Any) -> bytes:
+    """Serialize ``data`` as two-space indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _default_osv_cache_dir() -> Path:
+    """Return the per-user OSV report cache, honouring ``XDG_CACHE_HOME``."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "chiron" / "osv"
+
+
+def _ensure_private_dir(path: Path) -> bool:
+    """Create ``path`` with mode 0700 and check that only we can use it.
+
+    A cache directory another user can write to could feed us forged
+    reports, so such a directory is never read from or written to.
+    """
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = path.stat()
+    except OSError as e:
+        logger.debug(f"OSV scan cache unavailable: {e}")
+        return False
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+        logger.warning(f"Ignoring OSV scan cache not private to this user: {path}")
+        return False
+    return True
+
+
+# External tools are spawned with close_fds=False: Python opens descriptors
+# non-inheritable (PEP 446), so nothing leaks, and the child skips closing
+# every descriptor up to the fd limit. Their environment is limited to the
+# variables they need rather than the (often large) CI environment.
+_TOOL_ENV_VARS = (
+    "PATH",
+    "HOME",
+    "TMPDIR",
+    "LANG",
+    "LC_ALL",
+    "SYSTEMROOT",
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "NO_PROXY",
+    "http_proxy",
+    "https_proxy",
+    "no_proxy",
+    "SSL_CERT_FILE",
+    "SSL_CERT_DIR",
+    "REQUESTS_CA_BUNDLE",
+    "VIRTUAL_ENV",
+    "PYTHONPATH",
+    "PIP_INDEX_URL",
+    "PIP_EXTRA_INDEX_URL",
+)
+
+
+def _tool_env() -> dict[str, str]:
+    """Build a minimal environment for cyclonedx-py and osv-scanner."""
+    env = os.environ
+    return {name: env[name] for name in _TOOL_ENV_VARS if name in env}
+
+
+@lru_cache(maxsize=8)
+def _resolve_tool(name: str) -> str | None:
+    """Locate an external tool on PATH once per process.
+
+    Call ``_resolve_tool.cache_clear()`` after changing PATH.
+    """
+    return shutil.which(name)
+
+
+# Exact (lower-cased) severity labels used by OSV databases
+_SEVERITY_BUCKETS = {
+    "critical": "critical",
+    "high": "high",
+    "medium": "medium",
+    "moderate": "medium",
+    "low": "low",
+}
+
+
+def _severity_bucket(severity: object) -> str | None:
+    """Map an OSV severity value to critical/high/medium/low, or None."""
+    text = severity.lower() if isinstance(severity, str) else str(severity).lower()
+    bucket = _SEVERITY_BUCKETS.get(text)
+    if bucket is not None:
+        return bucket
+
+    # Free-form values, e.g. "HIGH (CVSS 7.5)": fall back to a substring scan
+    if "critical" in text:
+        return "critical"
+    if "high" in text:
+        return "high"
+    if "medium" in text or "moderate" in text:
+        return "medium"
+    if "low" in text:
+        return "low"
+    return None
+
+
+def _vulnerability_severity(vuln: dict[str, Any]) -> Any:
+    """Return the severity recorded for an OSV vulnerability entry."""
+    severity = vuln.get("severity", "")
+    if not severity:
+        # Try to infer from CVSS score or other fields
+        database_specific = vuln.get("database_specific", {})
+        severity = database_specific.get("severity", "unknown")
+    return severity
+
+
+# Gate ranks; 0 means no findings
+_SEVERITY_RANKS = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+
+
 @dataclass(slots=True)
 class VulnerabilitySummary:
     """Summary of vulnerability scan results."""
@@ -32,27 +179,46 @@ class VulnerabilitySummary:
     packages_affected: list[str] = field(default_factory=list)
     scan_timestamp: str = ""
 
+    def _max_severity_rank(self) -> int:
+        """Rank of the most severe finding in the current counts, 0 for none."""
+        if self.critical:
+            return _SEVERITY_RANKS["critical"]
+        if self.high:
+            return _SEVERITY_RANKS["high"]
+        if self.medium:
+            return _SEVERITY_RANKS["medium"]
+        if self.low:
+            return _SEVERITY_RANKS["low"]
+        return 0
+
     def has_blocking_vulnerabilities(self, max_severity: str = "high") -> bool:
         """
         Check if there are blocking vulnerabilities.
 
+        Vulnerabilities at or above ``max_severity`` block, e.g. 'high'
+        blocks on high and critical findings.
+
         Args:
-            max_severity: Maximum allowed severity ('critical', 'high', 'medium', 'low')
+            max_severity: Gate severity ('critical', 'high', 'medium', 'low')
 
         Returns:
             True if blocking vulnerabilities found
         """
-        severity_order = {"critical": 3, "high": 2, "medium": 1, "low": 0}
-        threshold = severity_order.get(max_severity, 2)
+        threshold = _SEVERITY_RANKS.get(max_severity, _SEVERITY_RANKS["high"])
+        return self._max_severity_rank() >= threshold
 
-        if threshold >= 3 and self.critical > 0:
-            return True
-        if threshold >= 2 and self.high > 0:
-            return True
-        if threshold >= 1 and self.medium > 0:
-            return True
 
-        return False
+class _TeeReader:
+    """Binary reader that copies everything read from it into ``sink``."""
+
+    def __init__(self, source: IO[bytes], sink: IO[bytes]) -> None:
+        self._source = source
+        self._sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self._sink.write(data)
+        return data
 
 
 class SBOMGenerator:
@@ -60,6 +226,7 @@ class SBOMGenerator:
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
+        self._project_root_str = os.fspath(project_root)
 
     def generate(
         self,
@@ -76,10 +243,10 @@ class SBOMGenerator:
         Returns:
             True if successful, False otherwise
         """
-        cyclonedx = shutil.which("cyclonedx-py")
+        cyclonedx = _resolve_tool("cyclonedx-py")
         if not cyclonedx:
             logger.error(
-                "cyclonedx-py not found. " "Install with: pip install cyclonedx-bom"
+                "cyclonedx-py not found. Install with: pip install cyclonedx-bom"
             )
             return False
 
@@ -88,22 +255,26 @@ class SBOMGenerator:
             "--format",
             format,
             "-o",
-            str(output_path),
-            str(self.project_root),
+            os.fspath(output_path),
+            self._project_root_str,
         ]
 
         try:
             logger.info(f"Generating SBOM: {output_path}")
+            # The SBOM goes to output_path; only stderr is kept for errors
             result = subprocess.run(
                 cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
+                cwd=self._project_root_str,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                env=_tool_env(),
+                close_fds=False,
                 check=False,
             )
 
             if result.returncode != 0:
-                logger.error(f"SBOM generation failed: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", errors="replace")
+                logger.error(f"SBOM generation failed: {stderr}")
                 return False
 
             if not output_path.exists():
@@ -121,8 +292,32 @@ class SBOMGenerator:
 class OSVScanner:
     """Scan for vulnerabilities using OSV."""
 
-    def __init__(self, project_root: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        *,
+        use_cache: bool = False,
+        cache_dir: Path | None = None,
+        cache_ttl_days: float = 1.0,
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            project_root: Root directory of the project
+            use_cache: Reuse reports for unchanged lockfiles. Off by default,
+                since a cached report can miss advisories published since
+            cache_dir: Report cache directory, which must be private to the
+                current user (default: ``$XDG_CACHE_HOME/chiron/osv``)
+            cache_ttl_days: Age after which a cached report is rescanned
+        """
         self.project_root = project_root
+        self._project_root_str = os.fspath(project_root)
+        self.use_cache = use_cache
+        self.cache_dir = (
+            cache_dir if cache_dir is not None else _default_osv_cache_dir()
+        )
+        self.cache_ttl_days = cache_ttl_days
 
     def scan_lockfile(
         self,
@@ -132,6 +327,10 @@ class OSVScanner:
         """
         Scan a lockfile for vulnerabilities.
 
+        With ``use_cache``, reports are cached by lockfile content, so
+        rescanning an unchanged lockfile within the cache TTL does not run
+        osv-scanner again.
+
         Args:
             lockfile_path: Path to lockfile (requirements.txt, poetry.lock, etc.)
             output_path: Optional path to save JSON report
@@ -139,45 +338,50 @@ class OSVScanner:
         Returns:
             VulnerabilitySummary or None if scan failed
         """
-        osv_scanner = shutil.which("osv-scanner")
-        if not osv_scanner:
-            logger.error(
-                "osv-scanner not found. "
-                "Install from: https://github.com/google/osv-scanner"
-            )
-            return None
+        cache_key = self._cache_key(lockfile_path)
+        cached = self._read_cache(cache_key)
+
+        if cached is None:
+            osv_scanner = _resolve_tool("osv-scanner")
+            if not osv_scanner:
+                logger.error(
+                    "osv-scanner not found. "
+                    "Install from: https://github.com/google/osv-scanner"
+                )
+                return None
 
-        cmd = [
-            osv_scanner,
-            "--lockfile",
-            str(lockfile_path),
-            "--format",
-            "json",
-        ]
+            cmd = [
+                osv_scanner,
+                "--lockfile",
+                os.fspath(lockfile_path),
+                "--format",
+                "json",
+            ]
 
         try:
-            logger.info(f"Scanning {lockfile_path} for vulnerabilities...")
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-            # OSV scanner returns non-zero if vulnerabilities found
-            if result.stdout:
-                scan_data = json.loads(result.stdout)
+            if cached is not None:
+                logger.info(f"Using cached vulnerability scan of {lockfile_path}")
+                summary = self._summarize_report(cached, output_path)
+            elif output_path is None and ijson is not None:
+                logger.info(f"Scanning {lockfile_path} for vulnerabilities...")
+                # Nothing to save, so summarize straight off the pipe
+                summary = self._scan_streaming(cmd, cache_key)
             else:
-                scan_data = {"results": []}
-
-            # Save report if requested
-            if output_path:
-                output_path.write_text(json.dumps(scan_data, indent=2))
-                logger.info(f"Saved vulnerability report: {output_path}")
-
-            # Parse results
-            summary = self._parse_results(scan_data)
+                logger.info(f"Scanning {lockfile_path} for vulnerabilities...")
+                # OSV scanner returns non-zero if vulnerabilities found
+                result = subprocess.run(
+                    cmd,
+                    cwd=self._project_root_str,
+                    capture_output=True,
+                    env=_tool_env(),
+                    close_fds=False,
+                    check=False,
+                )
+                summary = self._summarize_report(result.stdout, output_path)
+                if result.stdout and cache_key is not None:
+                    with self._cache_writer(cache_key) as sink:
+                        if sink is not None:
+                            sink.write(result.stdout)
 
             if summary.total_vulnerabilities > 0:
                 logger.warning(
@@ -194,14 +398,150 @@ class OSVScanner:
             logger.error(f"Error scanning for vulnerabilities: {e}")
             return None
 
+    def _summarize_report(
+        self, report: bytes, output_path: Path | None
+    ) -> VulnerabilitySummary:
+        """Parse a raw osv-scanner report, saving it to ``output_path`` if set."""
+        scan_data = _json_loads(report) if report else {"results": []}
+
+        # Save report if requested
+        if output_path:
+            output_path.write_bytes(_json_dumps_indented(scan_data))
+            logger.info(f"Saved vulnerability report: {output_path}")
+
+        return self._parse_results(scan_data)
+
+    def _cache_key(self, lockfile_path: Path) -> str | None:
+        """Hash the lockfile name and content, or None when not caching."""
+        if not self.use_cache or not _ensure_private_dir(self.cache_dir):
+            return None
+        try:
+            content = lockfile_path.read_bytes()
+        except OSError:
+            return None
+        # The name matters too: osv-scanner picks its parser from it
+        digest = hashlib.blake2b(lockfile_path.name.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _read_cache(self, cache_key: str | None) -> bytes | None:
+        """Return a cached report younger than the TTL, if any."""
+        if cache_key is None:
+            return None
+        path = self.cache_dir / f"{cache_key}.json"
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.cache_ttl_days * 86400:
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    @contextlib.contextmanager
+    def _cache_writer(self, cache_key: str) -> Iterator[IO[bytes] | None]:
+        """Yield a file whose content replaces the cached report on success.
+
+        Writes go to a temporary file that is moved into place atomically, so
+        concurrent readers never see a partial report. Yields None when the
+        cache directory is unusable; caching never fails a scan.
+        """
+        try:
+            handle = tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, suffix=".tmp", delete=False
+            )
+        except OSError as e:
+            logger.debug(f"OSV scan cache unavailable: {e}")
+            yield None
+            return
+
+        try:
+            with handle:
+                yield handle
+            os.replace(handle.name, self.cache_dir / f"{cache_key}.json")
+        except OSError as e:
+            logger.debug(f"Could not cache OSV scan: {e}")
+            Path(handle.name).unlink(missing_ok=True)
+        except BaseException:
+            Path(handle.name).unlink(missing_ok=True)
+            raise
+
+    def scan_lockfiles(
+        self,
+        lockfiles: Sequence[Path],
+        *,
+        max_parallel: int = 4,
+    ) -> dict[Path, VulnerabilitySummary | None]:
+        """
+        Scan several lockfiles concurrently.
+
+        Each scan waits on its own osv-scanner process, so threads suffice.
+        Use ``_merge_summaries`` to combine the results into one gate input.
+
+        Args:
+            lockfiles: Lockfiles to scan
+            max_parallel: Maximum number of scans running at once
+
+        Returns:
+            Mapping of lockfile to its summary, or None where the scan failed
+        """
+        if not lockfiles:
+            return {}
+
+        workers = max(1, min(max_parallel, len(lockfiles)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            summaries = list(pool.map(self.scan_lockfile, lockfiles))
+        return dict(zip(lockfiles, summaries, strict=True))
+
+    def _scan_streaming(
+        self, cmd: list[str], cache_key: str | None = None
+    ) -> VulnerabilitySummary:
+        """Run osv-scanner and summarize its report as it is read.
+
+        Only one ``results`` entry is held in memory at a time instead of
+        the whole report. With a ``cache_key`` the raw report is copied to
+        the cache as it streams past.
+        """
+        with subprocess.Popen(
+            cmd,
+            cwd=self._project_root_str,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_tool_env(),
+            close_fds=False,
+        ) as process:
+            if process.stdout is None:
+                raise RuntimeError("scanner stdout pipe was not opened")
+            if not process.stdout.peek(1):  # no report at all
+                return self._summarize_results([])
+            if cache_key is None:
+                return self._summarize_results(
+                    ijson.items(process.stdout, "results.item", use_float=True)
+                )
+
+            with self._cache_writer(cache_key) as sink:
+                stream: IO[bytes] = process.stdout
+                if sink is not None:
+                    stream = _TeeReader(process.stdout, sink)
+                summary = self._summarize_results(
+                    ijson.items(stream, "results.item", use_float=True)
+                )
+                # Copy whatever follows the results array too
+                while stream.read(_STREAM_CHUNK_SIZE):
+                    pass
+            return summary
+
     def _parse_results(self, scan_data: dict[str, Any]) -> VulnerabilitySummary:
         """Parse OSV scan results into summary."""
-        summary = VulnerabilitySummary(
-            scan_timestamp=datetime.now(UTC).isoformat(),
-        )
+        return self._summarize_results(scan_data.get("results", []))
 
-        results = scan_data.get("results", [])
+    def _summarize_results(
+        self, results: Iterable[dict[str, Any]]
+    ) -> VulnerabilitySummary:
+        """Summarize the entries of an OSV report's ``results`` array."""
         packages_affected = set()
+        # Keyed by _severity_bucket; None counts vulnerabilities without one
+        buckets: Counter[str | None] = Counter()
 
         for result in results:
             packages = result.get("packages", [])
@@ -210,31 +550,48 @@ class OSVScanner:
                 packages_affected.add(pkg_name)
 
                 vulnerabilities = pkg.get("vulnerabilities", [])
-                for vuln in vulnerabilities:
-                    summary.total_vulnerabilities += 1
-
-                    # Try to determine severity
-                    severity = vuln.get("severity", "")
-                    if not severity:
-                        # Try to infer from CVSS score or other fields
-                        database_specific = vuln.get("database_specific", {})
-                        severity = database_specific.get("severity", "unknown")
-
-                    severity_lower = str(severity).lower()
-                    if "critical" in severity_lower:
-                        summary.critical += 1
-                    elif "high" in severity_lower:
-                        summary.high += 1
-                    elif "medium" in severity_lower or "moderate" in severity_lower:
-                        summary.medium += 1
-                    elif "low" in severity_lower:
-                        summary.low += 1
-
-        summary.packages_affected = sorted(packages_affected)
+                buckets.update(
+                    _severity_bucket(_vulnerability_severity(vuln))
+                    for vuln in vulnerabilities
+                )
+
+        summary = VulnerabilitySummary(
+            total_vulnerabilities=sum(buckets.values()),
+            critical=buckets["critical"],
+            high=buckets["high"],
+            medium=buckets["medium"],
+            low=buckets["low"],
+            packages_affected=sorted(packages_affected),
+            scan_timestamp=datetime.now(UTC).isoformat(),
+        )
 
         return summary
 
 
+def _merge_summaries(summaries: Iterable[VulnerabilitySummary]) -> VulnerabilitySummary:
+    """Combine per-lockfile summaries into one, keeping the latest timestamp."""
+    total = critical = high = medium = low = 0
+    affected: set[str] = set()
+    scan_timestamp = ""
+    for summary in summaries:
+        total += summary.total_vulnerabilities
+        critical += summary.critical
+        high += summary.high
+        medium += summary.medium
+        low += summary.low
+        affected.update(summary.packages_affected)
+        scan_timestamp = max(scan_timestamp, summary.scan_timestamp)
+    return VulnerabilitySummary(
+        total_vulnerabilities=total,
+        critical=critical,
+        high=high,
+        medium=medium,
+        low=low,
+        packages_affected=sorted(affected),
+        scan_timestamp=scan_timestamp,
+    )
+
+
 def generate_sbom_and_scan(
     project_root: Path,
     sbom_output: Path,
@@ -250,7 +607,8 @@ def generate_sbom_and_scan(
         sbom_output: Path for SBOM output
         osv_output: Path for OSV scan output
         lockfile_path: Path to lockfile to scan
-        gate_max_severity: Maximum severity to allow ('critical', 'high', 'medium', 'low')
+        gate_max_severity: Severity at or above which the gate fails
+            ('critical', 'high', 'medium', 'low')
 
     Returns:
         Tuple of (success, vulnerability_summary)
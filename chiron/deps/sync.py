@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import sys
@@ -11,11 +12,18 @@ import tomllib
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from operator import attrgetter
 from pathlib import Path
 
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
+# tomli ships compiled (mypyc) wheels; the pure-Python tomllib is the fallback
+try:
+    import tomli
+except ImportError:  # pragma: no cover - optional dependency
+    tomli = None  # type: ignore[assignment]
+
 DEFAULT_REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CONTRACT_PATH = DEFAULT_REPO_ROOT / "configs" / "dependency-profile.toml"
 DEFAULT_ROOT_CONSTRAINTS = DEFAULT_REPO_ROOT / "constraints" / "runtime-roots.txt"
@@ -37,9 +45,25 @@ class ManifestWriteError(RuntimeError):
     """Raised when output manifests cannot be written safely."""
 
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def _cached_specifier(spec: str) -> SpecifierSet:
+    """Parse a specifier set once per distinct string."""
+    return SpecifierSet(spec)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_version(version: str) -> Version:
+    """Parse a version once per distinct string."""
+    return Version(version)
+
+
+@dataclass(frozen=True, slots=True)
 class PackageRecord:
-    """Structured package entry loaded from the dependency contract."""
+    """Structured package entry loaded from the dependency contract.
+
+    Records are immutable, so rendered requirement strings are cached on the
+    instance (through ``object.__setattr__``).
+    """
 
     name: str
     profile: str
@@ -50,6 +74,19 @@ class PackageRecord:
     owner: str | None = None
     status: str | None = None
     notes: str | None = None
+    # Case-folded sort keys, computed once per record
+    name_cf: str = field(init=False, repr=False, compare=False)
+    marker_cf: str = field(init=False, repr=False, compare=False)
+    _formatted_name: str = field(init=False, repr=False, compare=False)
+    _req_locked: str | None = field(default=None, init=False, repr=False, compare=False)
+    _req_unlocked: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name_cf", self.name.casefold())
+        object.__setattr__(self, "marker_cf", (self.marker or "").casefold())
+        object.__setattr__(self, "_formatted_name", self._format_name())
 
     def requirement(self, prefer_locked: bool = True) -> str:
         """Render the package as a requirement string."""
@@ -62,23 +99,32 @@ class PackageRecord:
     def requirement_without_marker(self, prefer_locked: bool = True) -> str:
         """Render requirement without appending an environment marker."""
 
-        base = self._format_name()
+        cached = self._req_locked if prefer_locked else self._req_unlocked
+        if cached is not None:
+            return cached
+
+        base = self._formatted_name
         if prefer_locked and self.locked:
-            return f"{base}=={self.locked}"
-        if self.constraint:
-            return f"{base}{self.constraint}"
-        if self.locked:
-            return f"{base}=={self.locked}"
-        message = f"Package {self.name!r} is missing constraint and locked version."
-        raise ContractError(message)
+            rendered = f"{base}=={self.locked}"
+        elif self.constraint:
+            rendered = f"{base}{self.constraint}"
+        elif self.locked:
+            rendered = f"{base}=={self.locked}"
+        else:
+            message = f"Package {self.name!r} is missing constraint and locked version."
+            raise ContractError(message)
+
+        object.__setattr__(
+            self, "_req_locked" if prefer_locked else "_req_unlocked", rendered
+        )
+        return rendered
 
     def constraint_satisfied(self) -> bool:
         """Whether the locked version satisfies the declared constraint."""
 
         if not (self.constraint and self.locked):
             return True
-        spec = SpecifierSet(self.constraint)
-        return Version(self.locked) in spec
+        return _cached_version(self.locked) in _cached_specifier(self.constraint)
 
     def _format_name(self) -> str:
         if self.extras:
@@ -87,7 +133,7 @@ class PackageRecord:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     """Profile grouping from the contract (runtime, optional extras, etc)."""
 
@@ -101,14 +147,14 @@ class Profile:
         return str(value) if value is not None else None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PyprojectBlock:
     dependencies: list[str]
     optional: dict[str, list[str]]
     dev_group: dict[str, str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ManifestBundle:
     pyproject: PyprojectBlock
     constraints_lines: list[str]
@@ -144,6 +190,7 @@ class DependencyContract:
             for profile in self._profiles.values()
             for package in profile.packages
         )
+        self._deduped_sorted: tuple[PackageRecord, ...] | None = None
 
     @property
     def source(self) -> Path:
@@ -183,20 +230,45 @@ class DependencyContract:
                     )
         return warnings
 
+    def _sorted_unique_packages(self) -> tuple[PackageRecord, ...]:
+        """Packages deduplicated by name and marker, sorted case-insensitively.
+
+        Computed on first use and shared by the manifest builders.
+        """
+        if self._deduped_sorted is None:
+            self._deduped_sorted = tuple(
+                sorted(
+                    _dedupe_by_name(self.packages),
+                    key=attrgetter("name_cf", "marker_cf"),
+                )
+            )
+        return self._deduped_sorted
+
     def to_manifests(self) -> ManifestBundle:
         pyproject = self._build_pyproject_block()
-        constraints_lines = self._build_constraints_lines()
-        dist_lines = self._build_dist_lines()
-        wheelhouse_lines = self._build_wheelhouse_lines()
+        locked_lines, dist_body = self._build_all_lines()
+        constraints_lines = [GENERATED_HEADER, "# Do not edit by hand.", *locked_lines]
+        dist_lines = [
+            GENERATED_HEADER,
+            "# Pinned requirements for dist artifacts.",
+            *dist_body,
+        ]
+        wheelhouse_lines = [
+            GENERATED_HEADER,
+            "# Wheelhouse manifest pinned to locked versions.",
+            *locked_lines,
+        ]
         root_constraints = [
             GENERATED_HEADER,
             "# Contract-managed root constraint pins.",
+            *locked_lines,
+        ]
+        root_dist = [GENERATED_HEADER, "# Contract-managed root dist pins.", *dist_body]
+        root_wheelhouse = [
+            GENERATED_HEADER,
+            "# Contract-managed root wheelhouse pins.",
+            *locked_lines,
         ]
-        root_constraints.extend(constraints_lines[2:])
-        root_dist = [GENERATED_HEADER, "# Contract-managed root dist pins."]
-        root_dist.extend(dist_lines[2:])
-        root_wheelhouse = [GENERATED_HEADER, "# Contract-managed root wheelhouse pins."]
-        root_wheelhouse.extend(wheelhouse_lines[2:])
         warnings = self.collect_warnings()
         return ManifestBundle(
             pyproject=pyproject,
@@ -289,70 +361,38 @@ class DependencyContract:
             optional[extra_name] = requirements
 
         dev_profile = self.get_profile("dev_tooling")
-        dev_group: dict[str, str] = {}
+        dev_packages: dict[str, PackageRecord] = {}
         if dev_profile:
             for pkg in dev_profile.packages:
-                dev_group[pkg.name] = pkg.requirement()
+                dev_packages[pkg.name] = pkg
 
         return PyprojectBlock(
             dependencies=runtime_reqs,
             optional=optional,
-            dev_group=dict(
-                sorted(dev_group.items(), key=lambda item: item[0].casefold())
-            ),
+            dev_group={
+                pkg.name: pkg.requirement()
+                for pkg in sorted(dev_packages.values(), key=attrgetter("name_cf"))
+            },
         )
 
-    def _build_constraints_lines(self) -> list[str]:
-        packages = _dedupe_by_name(self.packages)
-        lines: list[str] = [GENERATED_HEADER, "# Do not edit by hand."]
-        for package in sorted(
-            packages,
-            key=lambda item: (item.name.casefold(), (item.marker or "").casefold()),
-        ):
-            if not package.locked:
-                continue
-            line = package.requirement()
-            suffix = _format_status_comment(package)
-            if suffix:
-                line = f"{line}  {suffix}"
-            lines.append(line)
-        return lines
-
-    def _build_dist_lines(self) -> list[str]:
-        packages = _dedupe_by_name(self.packages)
-        lines: list[str] = [
-            GENERATED_HEADER,
-            "# Pinned requirements for dist artifacts.",
-        ]
-        for package in sorted(
-            packages,
-            key=lambda item: (item.name.casefold(), (item.marker or "").casefold()),
-        ):
-            requirement = package.requirement()
-            suffix = _format_status_comment(package)
-            if suffix:
-                requirement = f"{requirement}  {suffix}"
-            lines.append(requirement)
-        return lines
+    def _build_all_lines(self) -> tuple[list[str], list[str]]:
+        """Render manifest bodies in one pass over the sorted packages.
 
-    def _build_wheelhouse_lines(self) -> list[str]:
-        packages = _dedupe_by_name(self.packages)
-        lines: list[str] = [
-            GENERATED_HEADER,
-            "# Wheelhouse manifest pinned to locked versions.",
-        ]
-        for package in sorted(
-            packages,
-            key=lambda item: (item.name.casefold(), (item.marker or "").casefold()),
-        ):
-            if not package.locked:
-                continue
+        Returns:
+            Tuple of (locked lines, dist lines). Constraints and wheelhouse
+            manifests list locked packages only; dist lists every package.
+        """
+        locked_lines: list[str] = []
+        dist_lines: list[str] = []
+        for package in self._sorted_unique_packages():
             line = package.requirement()
             suffix = _format_status_comment(package)
             if suffix:
                 line = f"{line}  {suffix}"
-            lines.append(line)
-        return lines
+            dist_lines.append(line)
+            if package.locked:
+                locked_lines.append(line)
+        return locked_lines, dist_lines
 
 
 def _dedupe_by_name(packages: Iterable[PackageRecord]) -> list[PackageRecord]:
@@ -422,7 +462,7 @@ def _render_cyclonedx_sbom(contract: DependencyContract) -> str:
     generated = datetime.now(UTC).isoformat()
     components = [
         _package_to_component(package)
-        for package in sorted(deduped, key=lambda item: item.name.casefold())
+        for package in sorted(deduped, key=attrgetter("name_cf"))
     ]
     sbom = {
         "bomFormat": "CycloneDX",
@@ -568,8 +608,18 @@ def _configure_logging(verbose: bool) -> None:
 
 
 def _load_contract(path: Path) -> Mapping[str, object]:
+    """Parse the contract, reusing the result while the file is unchanged.
+
+    The returned mapping is shared between callers and must not be mutated.
+    """
+    return _load_contract_cached(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_contract_cached(path: Path, mtime_ns: int) -> Mapping[str, object]:
+    parser = tomli if tomli is not None else tomllib
     with path.open("rb") as handler:
-        return tomllib.load(handler)
+        return parser.load(handler)
 
 
 def _ensure_parent(path: Path) -> None:
@@ -1,10 +1,13 @@
 """Tests for policy engine."""
 
+import tomllib
+from dataclasses import FrozenInstanceError
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
 
+import chiron.deps.policy as policy_module
 from chiron.deps.policy import (
     DependencyPolicy,
     PackagePolicy,
@@ -84,6 +87,23 @@ def test_policy_violation_creation():
     assert violation.severity == "warning"
 
 
+def test_policy_records_are_frozen():
+    """Test PackagePolicy and PolicyViolation are immutable."""
+    policy = PackagePolicy(name="numpy")
+    violation = PolicyViolation(
+        package="numpy",
+        current_version="1.0.0",
+        target_version="2.0.0",
+        violation_type="version_denied",
+        message="denied",
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        policy.allowed = False  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        violation.severity = "info"  # type: ignore[misc]
+
+
 def test_dependency_policy_defaults():
     """Test DependencyPolicy default values."""
     policy = DependencyPolicy()
@@ -201,6 +221,18 @@ def test_check_upgrade_allowed_major_jump(basic_policy: DependencyPolicy):
     assert any(v.violation_type == "major_version_jump" for v in violations)
 
 
+def test_check_upgrade_fast_lane_skips_package_checks(basic_policy: DependencyPolicy):
+    """Test unregulated packages only run the major-jump check."""
+    engine = PolicyEngine(basic_policy)
+    engine.check_package_allowed = None  # type: ignore[assignment]
+    engine.check_version_allowed = None  # type: ignore[assignment]
+
+    assert engine.check_upgrade_allowed("requests", "2.28.0", "2.29.0") == []
+    violations = engine.check_upgrade_allowed("requests", "2.28.0", "4.0.0")
+    assert [v.violation_type for v in violations] == ["major_version_jump"]
+    assert engine.check_upgrade_allowed("requests", "bogus", "4.0.0") == []
+
+
 def test_check_upgrade_denied_package():
     """Test upgrade for denied package."""
     policy = DependencyPolicy()
@@ -234,6 +266,18 @@ def test_check_upgrade_denied_version():
     assert any(v.violation_type == "version_denied" for v in violations)
 
 
+def test_check_upgrade_invalid_target_version():
+    """Test upgrade to an unparseable version is denied."""
+    policy = DependencyPolicy()
+    policy.allowlist["pkg"] = PackagePolicy(name="pkg")
+
+    engine = PolicyEngine(policy)
+
+    violations = engine.check_upgrade_allowed("pkg", "1.0.0", "not-a-version")
+
+    assert any(v.violation_type == "version_denied" for v in violations)
+
+
 def test_check_upgrade_requires_review():
     """Test upgrade requiring review."""
     policy = DependencyPolicy()
@@ -257,6 +301,7 @@ def test_check_upgrade_requires_review():
 
 def test_record_upgrade(basic_policy: DependencyPolicy):
     """Test recording upgrade timestamp."""
+    basic_policy.default_upgrade_cadence_days = 30
     engine = PolicyEngine(basic_policy)
 
     before = datetime.now(UTC)
@@ -268,6 +313,17 @@ def test_record_upgrade(basic_policy: DependencyPolicy):
     assert before <= timestamp <= after
 
 
+def test_record_upgrade_without_cadence(policy_with_packages: DependencyPolicy):
+    """Test upgrades are only recorded when a cadence applies."""
+    engine = PolicyEngine(policy_with_packages)
+
+    engine.record_upgrade("requests")
+    engine.record_upgrade("numpy")
+
+    assert "requests" not in engine._last_upgrade_timestamps
+    assert "numpy" in engine._last_upgrade_timestamps
+
+
 def test_load_policy_defaults(tmp_path: Path):
     """Test loading policy with defaults when file not found."""
     config_path = tmp_path / "nonexistent.toml"
@@ -316,6 +372,43 @@ reason = "Security issue"
     assert "bad-pkg" in policy.denylist
 
 
+def test_load_policy_from_toml_without_msgspec(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test the tomllib fallback matches the typed decoder."""
+    config_path = tmp_path / "policy.toml"
+    config_path.write_text(
+        """
+[dependency_policy]
+default_upgrade_cadence_days = 14
+
+[dependency_policy.allowlist.numpy]
+version_ceiling = "2.0.0"
+blocked_versions = ["1.26.0"]
+
+[dependency_policy.denylist.bad-pkg]
+"""
+    )
+
+    typed = DependencyPolicy.from_toml(config_path)
+    monkeypatch.setattr(policy_module, "msgspec", None)
+    fallback = DependencyPolicy.from_toml(config_path)
+
+    assert typed == fallback
+    assert fallback.default_upgrade_cadence_days == 14
+    assert fallback.allowlist["numpy"].blocked_versions == ["1.26.0"]
+    assert fallback.denylist["bad-pkg"].reason == "Package denied by policy"
+
+
+def test_policy_from_toml_malformed_raises_toml_error(tmp_path: Path):
+    """Test malformed TOML raises tomllib's error whichever decoder runs first."""
+    config_path = tmp_path / "policy.toml"
+    config_path.write_text("x = [\n")
+
+    with pytest.raises(tomllib.TOMLDecodeError):
+        DependencyPolicy.from_toml(config_path)
+
+
 def test_convenience_function_load_policy(tmp_path: Path):
     """Test load_policy convenience function."""
     config_path = tmp_path / "policy.toml"
@@ -1,5 +1,7 @@
 """Tests for private mirror setup."""
 
+import socket
+import subprocess
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -111,6 +113,31 @@ def test_init_server(mock_run, mirror_config, tmp_path):
     assert result is True
 
 
+def test_wait_for_port_ready(mirror_config):
+    """Test readiness polling succeeds once the port is listening."""
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        mirror_config.host = "127.0.0.1"
+        mirror_config.port = server.getsockname()[1]
+
+        manager = DevpiMirrorManager(mirror_config)
+
+        assert manager._wait_for_port(timeout=1.0) is True
+
+
+def test_wait_for_port_timeout(mirror_config):
+    """Test readiness polling gives up when nothing is listening."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        mirror_config.port = probe.getsockname()[1]
+    mirror_config.host = "127.0.0.1"
+
+    manager = DevpiMirrorManager(mirror_config)
+
+    assert manager._wait_for_port(timeout=0.2) is False
+
+
 @patch("chiron.deps.private_mirror.subprocess.run")
 def test_create_index(mock_run, mirror_config):
     """Test creating devpi index."""
@@ -125,12 +152,61 @@ def test_create_index(mock_run, mirror_config):
 @patch("chiron.deps.private_mirror.subprocess.run")
 def test_upload_wheelhouse(mock_run, mirror_config, wheelhouse_dir):
     """Test uploading wheelhouse to devpi."""
-    mock_run.return_value = Mock(returncode=0)
+    mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+    manager = DevpiMirrorManager(mirror_config)
+    result = manager.upload_wheelhouse(wheelhouse_dir)
+
+    assert result is True
+    # All wheels go through a single batch invocation
+    assert mock_run.call_count == 1
+    cmd = mock_run.call_args[0][0]
+    assert cmd[:4] == ["devpi", "upload", "--from-dir", str(wheelhouse_dir)]
+    assert sorted(cmd[4:]) == [
+        "package1-1.0.0-py3-none-any.whl",
+        "package2-2.0.0-py3-none-any.whl",
+    ]
+
+
+@patch("chiron.deps.private_mirror.subprocess.run")
+def test_upload_wheelhouse_batch_fallback(mock_run, mirror_config, wheelhouse_dir):
+    """Test per-wheel uploads when the batch upload fails."""
+    mock_run.side_effect = [
+        Mock(returncode=1, stdout="", stderr="unsupported"),
+        Mock(returncode=0),
+        Mock(returncode=0),
+    ]
+
+    manager = DevpiMirrorManager(mirror_config)
+    result = manager.upload_wheelhouse(wheelhouse_dir)
+
+    assert result is True
+    assert mock_run.call_count == 3
+
+
+@patch("chiron.deps.private_mirror.subprocess.run")
+def test_upload_wheelhouse_fallback_reports_failures(
+    mock_run, mirror_config, wheelhouse_dir, capsys
+):
+    """Test per-wheel fallback reports failures in sorted order."""
+
+    def fake_run(cmd, **kwargs):
+        if len(cmd) > 5:
+            return Mock(returncode=1, stdout="", stderr="unsupported")
+        if cmd[-1].startswith("package1"):
+            raise subprocess.CalledProcessError(1, cmd)
+        return Mock(returncode=0)
+
+    mock_run.side_effect = fake_run
 
     manager = DevpiMirrorManager(mirror_config)
     result = manager.upload_wheelhouse(wheelhouse_dir)
 
     assert result is True
+    lines = [line.strip() for line in capsys.readouterr().out.splitlines()]
+    status = [line for line in lines if line[:1] in {"✓", "✗"}]
+    assert status[0].startswith("✗ package1-1.0.0")
+    assert status[1] == "✓ package2-2.0.0-py3-none-any.whl"
 
 
 def test_upload_wheelhouse_no_dir(mirror_config, tmp_path):
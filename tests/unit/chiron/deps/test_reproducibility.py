@@ -1,5 +1,7 @@
 """Tests for binary reproducibility checks."""
 
+import hashlib
+import os
 import zipfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -10,6 +12,7 @@ from chiron.deps.reproducibility import (
     ReproducibilityChecker,
     ReproducibilityReport,
     WheelDigest,
+    _files_identical,
 )
 
 
@@ -77,6 +80,46 @@ def test_compute_wheel_digest(sample_wheel):
     assert digest.metadata["name"] == "sample"
 
 
+def test_compute_wheel_digest_reuses_hashing_handle(sample_wheel):
+    """Test metadata is read from the handle opened for hashing."""
+    checker = ReproducibilityChecker()
+
+    with patch(
+        "chiron.deps.reproducibility.zipfile.ZipFile", wraps=zipfile.ZipFile
+    ) as spy:
+        digest = checker.compute_wheel_digest(sample_wheel)
+
+    assert digest.metadata["name"] == "sample"
+    source = spy.call_args[0][0]
+    assert not isinstance(source, (str, Path))
+
+
+def test_compute_wheel_digest_matches_hashlib(sample_wheel):
+    """Test the wheel digest is a plain SHA-256 of the file."""
+    digest = ReproducibilityChecker().compute_wheel_digest(sample_wheel)
+
+    assert digest.sha256 == hashlib.sha256(sample_wheel.read_bytes()).hexdigest()
+    assert digest.size == sample_wheel.stat().st_size
+
+
+def test_compute_wheel_digests_batch(tmp_path, sample_wheel):
+    """Test batch hashing preserves order and matches single hashing."""
+    import shutil
+
+    wheels = []
+    for index in range(4):
+        copy = tmp_path / f"copy{index}-1.0.0-py3-none-any.whl"
+        shutil.copy(sample_wheel, copy)
+        wheels.append(copy)
+
+    checker = ReproducibilityChecker()
+    digests = checker.compute_wheel_digests_batch(wheels)
+
+    assert [d.filename for d in digests] == [w.name for w in wheels]
+    expected = checker.compute_wheel_digest(sample_wheel).sha256
+    assert all(d.sha256 == expected for d in digests)
+
+
 def test_compare_identical_wheels(sample_wheel):
     """Test comparing identical wheels."""
     checker = ReproducibilityChecker()
@@ -95,13 +138,15 @@ def test_compare_different_wheels(tmp_path, sample_wheel):
     # Create a modified version
     modified_wheel = tmp_path / "modified.whl"
 
-    with zipfile.ZipFile(sample_wheel, "r") as zf_in:
-        with zipfile.ZipFile(modified_wheel, "w") as zf_out:
-            for item in zf_in.infolist():
-                data = zf_in.read(item.filename)
-                if item.filename == "sample/__init__.py":
-                    data = b"# Modified module\n"
-                zf_out.writestr(item, data)
+    with (
+        zipfile.ZipFile(sample_wheel, "r") as zf_in,
+        zipfile.ZipFile(modified_wheel, "w") as zf_out,
+    ):
+        for item in zf_in.infolist():
+            data = zf_in.read(item.filename)
+            if item.filename == "sample/__init__.py":
+                data = b"# Modified module\n"
+            zf_out.writestr(item, data)
 
     checker = ReproducibilityChecker()
     report = checker.compare_wheels(sample_wheel, modified_wheel)
@@ -110,6 +155,101 @@ def test_compare_different_wheels(tmp_path, sample_wheel):
     assert len(report.differences) > 0
 
 
+def test_compare_wheels_opens_each_archive_once(tmp_path, sample_wheel):
+    """Test compare_wheels parses each central directory a single time."""
+    modified_wheel = tmp_path / "modified.whl"
+    with (
+        zipfile.ZipFile(sample_wheel, "r") as zf_in,
+        zipfile.ZipFile(modified_wheel, "w") as zf_out,
+    ):
+        for item in zf_in.infolist():
+            zf_out.writestr(item, zf_in.read(item.filename) + b"\n")
+
+    checker = ReproducibilityChecker()
+    with patch(
+        "chiron.deps.reproducibility.zipfile.ZipFile", wraps=zipfile.ZipFile
+    ) as spy:
+        report = checker.compare_wheels(sample_wheel, modified_wheel)
+
+    assert report.is_reproducible is False
+    assert spy.call_count == 2
+
+
+def test_analyze_differences_ignores_timestamps(tmp_path, sample_wheel):
+    """Test only entries whose content changed are reported."""
+    modified_wheel = tmp_path / "modified.whl"
+    with (
+        zipfile.ZipFile(sample_wheel, "r") as zf_in,
+        zipfile.ZipFile(modified_wheel, "w") as zf_out,
+    ):
+        for item in zf_in.infolist():
+            data = zf_in.read(item.filename)
+            if item.filename == "sample/__init__.py":
+                data = b"# Modified module\n"
+            restamped = zipfile.ZipInfo(item.filename, (2001, 2, 3, 4, 5, 6))
+            zf_out.writestr(restamped, data)
+
+    checker = ReproducibilityChecker()
+    with zipfile.ZipFile(sample_wheel) as zf1, zipfile.ZipFile(modified_wheel) as zf2:
+        differences = checker._analyze_differences(zf1, zf2)
+
+    assert differences == ["Different content: sample/__init__.py"]
+
+
+def test_compare_wheels_normalized_match(tmp_path, sample_wheel):
+    """Test wheels differing only in RECORD and timestamps match when normalized."""
+    rebuilt_wheel = tmp_path / "rebuilt.whl"
+    with (
+        zipfile.ZipFile(sample_wheel, "r") as zf_in,
+        zipfile.ZipFile(rebuilt_wheel, "w") as zf_out,
+    ):
+        for item in zf_in.infolist():
+            data = zf_in.read(item.filename)
+            if item.filename.endswith("/RECORD"):
+                data = b"sample/__init__.py,sha256=abc,16\n"
+            restamped = zipfile.ZipInfo(item.filename, (2001, 2, 3, 4, 5, 6))
+            zf_out.writestr(restamped, data)
+
+    checker = ReproducibilityChecker(normalize=True)
+    report = checker.compare_wheels(sample_wheel, rebuilt_wheel)
+
+    assert report.is_reproducible is False
+    assert report.normalized_match is True
+
+
+def test_compare_wheels_normalized_detects_metadata_change(tmp_path, sample_wheel):
+    """Test differing METADATA is never accepted as a normalized match."""
+    rebuilt_wheel = tmp_path / "rebuilt.whl"
+    with (
+        zipfile.ZipFile(sample_wheel, "r") as zf_in,
+        zipfile.ZipFile(rebuilt_wheel, "w") as zf_out,
+    ):
+        for item in zf_in.infolist():
+            data = zf_in.read(item.filename)
+            if item.filename.endswith("/METADATA"):
+                data += b"Requires-Dist: evil\n"
+            zf_out.writestr(item, data)
+
+    checker = ReproducibilityChecker(normalize=True)
+    report = checker.compare_wheels(sample_wheel, rebuilt_wheel)
+
+    assert report.is_reproducible is False
+    assert report.normalized_match is False
+
+
+def test_compare_wheels_invalid_archive(tmp_path, sample_wheel):
+    """Test comparing against a file that is not a ZIP archive."""
+    broken = tmp_path / "broken.whl"
+    broken.write_bytes(b"not a zip")
+
+    checker = ReproducibilityChecker()
+    report = checker.compare_wheels(sample_wheel, broken)
+
+    assert report.is_reproducible is False
+    assert report.normalized_match is False
+    assert report.differences[0].startswith("Error analyzing")
+
+
 def test_save_digests(wheelhouse_dir):
     """Test saving wheel digests."""
     checker = ReproducibilityChecker()
@@ -145,6 +285,25 @@ def test_verify_against_digests(wheelhouse_dir):
         assert report.is_reproducible is True
 
 
+def test_verify_against_digests_skips_unknown_wheels(wheelhouse_dir, sample_wheel):
+    """Test wheels missing from the digest file are not hashed."""
+    import json
+    import shutil
+
+    checker = ReproducibilityChecker()
+    digests_file = wheelhouse_dir / "digests.json"
+    checker.save_digests(wheelhouse_dir, digests_file)
+    shutil.copy(sample_wheel, wheelhouse_dir / "extra-2.0.0-py3-none-any.whl")
+
+    with patch.object(
+        checker, "compute_wheel_digest", wraps=checker.compute_wheel_digest
+    ) as spy:
+        reports = checker.verify_against_digests(wheelhouse_dir, digests_file)
+
+    assert set(reports) == set(json.loads(digests_file.read_text()))
+    assert spy.call_count == len(reports)
+
+
 def test_verify_wheelhouse(wheelhouse_dir):
     """Test verifying entire wheelhouse."""
     checker = ReproducibilityChecker()
@@ -192,3 +351,145 @@ def test_normalized_patterns():
 
     assert "*.pyc" in checker.NORMALIZED_PATTERNS
     assert "RECORD" in checker.NORMALIZED_PATTERNS
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("pkg-1.0.dist-info/RECORD", True),
+        ("pkg-1.0.dist-info/RECORD.jws", False),
+        ("RECORD", True),
+        ("pkg-1.0.data/sig-RECORD", True),
+        ("pkg-1.0.dist-info/WHEEL", False),
+        ("pkg-1.0.dist-info/METADATA", False),
+        ("pkg/__pycache__/mod.cpython-311.pyc", False),
+        ("pkg/mod.py", False),
+    ],
+)
+def test_is_record(name, expected):
+    """Test only RECORD files are excluded from normalized comparison."""
+    checker = ReproducibilityChecker()
+
+    assert checker._is_record(name) is expected
+
+
+def test_extract_metadata_reads_headers_only(tmp_path):
+    """Test METADATA parsing stops at the end of the header block."""
+    wheel_path = tmp_path / "demo_pkg-2.0.0-1-py3-none-any.whl"
+    with zipfile.ZipFile(wheel_path, "w") as zf:
+        zf.writestr("other-0.1.dist-info/METADATA", "Name: wrong\n")
+        zf.writestr(
+            "demo_pkg-2.0.0.dist-info/METADATA",
+            "Metadata-Version: 2.1\nName: demo-pkg\nVersion: 2.0.0\n\n"
+            "Name: from-description\n",
+        )
+
+    checker = ReproducibilityChecker()
+    metadata = checker._extract_wheel_metadata(wheel_path)
+
+    assert metadata == {"name": "demo-pkg", "version": "2.0.0"}
+
+
+def test_blake3_digests_round_trip(wheelhouse_dir):
+    """Test BLAKE3 digests are recorded with their algorithm and verified."""
+    pytest.importorskip("blake3")
+    import json
+
+    checker = ReproducibilityChecker(hash_algo="blake3")
+    digests_file = wheelhouse_dir / "digests.json"
+    checker.save_digests(wheelhouse_dir, digests_file)
+
+    data = json.loads(digests_file.read_text())
+    assert all(entry["algorithm"] == "blake3" for entry in data.values())
+
+    reports = checker.verify_against_digests(wheelhouse_dir, digests_file)
+    assert reports and all(r.is_reproducible for r in reports.values())
+
+    # A SHA-256 checker must not compare against BLAKE3 digests
+    assert (
+        ReproducibilityChecker().verify_against_digests(wheelhouse_dir, digests_file)
+        == {}
+    )
+
+
+def test_unsupported_hash_algo():
+    """Test unknown digest algorithms are rejected."""
+    with pytest.raises(ValueError):
+        ReproducibilityChecker(hash_algo="md5")  # type: ignore[arg-type]
+
+
+def test_save_digests_incremental(wheelhouse_dir):
+    """Test incremental runs only hash wheels whose stat changed."""
+    import json
+
+    checker = ReproducibilityChecker()
+    output_file = wheelhouse_dir / "digests.json"
+    checker.save_digests(wheelhouse_dir, output_file)
+    first = json.loads(output_file.read_text())
+
+    with patch.object(
+        checker, "compute_wheel_digest", wraps=checker.compute_wheel_digest
+    ) as spy:
+        checker.save_digests(wheelhouse_dir, output_file, incremental=True)
+        assert spy.call_count == 0
+        assert json.loads(output_file.read_text()) == first
+
+        wheel = next(wheelhouse_dir.glob("*.whl"))
+        st = wheel.stat()
+        os.utime(wheel, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        checker.save_digests(wheelhouse_dir, output_file, incremental=True)
+        assert spy.call_count == 1
+
+
+def test_analyze_differences_reports_missing_entries(tmp_path):
+    """Test entries present on only one side are listed in sorted order."""
+    wheel1 = tmp_path / "one.whl"
+    wheel2 = tmp_path / "two.whl"
+    with zipfile.ZipFile(wheel1, "w") as zf:
+        for name in ("c.py", "a.py", "shared.py"):
+            zf.writestr(name, name)
+    with zipfile.ZipFile(wheel2, "w") as zf:
+        for name in ("shared.py", "d.py", "b.py"):
+            zf.writestr(name, name)
+
+    checker = ReproducibilityChecker()
+    with zipfile.ZipFile(wheel1) as zf1, zipfile.ZipFile(wheel2) as zf2:
+        differences = checker._analyze_differences(zf1, zf2)
+
+    assert differences == [
+        "Files only in original: a.py, c.py",
+        "Files only in rebuilt: b.py, d.py",
+    ]
+
+
+def test_compare_wheels_identical_copies_hash_once(tmp_path, sample_wheel):
+    """Test byte-identical copies are detected without a second hash."""
+    import shutil
+
+    copy = tmp_path / "copy" / sample_wheel.name
+    copy.parent.mkdir()
+    shutil.copy(sample_wheel, copy)
+
+    checker = ReproducibilityChecker()
+    with patch.object(
+        checker, "compute_wheel_digest", wraps=checker.compute_wheel_digest
+    ) as spy:
+        report = checker.compare_wheels(sample_wheel, copy)
+
+    assert report.is_reproducible is True
+    assert report.original_digest == report.rebuilt_digest
+    assert spy.call_count == 1
+
+
+def test_files_identical(tmp_path):
+    """Test the byte-for-byte file comparison helper."""
+    a = tmp_path / "a"
+    b = tmp_path / "b"
+    c = tmp_path / "c"
+    a.write_bytes(b"x" * 4096)
+    b.write_bytes(b"x" * 4096)
+    c.write_bytes(b"x" * 4095 + b"y")
+
+    assert _files_identical(a, b) is True
+    assert _files_identical(a, c) is False
+    assert _files_identical(a, tmp_path / "missing") is False
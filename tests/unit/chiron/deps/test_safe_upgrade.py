@@ -0,0 +1,281 @@
+"""Tests for safe upgrade execution."""
+
+import hashlib
+import os
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from chiron.deps.safe_upgrade import (
+    SafeUpgradeExecutor,
+    UpgradeResult,
+    _hash_lock_file,
+    _restore_file,
+    _run_captured_tail,
+    _snapshot_file,
+)
+
+
+@pytest.fixture
+def project_root(tmp_path: Path) -> Path:
+    """Create a project with a lock file."""
+    (tmp_path / "poetry.lock").write_text("# lock\n")
+    return tmp_path
+
+
+@patch("chiron.deps.safe_upgrade._run_captured_tail", return_value=(0, b""))
+def test_upgrade_batch_single_invocation_per_kind(mock_run, project_root):
+    """Pinned and floating packages each share one Poetry invocation."""
+
+    executor = SafeUpgradeExecutor(project_root)
+    results = executor._upgrade_batch([("a", "1.0"), ("b", ""), ("c", "3.0")])
+
+    commands = [call.args[0] for call in mock_run.call_args_list]
+    assert commands == [
+        ["poetry", "add", "--no-ansi", "a@1.0", "c@3.0"],
+        ["poetry", "update", "--no-ansi", "b"],
+    ]
+    assert mock_run.call_args.kwargs["env"]["POETRY_NO_INTERACTION"] == "1"
+    assert [r.package for r in results] == ["a", "c", "b"]
+    assert all(r.success for r in results)
+
+
+@patch("chiron.deps.safe_upgrade._run_captured_tail")
+def test_upgrade_batch_attributes_failure(mock_run, project_root):
+    """Resolver failures are attributed to the packages they name."""
+    mock_run.return_value = (
+        1,
+        b"Unable to find compatible versions for typing_extensions\n",
+    )
+
+    executor = SafeUpgradeExecutor(project_root)
+    results = executor._upgrade_batch(
+        [("typing-extensions", "9.9"), ("typing", "1.0"), ("b", "")]
+    )
+
+    assert mock_run.call_count == 1
+    by_name = {r.package: r for r in results}
+    assert set(by_name) == {"typing-extensions", "typing"}
+    assert "Unable to find" in by_name["typing-extensions"].error_message
+    assert by_name["typing"].error_message.startswith("Not applied")
+    assert not any(r.success for r in results)
+
+
+@patch("chiron.deps.safe_upgrade._run_captured_tail", return_value=(0, b""))
+def test_execute_upgrades_success(mock_run, project_root):
+    """A clean run reports every package as upgraded."""
+
+    executor = SafeUpgradeExecutor(project_root, max_batch_size=2)
+    with patch.object(
+        executor, "_health_check_commands", return_value=[[sys.executable, "-c", ""]]
+    ):
+        report = executor.execute_upgrades([("a", "2.0.0"), ("b", "2.0.0")])
+
+    assert report.final_status == "success"
+    assert report.summary["successful"] == 2
+    assert [u.package for u in report.upgrades] == ["a", "b"]
+    assert all(isinstance(u, UpgradeResult) for u in report.upgrades)
+
+
+def test_run_health_checks(project_root):
+    """Any failing or unlaunchable check marks the batch unhealthy."""
+    executor = SafeUpgradeExecutor(project_root)
+    ok = [sys.executable, "-c", ""]
+    bad = [sys.executable, "-c", "raise SystemExit(2)"]
+
+    with patch.object(executor, "_health_check_commands", return_value=[ok, ok]):
+        assert executor._run_health_checks() is True
+    with patch.object(executor, "_health_check_commands", return_value=[ok, bad]):
+        assert executor._run_health_checks() is False
+    with patch.object(
+        executor, "_health_check_commands", return_value=[["definitely-missing-cmd"]]
+    ):
+        assert executor._run_health_checks() is False
+
+
+def test_get_package_version_reads_lock_once(project_root):
+    """Locked versions are parsed from poetry.lock and cached until invalidated."""
+    (project_root / "poetry.lock").write_text(
+        '[[package]]\nname = "typing-extensions"\nversion = "4.8.0"\n\n'
+        '[[package]]\nname = "requests"\nversion = "2.31.0"\n'
+    )
+    executor = SafeUpgradeExecutor(project_root)
+
+    with patch("chiron.deps.safe_upgrade._run_captured_tail") as mock_run:
+        assert executor._get_package_version("Typing_Extensions") == "4.8.0"
+        assert executor._get_package_version("requests") == "2.31.0"
+        assert executor._get_package_version("missing") is None
+        mock_run.assert_not_called()
+
+    (project_root / "poetry.lock").write_text(
+        '[[package]]\nname = "requests"\nversion = "2.32.0"\n'
+    )
+    assert executor._get_package_version("requests") == "2.31.0"
+    executor._version_cache = None
+    assert executor._get_package_version("requests") == "2.32.0"
+
+
+def test_snapshot_file_is_independent_copy(tmp_path):
+    """Snapshots keep their content when the source is rewritten in place."""
+    src = tmp_path / "poetry.lock"
+    dst = tmp_path / "poetry.lock.bak"
+    src.write_text("original\n")
+
+    _snapshot_file(src, dst)
+    with src.open("w") as handle:
+        handle.write("rewritten\n")
+
+    assert dst.read_text() == "original\n"
+
+
+def test_checkpoint_reuses_backup_when_lock_unchanged(project_root):
+    """An unchanged lock file does not produce a second backup."""
+    executor = SafeUpgradeExecutor(project_root)
+
+    first = executor._create_checkpoint([])
+    second = executor._create_checkpoint(["a"])
+
+    assert first.lock_file_backup is not None
+    assert second.lock_file_backup is first.lock_file_backup
+
+    (project_root / "poetry.lock").write_text("# changed\n")
+    with patch("chiron.deps.safe_upgrade.datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime(2030, 1, 2, 3, 4, 5, tzinfo=UTC)
+        third = executor._create_checkpoint(["b"])
+        (project_root / "poetry.lock").write_text("# changed again\n")
+        fourth = executor._create_checkpoint(["c"])
+
+    assert third.lock_file_backup is not first.lock_file_backup
+    assert third.lock_file_backup.lock_hash != first.lock_file_backup.lock_hash
+    assert third.lock_file_backup.target.name == "poetry.lock.20300102_030405.1"
+    assert fourth.lock_file_backup.target.name == "poetry.lock.20300102_030405.2"
+
+
+def test_checkpoint_backup_is_lazy(project_root):
+    """Backups are only written when materialized, and only while current."""
+    executor = SafeUpgradeExecutor(project_root)
+    checkpoint = executor._create_checkpoint([])
+    backup = checkpoint.lock_file_backup
+
+    assert list(executor.backup_dir.iterdir()) == []
+    assert checkpoint.to_dict()["lock_file_backup"] is None
+
+    executor._materialize_backups([checkpoint])
+    assert backup.realized_path is not None
+    assert backup.realized_path.read_text() == "# lock\n"
+    assert checkpoint.to_dict()["lock_file_backup"] == str(backup.realized_path)
+
+    (project_root / "poetry.lock").write_text("# changed\n")
+    stale = executor._create_checkpoint(["a"]).lock_file_backup
+    (project_root / "poetry.lock").write_text("# changed again\n")
+    assert stale.materialize() is None
+
+
+def test_hash_lock_file_matches_blake2b(tmp_path):
+    """The mmap-based digest equals hashing the bytes directly."""
+    lock = tmp_path / "poetry.lock"
+    for content in (b"", b"# lock\n" * 10000):
+        lock.write_bytes(content)
+        expected = hashlib.blake2b(content, digest_size=16).digest()
+        assert _hash_lock_file(lock) == expected
+
+
+def test_restore_file_replaces_atomically(tmp_path):
+    """Restores overwrite the target and leave no temporary file behind."""
+    backup = tmp_path / "poetry.lock.bak"
+    target = tmp_path / "poetry.lock"
+    backup.write_text("restored\n")
+    target.write_text("broken\n")
+
+    _restore_file(backup, target)
+
+    assert target.read_text() == "restored\n"
+    assert backup.read_text() == "restored\n"
+    assert not (tmp_path / "poetry.lock.tmp").exists()
+
+
+@patch("chiron.deps.safe_upgrade._run_captured_tail", return_value=(0, b""))
+def test_rollback_resyncs_when_lock_matches(mock_run, project_root):
+    """Rollback resyncs the venv even when the lock file is unchanged."""
+    executor = SafeUpgradeExecutor(project_root)
+    checkpoint = executor._create_checkpoint([])
+
+    assert executor._rollback_to_checkpoint(checkpoint) is True
+    cmd = mock_run.call_args.args[0]
+    assert cmd[:3] == ["poetry", "install", "--sync"]
+
+
+def test_run_captured_tail_keeps_only_tail(tmp_path):
+    """Only the last ``tail`` bytes of stderr are retained."""
+    script = (
+        "import sys; sys.stdout.write('o' * 100000); "
+        "sys.stderr.write('e' * 100000 + 'END'); sys.exit(3)"
+    )
+    returncode, stderr = _run_captured_tail(
+        [sys.executable, "-c", script], cwd=tmp_path, timeout=30, tail=16
+    )
+
+    assert returncode == 3
+    assert len(stderr) == 16
+    assert stderr.endswith(b"END")
+
+
+def test_run_captured_tail_timeout(tmp_path):
+    """Commands exceeding the timeout are killed."""
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_captured_tail(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            cwd=tmp_path,
+            timeout=0.2,
+        )
+
+
+def test_rollback_targets_last_good_checkpoint(project_root):
+    """A failing batch rolls back only to the previous successful batch."""
+    executor = SafeUpgradeExecutor(
+        project_root, max_batch_size=1, enable_health_checks=False
+    )
+    outcomes = iter([(0, b""), (1, b"Unable to find compatible versions for b")])
+
+    def fake_run(cmd, **kwargs):
+        returncode, stderr = next(outcomes)
+        if returncode == 0:
+            (project_root / "poetry.lock").write_text("# after a\n")
+        return returncode, stderr
+
+    with (
+        patch("chiron.deps.safe_upgrade._run_captured_tail", side_effect=fake_run),
+        patch.object(
+            executor, "_rollback_to_checkpoint", return_value=True
+        ) as mock_rollback,
+    ):
+        report = executor.execute_upgrades([("a", "1.0"), ("b", "2.0")])
+
+    assert report.rollback_performed is True
+    target = mock_rollback.call_args.args[0]
+    assert target is report.checkpoints[1]
+    assert target.packages_upgraded == ["a"]
+
+
+def test_backups_pruned_beyond_limit(project_root, tmp_path):
+    """Old backups are evicted oldest-first, keeping this run's backups."""
+    backup_dir = tmp_path / "backups"
+    backup_dir.mkdir()
+    for i in range(5):
+        old = backup_dir / f"poetry.lock.2020010{i}_000000.0"
+        old.write_text("old\n")
+        os.utime(old, ns=(i * 10**9, i * 10**9))
+
+    executor = SafeUpgradeExecutor(project_root, backup_dir=backup_dir, max_backups=3)
+    checkpoint = executor._create_checkpoint([])
+    executor._materialize_backups([checkpoint])
+
+    remaining = sorted(p.name for p in backup_dir.iterdir())
+    assert len(remaining) == 3
+    assert checkpoint.lock_file_backup.realized_path.name in remaining
+    assert "poetry.lock.20200100_000000.0" not in remaining
+    assert "poetry.lock.20200104_000000.0" in remaining
@@ -1,16 +1,19 @@
 """Tests for security overlay management."""
 
 import json
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from packaging.version import Version
 
 from chiron.deps.security_overlay import (
     CVERecord,
     SecurityConstraint,
     SecurityOverlayManager,
     Severity,
+    _cvss_severity,
 )
 
 
@@ -84,6 +87,23 @@ def test_severity_from_string():
     assert Severity.from_string("invalid") == Severity.UNKNOWN
 
 
+@pytest.mark.parametrize(
+    ("score", "expected"),
+    [
+        ("9.8", Severity.CRITICAL),
+        ("9.0", Severity.CRITICAL),
+        ("7.0", Severity.HIGH),
+        ("5.5", Severity.MEDIUM),
+        ("1.0", Severity.LOW),
+        ("CVSS:3.1/AV:N", Severity.UNKNOWN),
+    ],
+)
+def test_cvss_severity(score, expected):
+    """CVSS v3 scores map onto severity bands."""
+    vuln = {"database_specific": {"severity": [{"type": "CVSS_V3", "score": score}]}}
+    assert _cvss_severity(vuln) == expected
+
+
 def test_cve_record_dataclass():
     """Test CVERecord dataclass."""
     cve = CVERecord(
@@ -115,6 +135,22 @@ def test_security_constraint_dataclass():
     assert "CVE-2023-1234" in constraint.cve_ids
 
 
+def test_security_constraint_bounds_follow_updates():
+    """Parsed bounds are cached and refreshed when the strings change."""
+    constraint = SecurityConstraint(
+        package="requests", min_version="2.31.0", max_version="<3.0"
+    )
+
+    assert constraint.min_bound() == Version("2.31.0")
+    assert constraint.max_bound() is constraint.max_bound()
+    assert constraint.max_bound() == Version("3.0")
+
+    constraint.min_version = "2.32.1"
+    constraint.max_version = None
+    assert constraint.min_bound() == Version("2.32.1")
+    assert constraint.max_bound() is None
+
+
 def test_overlay_manager_init(tmp_path):
     """Test SecurityOverlayManager initialization."""
     overlay_file = tmp_path / "overlay.json"
@@ -140,6 +176,65 @@ def test_import_osv_scan(tmp_path, osv_scan_data):
     assert "requests" in manager.constraints
 
 
+def test_import_osv_scan_without_ijson(tmp_path, osv_scan_data):
+    """The json fallback imports the same records as the streaming parser."""
+    osv_file = tmp_path / "osv-scan.json"
+    osv_file.write_text(json.dumps(osv_scan_data))
+
+    manager = SecurityOverlayManager(overlay_file=tmp_path / "overlay.json")
+    with patch("chiron.deps.security_overlay.ijson", None):
+        count = manager.import_osv_scan(osv_file)
+
+    assert count == 1
+    assert manager.cve_database["CVE-2023-1234"].severity == Severity.CRITICAL
+    assert manager.constraints["requests"].min_version == "2.31.0"
+
+
+def test_import_osv_scan_preserves_report_order(tmp_path, osv_scan_data):
+    """CVEs are imported in report order, numbering those without an id."""
+    result = osv_scan_data["results"][0]
+    results = []
+    for index in range(5):
+        entry = json.loads(json.dumps(result))
+        vuln = entry["packages"][0]["vulnerabilities"][0]
+        vuln["id"] = f"CVE-2023-{index}"
+        if index == 3:
+            del vuln["id"]
+        results.append(entry)
+    osv_file = tmp_path / "osv-scan.json"
+    osv_file.write_text(json.dumps({"results": results}))
+
+    manager = SecurityOverlayManager(overlay_file=tmp_path / "overlay.json")
+    count = manager.import_osv_scan(osv_file)
+
+    assert count == 5
+    assert list(manager.cve_database) == [
+        "CVE-2023-0",
+        "CVE-2023-1",
+        "CVE-2023-2",
+        "UNKNOWN-3",
+        "CVE-2023-4",
+    ]
+    assert manager.constraints["requests"].cve_ids == list(manager.cve_database)
+
+
+def test_import_osv_scan_uses_first_fixed_version(tmp_path, osv_scan_data):
+    """All range events are recorded and the first fixed event wins."""
+    vuln = osv_scan_data["results"][0]["packages"][0]["vulnerabilities"][0]
+    vuln["affected"].append(
+        {"ranges": [{"events": [{"introduced": "3.0.0"}, {"fixed": "3.1.0"}]}]}
+    )
+    osv_file = tmp_path / "osv-scan.json"
+    osv_file.write_text(json.dumps(osv_scan_data))
+
+    manager = SecurityOverlayManager(overlay_file=tmp_path / "overlay.json")
+    manager.import_osv_scan(osv_file)
+
+    record = manager.cve_database["CVE-2023-1234"]
+    assert record.affected_versions == [">=2.0.0", "<2.31.0", ">=3.0.0", "<3.1.0"]
+    assert record.fixed_version == "2.31.0"
+
+
 def test_save_and_load_overlay(tmp_path, osv_scan_data):
     """Test saving and loading overlay."""
     osv_file = tmp_path / "osv-scan.json"
@@ -161,6 +256,67 @@ def test_save_and_load_overlay(tmp_path, osv_scan_data):
     assert len(manager2.cve_database) == len(manager1.cve_database)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_overlay_writes_atomically(tmp_path, use_orjson):
+    """Overlays round-trip with or without orjson and leave no temp files."""
+    overlay_file = tmp_path / "overlay.json"
+    manager = SecurityOverlayManager(overlay_file=overlay_file)
+    manager._create_constraint_for_cve(
+        CVERecord(
+            cve_id="CVE-2023-1234",
+            package="requests",
+            affected_versions=["<2.31.0"],
+            fixed_version="2.31.0",
+            severity=Severity.HIGH,
+        )
+    )
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+        manager.save_overlay()
+    else:
+        with patch("chiron.deps.security_overlay.orjson", None):
+            manager.save_overlay()
+
+    data = json.loads(overlay_file.read_text())
+    assert data["constraints"]["requests"]["min_version"] == "2.31.0"
+    assert [p.name for p in tmp_path.iterdir()] == ["overlay.json"]
+
+
+def test_save_overlay_removes_temp_file_on_failure(tmp_path):
+    """A failed save leaves neither a partial overlay nor a temp file behind."""
+    manager = SecurityOverlayManager(overlay_file=tmp_path / "overlay.json")
+
+    with (
+        patch("chiron.deps.security_overlay.os.replace", side_effect=RuntimeError),
+        pytest.raises(RuntimeError),
+    ):
+        manager.save_overlay()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_overlay_is_cached_until_file_changes(overlay_file, tmp_path):
+    """Unchanged overlays are parsed once; managers never share mutable state."""
+    SecurityOverlayManager(overlay_file=overlay_file)
+    with (
+        patch("chiron.deps.security_overlay.json.load", side_effect=AssertionError),
+        patch("chiron.deps.security_overlay.orjson") as mock_orjson,
+    ):
+        mock_orjson.loads.side_effect = AssertionError
+        cached = SecurityOverlayManager(overlay_file=overlay_file)
+    assert "requests" in cached.constraints
+
+    manager1 = SecurityOverlayManager(overlay_file=overlay_file)
+    manager1.constraints["requests"].cve_ids.append("CVE-2099-0001")
+    manager2 = SecurityOverlayManager(overlay_file=overlay_file)
+    assert manager2.constraints["requests"].cve_ids == ["CVE-2023-1234"]
+
+    manager1.save_overlay()
+    manager3 = SecurityOverlayManager(overlay_file=overlay_file)
+    assert "CVE-2099-0001" in manager3.constraints["requests"].cve_ids
+
+
 def test_generate_constraints_file(overlay_file, tmp_path):
     """Test generating pip constraints file."""
     manager = SecurityOverlayManager(overlay_file=overlay_file)
@@ -173,6 +329,8 @@ def test_generate_constraints_file(overlay_file, tmp_path):
     content = output_file.read_text()
     assert "requests" in content
     assert ">=" in content
+    generated = content.splitlines()[1].removeprefix("# Generated: ")
+    assert datetime.fromisoformat(generated).utcoffset() == timedelta(0)
 
 
 def test_check_package_version_safe(overlay_file):
@@ -195,6 +353,21 @@ def test_check_package_version_unsafe(overlay_file):
     assert len(violations) > 0
 
 
+def test_check_package_version_reports_cves_once_after_reimport(
+    tmp_path, osv_scan_data
+):
+    """Test re-importing a CVE replaces its indexed record."""
+    osv_file = tmp_path / "osv-scan.json"
+    osv_file.write_text(json.dumps(osv_scan_data))
+    manager = SecurityOverlayManager(overlay_file=tmp_path / "overlay.json")
+    manager.import_osv_scan(osv_file)
+    manager.import_osv_scan(osv_file)
+
+    _, violations = manager.check_package_version("requests", "2.20.0")
+
+    assert violations[1:] == ["  Affected by CVE-2023-1234 (critical)"]
+
+
 def test_check_package_version_no_constraint(overlay_file):
     """Test checking package with no constraint."""
     manager = SecurityOverlayManager(overlay_file=overlay_file)
@@ -222,6 +395,9 @@ def test_compare_versions():
     assert manager._compare_versions("1.0.0", "2.0.0") < 0
     assert manager._compare_versions("2.0.0", "1.0.0") > 0
     assert manager._compare_versions("1.0.0", "1.0.0") == 0
+    assert manager._compare_versions("1.0", "1.0.0") == 0
+    assert manager._compare_versions("2.0.0rc1", "2.0.0") < 0
+    assert manager._compare_versions("1.10.0", "1.9.0") > 0
 
 
 def test_extract_major_version():
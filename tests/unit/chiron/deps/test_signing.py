@@ -0,0 +1,203 @@
+"""Tests for artifact signing."""
+
+import hashlib
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from chiron.deps.signing import CosignSigner, WheelhouseVerifier, _run_cosign
+
+IDENTITY_TOKEN = "tok"  # noqa: S105 - dummy token for tests
+
+
+@pytest.fixture
+def artifacts(tmp_path):
+    """Create a few artifacts to sign."""
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"pkg{index}-1.0-py3-none-any.whl"
+        path.write_bytes(b"wheel %d" % index)
+        paths.append(path)
+    return paths
+
+
+@patch("chiron.deps.signing._run_cosign", return_value=(0, ""))
+@patch("chiron.deps.signing.shutil.which", return_value="/usr/bin/cosign")
+def test_sign_blobs_preserves_order(mock_which, mock_run, artifacts, tmp_path):
+    """Test batch signing returns one result per artifact in input order."""
+    output_dir = tmp_path / "sigs"
+    output_dir.mkdir()
+
+    results = CosignSigner(identity_token=IDENTITY_TOKEN).sign_blobs(
+        artifacts, output_dir
+    )
+
+    assert [r.success for r in results] == [True] * len(artifacts)
+    assert [r.signature_path for r in results] == [
+        output_dir / f"{path.name}.sig" for path in artifacts
+    ]
+    assert mock_run.call_count == len(artifacts)
+    for call in mock_run.call_args_list:
+        assert IDENTITY_TOKEN not in call.args[0]
+        assert call.kwargs["env"]["SIGSTORE_ID_TOKEN"] == IDENTITY_TOKEN
+
+
+@patch("chiron.deps.signing._run_cosign", return_value=(0, ""))
+@patch("chiron.deps.signing.shutil.which", return_value="/usr/bin/cosign")
+def test_sign_blobs_without_token_runs_sequentially(mock_which, mock_run, artifacts):
+    """Test interactive signing never opens several OIDC flows at once."""
+    signer = CosignSigner(use_sigstore=False)
+
+    with patch("chiron.deps.signing.concurrent.futures.ThreadPoolExecutor") as pool:
+        results = signer.sign_blobs(artifacts)
+
+    pool.assert_not_called()
+    assert [r.success for r in results] == [True] * len(artifacts)
+    assert [call.args[0][-1] for call in mock_run.call_args_list] == [
+        str(path) for path in artifacts
+    ]
+
+
+@patch("chiron.deps.signing._run_cosign", return_value=(0, ""))
+@patch("chiron.deps.signing.shutil.which", return_value="/usr/bin/cosign")
+def test_sign_blobs_reports_missing_artifact(mock_which, mock_run, artifacts):
+    """Test a missing artifact fails alone without aborting the batch."""
+    missing = Path(artifacts[0].parent / "missing.whl")
+
+    results = CosignSigner().sign_blobs([artifacts[0], missing, artifacts[1]])
+
+    assert [r.success for r in results] == [True, False, True]
+    assert "missing.whl" in results[1].error_message
+
+
+@pytest.fixture
+def fake_sigstore():
+    """Install a fake in-process sigstore library."""
+    signer = Mock()
+    signer.sign_artifact.side_effect = lambda hashed: Mock(
+        to_json=Mock(return_value=f'{{"digest": "{hashed.digest.hex()}"}}')
+    )
+    context = Mock()
+    context.signer.return_value.__enter__ = Mock(return_value=signer)
+    context.signer.return_value.__exit__ = Mock(return_value=False)
+    sign_module = Mock()
+    sign_module.SigningContext.from_trust_config.return_value = context
+    verify_module = Mock()
+    hashes_module = Mock()
+    hashes_module.Hashed.side_effect = lambda algorithm, digest: Mock(
+        algorithm=algorithm, digest=digest
+    )
+
+    with (
+        patch("chiron.deps.signing.HAS_SIGSTORE", True),
+        patch("chiron.deps.signing.sigstore_sign", sign_module, create=True),
+        patch("chiron.deps.signing.sigstore_verify", verify_module, create=True),
+        patch("chiron.deps.signing.sigstore_hashes", hashes_module, create=True),
+        patch("chiron.deps.signing.sigstore_models", Mock(), create=True),
+        patch("chiron.deps.signing.sigstore_oidc", Mock(), create=True),
+    ):
+        yield context, signer, verify_module
+
+
+@patch("chiron.deps.signing._run_cosign", return_value=(0, ""))
+def test_sign_blobs_in_process_shares_signer(mock_run, fake_sigstore, artifacts):
+    """Test in-process signing reuses one signer and signs file digests."""
+    context, signer, _ = fake_sigstore
+
+    results = CosignSigner(identity_token=IDENTITY_TOKEN).sign_blobs(artifacts)
+
+    assert all(r.success for r in results)
+    assert context.signer.call_count == 1
+    assert signer.sign_artifact.call_count == len(artifacts)
+    assert results[0].signature_path.name.endswith(".whl.sigstore.json")
+    expected = hashlib.sha256(artifacts[0].read_bytes()).hexdigest()
+    assert expected in results[0].signature_path.read_text()
+    mock_run.assert_not_called()
+
+
+@patch("chiron.deps.signing._run_cosign", return_value=(0, ""))
+@patch("chiron.deps.signing.shutil.which", return_value="/usr/bin/cosign")
+def test_sign_blob_without_identity_writes_sig(
+    mock_which, mock_run, fake_sigstore, artifacts
+):
+    """Test the cosign fallback writes a raw ``.sig``, not a bundle name."""
+    with patch("chiron.deps.signing.sigstore_oidc") as oidc:
+        oidc.detect_credential.return_value = None
+        result = CosignSigner().sign_blob(artifacts[0])
+
+    assert result.success
+    assert result.signature_path.name == f"{artifacts[0].name}.sig"
+    assert mock_run.call_count == 1
+
+
+@patch("chiron.deps.signing._run_cosign", return_value=(0, ""))
+def test_verify_bundle_in_process(mock_run, fake_sigstore, artifacts):
+    """Test Sigstore bundles are verified in-process against an identity."""
+    _, _, verify_module = fake_sigstore
+    bundle = artifacts[0].with_name(artifacts[0].name + ".sigstore.json")
+    bundle.write_text("{}")
+    signer = CosignSigner()
+
+    assert not signer.verify_blob(artifacts[0], bundle)
+    assert signer.verify_blob(
+        artifacts[0],
+        bundle,
+        certificate_identity="ci@example.com",
+        certificate_oidc_issuer="https://issuer.example.com",
+    )
+    verifier = verify_module.Verifier.production.return_value
+    assert verifier.verify_artifact.call_count == 1
+    mock_run.assert_not_called()
+
+
+@patch("chiron.deps.signing._run_cosign", return_value=(0, ""))
+@patch("chiron.deps.signing.shutil.which", return_value="/usr/bin/cosign")
+def test_cosign_lookup_is_cached(mock_which, mock_run, artifacts):
+    """Test cosign is located once per signer, not once per call."""
+    signer = CosignSigner(use_sigstore=False)
+
+    signer.sign_blobs(artifacts)
+    signer.verify_blob(artifacts[0], signer.default_signature_path(artifacts[0]))
+
+    assert mock_which.call_count == 1
+
+
+def test_run_cosign_keeps_stderr_tail():
+    """Test only the tail of a verbose stderr stream is retained."""
+    script = "import sys; sys.stderr.write('x' * 100000 + 'END'); sys.exit(3)"
+
+    returncode, stderr = _run_cosign(
+        [sys.executable, "-c", script], stdout=subprocess.DEVNULL, env=None, tail=64
+    )
+
+    assert returncode == 3
+    assert len(stderr) == 64
+    assert stderr.endswith("xEND")
+
+
+@patch("chiron.deps.signing._run_cosign", return_value=(0, ""))
+@patch("chiron.deps.signing.shutil.which", return_value="/usr/bin/cosign")
+def test_wheelhouse_verifier_verify_many(mock_which, mock_run, artifacts):
+    """Test batch verification keeps order and reports each pair."""
+    pairs = []
+    for index, artifact in enumerate(artifacts):
+        signature = artifact.with_name(artifact.name + ".sig")
+        if index != 2:
+            signature.write_text("sig")
+        pairs.append((artifact, signature))
+
+    with patch("chiron.deps.signing.HAS_SIGSTORE", False):
+        verifier = WheelhouseVerifier(
+            certificate_identity="ci@example.com",
+            certificate_oidc_issuer="https://issuer.example.com",
+        )
+    results = verifier.verify_many(pairs)
+
+    assert results == [True, True, False, True]
+    assert mock_which.call_count == 1
+    assert mock_run.call_count == len(artifacts) - 1
+    cmd = mock_run.call_args.args[0]
+    assert cmd[cmd.index("--certificate-identity") + 1] == "ci@example.com"
@@ -0,0 +1,342 @@
+"""Tests for SBOM generation and OSV scanning."""
+
+import json
+import os
+import subprocess
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from chiron.deps.supply_chain import (
+    OSVScanner,
+    SBOMGenerator,
+    VulnerabilitySummary,
+    _merge_summaries,
+    _resolve_tool,
+    _severity_bucket,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_cache():
+    """Forget tool locations so each test sees its own patched PATH lookup."""
+    _resolve_tool.cache_clear()
+    yield
+    _resolve_tool.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def osv_cache_dir(tmp_path, monkeypatch):
+    """Keep cached OSV reports inside the test's temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    return tmp_path / "xdg" / "chiron" / "osv"
+
+
+@pytest.fixture
+def osv_report():
+    """Create a sample osv-scanner JSON report."""
+    return {
+        "results": [
+            {
+                "packages": [
+                    {
+                        "package": {"name": "requests"},
+                        "vulnerabilities": [
+                            {"id": "GHSA-1", "severity": "HIGH"},
+                            {
+                                "id": "GHSA-2",
+                                "database_specific": {"severity": "MODERATE"},
+                            },
+                        ],
+                    },
+                    {
+                        "package": {"name": "aiohttp"},
+                        "vulnerabilities": [{"id": "GHSA-3", "severity": "CRITICAL"}],
+                    },
+                ]
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def lockfile(tmp_path):
+    """Create a lockfile to scan."""
+    path = tmp_path / "poetry.lock"
+    path.write_text("# lock\n")
+    return path
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@patch("chiron.deps.supply_chain.subprocess.run")
+@patch("chiron.deps.supply_chain.shutil.which", return_value="/usr/bin/osv-scanner")
+def test_scan_lockfile_parses_and_saves_report(
+    mock_which, mock_run, use_orjson, osv_report, lockfile, tmp_path
+):
+    """Test the report is summarized and saved with either JSON backend."""
+    mock_run.return_value = Mock(returncode=1, stdout=json.dumps(osv_report).encode())
+    output_path = tmp_path / "osv.json"
+
+    if use_orjson:
+        summary = OSVScanner(tmp_path).scan_lockfile(lockfile, output_path)
+    else:
+        with patch("chiron.deps.supply_chain.orjson", None):
+            summary = OSVScanner(tmp_path).scan_lockfile(lockfile, output_path)
+
+    assert summary is not None
+    assert summary.total_vulnerabilities == 3
+    assert (summary.critical, summary.high, summary.medium, summary.low) == (1, 1, 1, 0)
+    assert summary.packages_affected == ["aiohttp", "requests"]
+    assert json.loads(output_path.read_text()) == osv_report
+
+
+@pytest.mark.parametrize("report", [True, False])
+def test_scan_lockfile_streams_report_without_output(
+    report, osv_report, lockfile, tmp_path
+):
+    """Test the report is summarized straight from the scanner's stdout."""
+    report_path = tmp_path / "report.json"
+    report_path.write_text(json.dumps(osv_report) if report else "")
+    scanner_path = tmp_path / "osv-scanner"
+    scanner_path.write_text(f"#!/bin/sh\ncat '{report_path}'\nexit 1\n")
+    scanner_path.chmod(0o755)
+
+    with (
+        patch("chiron.deps.supply_chain.shutil.which", return_value=str(scanner_path)),
+        patch("chiron.deps.supply_chain.subprocess.run") as mock_run,
+    ):
+        summary = OSVScanner(tmp_path).scan_lockfile(lockfile)
+
+    mock_run.assert_not_called()
+    assert summary is not None
+    assert summary.total_vulnerabilities == (3 if report else 0)
+    assert summary.packages_affected == (["aiohttp", "requests"] if report else [])
+
+
+@pytest.mark.parametrize(
+    ("severity", "expected"),
+    [
+        ("CRITICAL", "critical"),
+        ("Moderate", "medium"),
+        ("HIGH (CVSS 7.5)", "high"),
+        ([{"type": "CVSS_V3", "score": "low"}], "low"),
+        ("unknown", None),
+    ],
+)
+def test_severity_bucket(severity, expected):
+    """Test exact labels, free-form text and non-string severities."""
+    assert _severity_bucket(severity) == expected
+
+
+@patch("chiron.deps.supply_chain.subprocess.run")
+@patch("chiron.deps.supply_chain.shutil.which", return_value="/usr/bin/osv-scanner")
+def test_scanner_lookup_is_cached(mock_which, mock_run, lockfile, tmp_path):
+    """Test osv-scanner is located once across repeated scans."""
+    mock_run.return_value = Mock(returncode=0, stdout=b"")
+    scanner = OSVScanner(tmp_path)
+
+    for _ in range(3):
+        scanner.scan_lockfile(lockfile, tmp_path / "osv.json")
+
+    mock_which.assert_called_once_with("osv-scanner")
+
+
+@patch("chiron.deps.supply_chain.subprocess.run")
+@patch("chiron.deps.supply_chain.shutil.which", return_value="/usr/bin/cyclonedx-py")
+def test_sbom_generate_discards_stdout(mock_which, mock_run, tmp_path, caplog):
+    """Test SBOM stdout is discarded and stderr is decoded only on failure."""
+    mock_run.return_value = Mock(returncode=1, stderr=b"bad \xff input")
+
+    assert not SBOMGenerator(tmp_path).generate(tmp_path / "sbom.json")
+
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["stdout"] is subprocess.DEVNULL
+    assert kwargs["stderr"] is subprocess.PIPE
+    assert "text" not in kwargs
+    assert "bad \ufffd input" in caplog.text
+
+
+def test_summary_counts_unrated_vulnerabilities_in_total(tmp_path):
+    """Test vulnerabilities without a known severity still count in the total."""
+    summary = OSVScanner(tmp_path)._parse_results(
+        {
+            "results": [
+                {
+                    "packages": [
+                        {
+                            "package": {"name": "pkg"},
+                            "vulnerabilities": [{"id": "A"}, {"severity": "LOW"}],
+                        }
+                    ]
+                }
+            ]
+        }
+    )
+
+    assert summary.total_vulnerabilities == 2
+    assert (summary.critical, summary.high, summary.medium, summary.low) == (0, 0, 0, 1)
+
+
+def test_scan_lockfiles_runs_concurrently(tmp_path):
+    """Test lockfiles are scanned in parallel and keyed by path."""
+    lockfiles = [tmp_path / f"poetry{index}.lock" for index in range(3)]
+    barrier = threading.Barrier(len(lockfiles), timeout=5)
+
+    def fake_scan(lockfile_path, output_path=None):
+        barrier.wait()  # times out unless all scans run at once
+        if lockfile_path == lockfiles[1]:
+            return None
+        return VulnerabilitySummary(
+            total_vulnerabilities=1, high=1, packages_affected=[lockfile_path.stem]
+        )
+
+    scanner = OSVScanner(tmp_path)
+    with patch.object(scanner, "scan_lockfile", side_effect=fake_scan):
+        results = scanner.scan_lockfiles(lockfiles, max_parallel=3)
+
+    assert list(results) == lockfiles
+    assert results[lockfiles[1]] is None
+    assert results[lockfiles[0]].packages_affected == ["poetry0"]
+
+
+def test_merge_summaries():
+    """Test counts are summed and affected packages unioned."""
+    merged = _merge_summaries(
+        [
+            VulnerabilitySummary(
+                total_vulnerabilities=2,
+                critical=1,
+                low=1,
+                packages_affected=["a", "b"],
+                scan_timestamp="2024-01-01T00:00:00+00:00",
+            ),
+            VulnerabilitySummary(
+                total_vulnerabilities=1,
+                medium=1,
+                packages_affected=["b", "c"],
+                scan_timestamp="2024-01-02T00:00:00+00:00",
+            ),
+        ]
+    )
+
+    assert merged.total_vulnerabilities == 3
+    assert (merged.critical, merged.high, merged.medium, merged.low) == (1, 0, 1, 1)
+    assert merged.packages_affected == ["a", "b", "c"]
+    assert merged.scan_timestamp == "2024-01-02T00:00:00+00:00"
+
+
+@patch("chiron.deps.supply_chain.subprocess.run")
+@patch("chiron.deps.supply_chain.shutil.which", return_value="/usr/bin/osv-scanner")
+def test_scan_lockfile_reuses_cached_report(
+    mock_which, mock_run, osv_report, lockfile, tmp_path, osv_cache_dir
+):
+    """Test an unchanged lockfile is served from the cache until the TTL."""
+    mock_run.return_value = Mock(returncode=1, stdout=json.dumps(osv_report).encode())
+    scanner = OSVScanner(tmp_path, use_cache=True)
+
+    first = scanner.scan_lockfile(lockfile, tmp_path / "first.json")
+    second = scanner.scan_lockfile(lockfile, tmp_path / "second.json")
+
+    assert mock_run.call_count == 1
+    assert first.total_vulnerabilities == second.total_vulnerabilities == 3
+    assert json.loads((tmp_path / "second.json").read_text()) == osv_report
+    assert [p.suffix for p in osv_cache_dir.iterdir()] == [".json"]
+    assert osv_cache_dir.stat().st_mode & 0o777 == 0o700
+
+    # Expired entries, changed lockfiles and disabled caches all rescan
+    (cached,) = osv_cache_dir.iterdir()
+    stale = time.time() - 2 * 86400
+    os.utime(cached, (stale, stale))
+    scanner.scan_lockfile(lockfile, tmp_path / "third.json")
+    lockfile.write_text("# changed\n")
+    scanner.scan_lockfile(lockfile, tmp_path / "fourth.json")
+    OSVScanner(tmp_path).scan_lockfile(lockfile, tmp_path / "fifth.json")
+    OSVScanner(tmp_path).scan_lockfile(lockfile, tmp_path / "sixth.json")
+
+    assert mock_run.call_count == 5
+
+
+@patch("chiron.deps.supply_chain.subprocess.run")
+@patch("chiron.deps.supply_chain.shutil.which", return_value="/usr/bin/osv-scanner")
+def test_scan_lockfile_ignores_shared_cache_dir(
+    mock_which, mock_run, osv_report, lockfile, tmp_path
+):
+    """Test a cache directory others can write to is neither read nor written."""
+    mock_run.return_value = Mock(returncode=1, stdout=json.dumps(osv_report).encode())
+    cache_dir = tmp_path / "shared"
+    cache_dir.mkdir()
+    cache_dir.chmod(0o777)
+    scanner = OSVScanner(tmp_path, use_cache=True, cache_dir=cache_dir)
+
+    scanner.scan_lockfile(lockfile, tmp_path / "first.json")
+    scanner.scan_lockfile(lockfile, tmp_path / "second.json")
+
+    assert mock_run.call_count == 2
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_scan_lockfile_streaming_populates_cache(
+    osv_report, lockfile, tmp_path, osv_cache_dir
+):
+    """Test a streamed report is cached whole, including trailing keys."""
+    osv_report["experimental_config"] = {"licenses": {"summary": False}}
+    report_path = tmp_path / "report.json"
+    report_path.write_text(json.dumps(osv_report))
+    scanner_path = tmp_path / "osv-scanner"
+    scanner_path.write_text(f"#!/bin/sh\ncat '{report_path}'\nexit 1\n")
+    scanner_path.chmod(0o755)
+
+    with patch("chiron.deps.supply_chain.shutil.which", return_value=str(scanner_path)):
+        summary = OSVScanner(tmp_path, use_cache=True).scan_lockfile(lockfile)
+
+    assert summary.total_vulnerabilities == 3
+    (cached,) = osv_cache_dir.iterdir()
+    assert json.loads(cached.read_text()) == osv_report
+
+
+@patch("chiron.deps.supply_chain.subprocess.run")
+@patch("chiron.deps.supply_chain.shutil.which", return_value="/usr/bin/osv-scanner")
+def test_scan_lockfile_uses_minimal_env(
+    mock_which, mock_run, lockfile, tmp_path, monkeypatch
+):
+    """Test osv-scanner gets only the variables it needs."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy:3128")
+    monkeypatch.setenv("CI_JOB_TOKEN", "secret")
+    mock_run.return_value = Mock(returncode=0, stdout=b"")
+
+    OSVScanner(tmp_path).scan_lockfile(lockfile, tmp_path / "osv.json")
+
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["close_fds"] is False
+    assert kwargs["env"]["PATH"] == os.environ["PATH"]
+    assert kwargs["env"]["HTTPS_PROXY"] == "http://proxy:3128"
+    assert "CI_JOB_TOKEN" not in kwargs["env"]
+
+
+@pytest.mark.parametrize(
+    ("counts", "max_severity", "expected"),
+    [
+        ({"critical": 1}, "high", True),
+        ({"high": 1}, "high", True),
+        ({"medium": 2}, "high", False),
+        ({"medium": 2}, "medium", True),
+        ({"low": 1}, "low", True),
+        ({"high": 1}, "critical", False),
+        ({}, "low", False),
+    ],
+)
+def test_has_blocking_vulnerabilities(counts, max_severity, expected):
+    """Test findings at or above the gate severity block."""
+    summary = VulnerabilitySummary(**counts)
+
+    assert summary.has_blocking_vulnerabilities(max_severity) is expected
+
+
+def test_has_blocking_vulnerabilities_reads_current_counts():
+    """Test counts changed after construction are honoured by the gate."""
+    summary = VulnerabilitySummary()
+    summary.critical = 2
+
+    assert summary.has_blocking_vulnerabilities("high")
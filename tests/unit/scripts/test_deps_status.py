@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
@@ -10,6 +12,7 @@ from typing import Any, cast
 
 import pytest
 
+from chiron.deps import status as status_module
 from prometheus import cli as prometheus_cli
 from scripts import deps_status
 
@@ -30,18 +33,15 @@ class _DummyPlanResult:
         }
 
 
-def _stub_guard(summary_payload: dict[str, Any]) -> Callable[[list[str]], int]:
-    def _run(argv: list[str]) -> int:
-        options: dict[str, str] = {}
-        iterator = iter(argv)
-        for flag in iterator:
-            options[flag] = next(iterator)
-        Path(options["--output"]).write_text(
-            json.dumps(summary_payload),
-            encoding="utf-8",
-        )
-        Path(options["--markdown"]).write_text("Guard markdown", encoding="utf-8")
-        return 0
+def _stub_guard(
+    summary_payload: dict[str, Any],
+) -> Callable[..., tuple[int, dict[str, Any], str | None]]:
+    def _run(
+        argv: list[str], *, render_markdown: bool = True
+    ) -> tuple[int, dict[str, Any], str | None]:
+        assert "--output" not in argv
+        assert "--markdown" not in argv
+        return 0, summary_payload, "Guard markdown" if render_markdown else None
 
     return _run
 
@@ -61,7 +61,9 @@ def test_generate_status_combines_guard_and_planner(
         "drift": {"severity": "none"},
     }
 
-    monkeypatch.setattr(deps_status.upgrade_guard, "main", _stub_guard(summary_payload))
+    monkeypatch.setattr(
+        deps_status.upgrade_guard, "assess", _stub_guard(summary_payload)
+    )
 
     captured_config: dict[str, Any] = {}
 
@@ -113,6 +115,73 @@ def test_generate_status_combines_guard_and_planner(
     assert config.packages == frozenset({"fastapi"})
 
 
+def test_generate_status_runs_guard_and_planner_concurrently(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    # Both stages must reach the barrier before either can finish
+    barrier = threading.Barrier(2, timeout=5)
+    guard = _stub_guard({"summary": {"highest_severity": "safe"}})
+
+    def _guard(
+        argv: list[str], *, render_markdown: bool = True
+    ) -> tuple[int, dict[str, Any], str | None]:
+        barrier.wait()
+        return guard(argv, render_markdown=render_markdown)
+
+    def _generate_plan(config: object) -> _DummyPlanResult:
+        barrier.wait()
+        return _DummyPlanResult()
+
+    monkeypatch.setattr(deps_status.upgrade_guard, "assess", _guard)
+    monkeypatch.setattr(deps_status.upgrade_planner, "generate_plan", _generate_plan)
+
+    sbom_path = tmp_path / "sbom.json"
+    sbom_path.write_text("{}", encoding="utf-8")
+
+    status = deps_status.generate_status(
+        preflight=None,
+        renovate=None,
+        cve=None,
+        contract=tmp_path / "contract.toml",
+        sbom=sbom_path,
+        metadata=None,
+        sbom_max_age_days=None,
+        fail_threshold="needs-review",
+        planner_settings=deps_status.PlannerSettings(project_root=tmp_path),
+    )
+
+    assert status.guard.markdown == "Guard markdown"
+    assert status.summary["planner_exit_code"] == 0
+    assert status.summary["recommended_commands"] == ["poetry update fastapi"]
+
+
+def test_observability_bootstraps_once_under_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+    start = threading.Barrier(4, timeout=5)
+
+    def _slow_configure_tracing(*_: Any, **__: Any) -> None:
+        calls.append("tracing")
+        time.sleep(0.05)
+
+    monkeypatch.setattr(status_module, "_OBSERVABILITY_BOOTSTRAPPED", False)
+    monkeypatch.setattr(status_module, "configure_tracing", _slow_configure_tracing)
+    monkeypatch.setattr(status_module, "configure_metrics", lambda **_: None)
+
+    def _bootstrap() -> None:
+        start.wait()
+        status_module._ensure_observability()
+
+    threads = [threading.Thread(target=_bootstrap) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["tracing"]
+
+
 def test_generate_status_handles_disabled_planner(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -128,7 +197,9 @@ def test_generate_status_handles_disabled_planner(
         "drift": {"severity": "low"},
     }
 
-    monkeypatch.setattr(deps_status.upgrade_guard, "main", _stub_guard(summary_payload))
+    monkeypatch.setattr(
+        deps_status.upgrade_guard, "assess", _stub_guard(summary_payload)
+    )
 
     def _unexpected_generate_plan(
         *_: Any, **__: Any
@@ -238,3 +309,50 @@ def test_cli_status_exports_json(
     assert kwargs["planner_settings"].enabled is True
     assert kwargs["planner_settings"].skip_resolver is True
     assert kwargs["planner_settings"].packages is None
+
+
+def test_build_planner_config_normalises_inputs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sbom_path = tmp_path / "sbom.json"
+    settings = deps_status.PlannerSettings(packages=[" fastapi ", ""])
+
+    config = status_module._build_planner_config(
+        sbom=sbom_path, metadata=None, settings=settings
+    )
+    assert config.packages == frozenset({"fastapi"})
+    assert config.project_root == Path.cwd()
+
+    # The default project root follows the working directory
+    monkeypatch.chdir(tmp_path)
+    moved = status_module._build_planner_config(
+        sbom=sbom_path, metadata=None, settings=settings
+    )
+    assert moved.project_root == tmp_path
+
+
+def test_generate_status_can_skip_guard_markdown(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    summary_payload = {"summary": {"highest_severity": "safe", "notes": []}}
+    monkeypatch.setattr(
+        deps_status.upgrade_guard, "assess", _stub_guard(summary_payload)
+    )
+    contract_path = tmp_path / "contract.toml"
+    contract_path.write_text("[contract]\nstatus='active'\n", encoding="utf-8")
+
+    status = deps_status.generate_status(
+        preflight=None,
+        renovate=None,
+        cve=None,
+        contract=contract_path,
+        sbom=None,
+        metadata=None,
+        sbom_max_age_days=None,
+        fail_threshold="needs-review",
+        planner_settings=deps_status.PlannerSettings(enabled=False),
+        include_markdown=False,
+    )
+
+    assert status.guard.markdown is None
+    assert status.guard.assessment == summary_payload
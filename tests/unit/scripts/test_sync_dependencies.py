@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import dataclasses
 import importlib.util
 import json
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
+from chiron.deps import sync as sync_module
+
 REPO_ROOT = Path(__file__).resolve().parents[3]
 SYNC_DEP_PATH = REPO_ROOT / "scripts" / "sync-dependencies.py"
 _SPEC = importlib.util.spec_from_file_location(
@@ -103,3 +109,132 @@ def test_cyclonedx_sbom_includes_package_metadata(tmp_path: Path) -> None:
     assert component["name"] == "requests"
     assert component["version"] == "2.32.5"
     assert any(prop["name"] == "constraint" for prop in component["properties"])
+
+
+def test_constraint_satisfied_reuses_parsed_specifiers() -> None:
+    sync_module._cached_specifier.cache_clear()
+    sync_module._cached_version.cache_clear()
+    records = [
+        sync_module.PackageRecord(
+            name=f"pkg{index}",
+            profile="runtime",
+            constraint=">=1.0,<2.0",
+            locked=locked,
+        )
+        for index, locked in enumerate(["1.5", "2.1", "1.5"])
+    ]
+
+    assert [record.constraint_satisfied() for record in records] == [True, False, True]
+    assert sync_module._cached_specifier.cache_info().misses == 1
+    assert sync_module._cached_version.cache_info().misses == 2
+
+
+def test_package_requirement_is_cached_per_variant() -> None:
+    record = sync_module.PackageRecord(
+        name="fastapi",
+        profile="runtime",
+        constraint=">=0.110",
+        locked="0.111.0",
+        extras=("standard", "all"),
+    )
+
+    locked = record.requirement_without_marker()
+    unlocked = record.requirement_without_marker(prefer_locked=False)
+
+    assert locked == "fastapi[all,standard]==0.111.0"
+    assert unlocked == "fastapi[all,standard]>=0.110"
+    assert record.requirement_without_marker() is locked
+    assert record.requirement_without_marker(prefer_locked=False) is unlocked
+
+
+def test_package_record_is_frozen_and_hashable() -> None:
+    record = sync_module.PackageRecord(name="numpy", profile="runtime", locked="2.0")
+    record.requirement()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        record.locked = "2.1"  # type: ignore[misc]
+    assert not hasattr(record, "__dict__")
+    assert record == sync_module.PackageRecord(
+        name="numpy", profile="runtime", locked="2.0"
+    )
+    assert (
+        len({record, sync_module.PackageRecord("numpy", "runtime", locked="2.0")}) == 1
+    )
+
+
+def test_load_contract_reparses_only_when_modified(tmp_path: Path) -> None:
+    contract_path = tmp_path / "dependency-profile.toml"
+    contract_path.write_text('[profiles.runtime]\ncondition = "a"\n')
+
+    first = sync_module._load_contract(contract_path)
+    assert sync_module._load_contract(contract_path) is first
+
+    contract_path.write_text('[profiles.runtime]\ncondition = "b"\n')
+    stat = contract_path.stat()
+    os.utime(contract_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = sync_module._load_contract(contract_path)
+    assert second is not first
+    assert second == {"profiles": {"runtime": {"condition": "b"}}}
+
+
+def test_manifest_builders_share_one_dedupe_pass(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[int] = []
+    dedupe = sync_module._dedupe_by_name
+
+    def _counting_dedupe(packages):
+        calls.append(1)
+        return dedupe(packages)
+
+    monkeypatch.setattr(sync_module, "_dedupe_by_name", _counting_dedupe)
+    contract = sync_module.DependencyContract(
+        {
+            "profiles": {
+                "runtime": {
+                    "packages": [
+                        {"name": "Zope", "locked": "5.0"},
+                        {"name": "attrs", "locked": "23.1"},
+                        {"name": "attrs", "constraint": ">=23"},
+                        {"name": "black", "constraint": ">=24"},
+                    ]
+                }
+            }
+        },
+        tmp_path / "contract.toml",
+    )
+
+    bundle = contract.to_manifests()
+
+    assert len(calls) == 1
+    assert bundle.constraints_lines[2:] == ["attrs==23.1", "Zope==5.0"]
+    assert bundle.dist_lines[2:] == ["attrs==23.1", "black>=24", "Zope==5.0"]
+    assert bundle.wheelhouse_lines[2:] == bundle.constraints_lines[2:]
+
+
+def test_pyproject_dev_group_sorted_case_insensitively(tmp_path: Path) -> None:
+    contract = sync_module.DependencyContract(
+        {
+            "profiles": {
+                "runtime": {"packages": [{"name": "requests", "locked": "2.32.5"}]},
+                "dev_tooling": {
+                    "packages": [
+                        {"name": "ruff", "constraint": ">=0.5"},
+                        {"name": "Mypy", "locked": "1.10.0"},
+                        {"name": "pytest", "constraint": ">=8"},
+                        {"name": "ruff", "locked": "0.6.0"},
+                    ]
+                },
+            }
+        },
+        tmp_path / "contract.toml",
+    )
+
+    block = contract.to_manifests().pyproject
+
+    assert list(block.dev_group.items()) == [
+        ("Mypy", "Mypy==1.10.0"),
+        ("pytest", "pytest>=8"),
+        ("ruff", "ruff==0.6.0"),
+    ]
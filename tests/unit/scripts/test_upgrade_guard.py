@@ -121,6 +121,32 @@ def test_upgrade_guard_outputs_assessment(
     assert "pydantic" in stdout
 
 
+def test_upgrade_guard_assess_returns_results_in_process(tmp_path: Path) -> None:
+    preflight_path = _write_json(
+        tmp_path / "preflight-blocked.json",
+        {
+            "packages": [
+                {
+                    "name": "pydantic",
+                    "version": "2.7.0",
+                    "status": "error",
+                    "missing_targets": ["linux-x86_64"],
+                }
+            ]
+        },
+    )
+    argv = ["--preflight", str(preflight_path), "--skip-snapshots"]
+
+    exit_code, assessment, markdown = upgrade_guard.assess(argv)
+    _, _, no_markdown = upgrade_guard.assess(argv, render_markdown=False)
+
+    assert exit_code == 2
+    assert assessment["summary"]["highest_severity"] == upgrade_guard.RISK_BLOCKED
+    assert markdown is not None and "pydantic" in markdown
+    assert no_markdown is None
+    assert not list(tmp_path.glob("*.md"))
+
+
 def test_upgrade_guard_contract_staleness_escalates_risk(tmp_path: Path) -> None:
     preflight_path = _write_json(
         tmp_path / "preflight-ok.json",